@@ -3,21 +3,72 @@
 from __future__ import annotations
 
 import argparse
+import contextlib
 import csv
+import functools
+import hashlib
+import io
+import json
+import os
 import re
+import subprocess
 import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
+from typing import Any, BinaryIO, Iterator, NamedTuple, Optional, TextIO
+
+from skill_catalog import load_catalog
 
 
 ROOT = Path(__file__).resolve().parents[2]
-CANONICAL_ROOTS = [
-    ROOT / "bootstrap",
-    ROOT / "common",
-    ROOT / "human",
-    ROOT / "knowledge",
-    ROOT / "productivity",
-]
+
+# Bump when lint rules change in a way the source hash below would not capture
+# (e.g. a helper module they depend on).
+LINT_CACHE_VERSION = 2
+
+# Rule ids reported with every finding (JSON/SARIF output), with a one-line summary.
+RULES: dict[str, str] = {
+    "no-skills": "No canonical skills were found.",
+    "skill-frontmatter": "SKILL.md must start with a '---' frontmatter block.",
+    "skill-name": "Frontmatter must set name:.",
+    "skill-name-prefix": "Skill names must start with 'uv-'.",
+    "skill-description": "Frontmatter must set description:.",
+    "skill-duplicate-name": "Skill names must be unique.",
+    "skill-slug": "Skill names must slugify to a non-empty slug.",
+    "skill-slug-collision": "Skill names must slugify to distinct slugs.",
+    "eval-coverage": "Every skill should have curated eval cases (prompts.csv).",
+    "csv-read": "prompts.csv must be readable UTF-8 CSV.",
+    "csv-columns": "prompts.csv must have id, should_trigger and prompt columns.",
+    "csv-id": "Every row needs a unique, non-empty id.",
+    "csv-should-trigger": "should_trigger must be true or false.",
+    "csv-prompt": "Every row needs a prompt.",
+    "csv-sandbox": "sandbox must be read-only or workspace-write.",
+    "csv-integer": "Numeric columns must be integers.",
+    "csv-output-schema": "output_schema must point at an existing file.",
+    "csv-fixture": "fixture must point at an existing path.",
+    "csv-regex": "must_include/must_not_include must be valid regexes.",
+    "csv-rows": "prompts.csv needs rows, including positive and negative cases.",
+}
+
+
+@dataclass(frozen=True)
+class Finding:
+    level: str  # "error" or "warning"
+    rule: str
+    message: str
+    path: Optional[str] = None  # repo-relative (POSIX) when under ROOT
+    line: Optional[int] = None
+
+    def text(self) -> str:
+        return f"{self.path}: {self.message}" if self.path else self.message
+
+
+class CsvError(NamedTuple):
+    rule: str
+    line: Optional[int]
+    message: str
 
 
 @dataclass(frozen=True)
@@ -44,129 +95,403 @@ def _skill_slug(name: str) -> str:
     return slug
 
 
-def _read_frontmatter(skill_md: Path) -> dict[str, str]:
-    lines = skill_md.read_text(encoding="utf-8", errors="replace").splitlines()
-    if not lines or lines[0].strip() != "---":
-        raise ValueError("SKILL.md missing frontmatter (expected leading '---').")
-    out: dict[str, str] = {}
-    for line in lines[1:250]:
-        if line.strip() == "---":
-            break
-        if ":" not in line:
-            continue
-        key, value = line.split(":", 1)
-        key = key.strip()
-        value = value.strip().strip("'\"")
-        if key and value and key not in out:
-            out[key] = value
-    return out
-
+def _load_skills(timings: Optional["_Timings"] = None) -> tuple[list[Skill], list[Finding]]:
+    timings = timings or _Timings()
+    with timings.phase("discovery"):
+        catalog = load_catalog(ROOT)
+    # The catalog parses SKILL.md files while it walks the tree; split that back out.
+    parsed = sum(catalog.parse_times.values())
+    timings.phases["discovery"] -= parsed
+    timings.phases["frontmatter"] = timings.phases.get("frontmatter", 0.0) + parsed
+    timings.items.update((f"{path}/SKILL.md", t) for path, t in catalog.parse_times.items())
 
-def _iter_skill_mds() -> list[Path]:
-    out: list[Path] = []
-    for root in CANONICAL_ROOTS:
-        if not root.exists():
+    skills: list[Skill] = []
+    findings: list[Finding] = []
+    for entry in catalog:
+        skill_md = entry.skill_md(ROOT)
+        if not entry.has_frontmatter:
+            findings.append(
+                Finding("error", "skill-frontmatter", "SKILL.md missing frontmatter (expected leading '---')", _rel_path(skill_md), 1)
+            )
             continue
-        out.extend(p for p in root.rglob("SKILL.md") if p.name == "SKILL.md")
-    return sorted(set(out))
+        skills.append(Skill(name=entry.name, description=entry.description, skill_md=skill_md))
+    return skills, findings
 
 
-def _load_skills() -> list[Skill]:
-    skills: list[Skill] = []
-    for skill_md in _iter_skill_mds():
-        fm = _read_frontmatter(skill_md)
-        name = fm.get("name", "").strip()
-        description = fm.get("description", "").strip()
-        skills.append(Skill(name=name, description=description, skill_md=skill_md))
-    return skills
+_SANDBOX_MODES = {"read-only", "workspace-write"}
+_INT_COLUMNS = ("max_commands", "max_input_tokens", "max_output_tokens", "max_total_tokens")
+_REGEX_COLUMNS = ("must_include", "must_not_include")
 
 
-def _lint_prompts_csv(prompts_csv: Path) -> list[str]:
-    errors: list[str] = []
+@functools.lru_cache(maxsize=8192)
+def _regex_error(pattern: str) -> Optional[str]:
     try:
-        with prompts_csv.open("r", encoding="utf-8", newline="") as f:
-            reader = csv.DictReader(f)
-            expected_cols = {"id", "should_trigger", "prompt"}
-            missing = expected_cols - set(reader.fieldnames or [])
-            if missing:
-                errors.append(f"missing columns: {sorted(missing)}")
-            rows = list(reader)
+        re.compile(pattern)
+    except re.error as e:
+        return str(e)
+    return None
+
+
+def _iter_prompts_csv_errors(f: TextIO, prompts_csv: Path, deps: dict[str, bool]) -> Iterator[CsvError]:
+    """
+    Validate prompts.csv rows read from `f`, yielding each error as it is found.
+
+    Rows are streamed, so memory does not grow with the row count beyond the set of
+    seen ids. Regex compiles are memoized and each distinct `output_schema`/`fixture`
+    value is resolved and checked once; `deps` maps every checked path to whether it
+    existed. Messages name the CSV row; `line` is the row's first physical line.
+    """
+    checked: dict[tuple[str, str], bool] = {}
+
+    def _exists(column: str, value: str) -> bool:
+        key = (column, value)
+        if key not in checked:
+            base = ROOT if column == "output_schema" else prompts_csv.parent
+            path = str((base / value).resolve())
+            if path not in deps:
+                deps[path] = os.path.exists(path)
+            checked[key] = deps[path]
+        return checked[key]
+
+    reader = csv.DictReader(f)
+    try:
+        fieldnames = reader.fieldnames
     except Exception as e:
-        return [f"failed to read CSV: {e}"]
-
-    if not rows:
-        errors.append("no rows")
-        return errors
+        yield CsvError("csv-read", reader.line_num or 1, f"failed to read CSV: {e}")
+        return
+    missing = {"id", "should_trigger", "prompt"} - set(fieldnames or [])
+    if missing:
+        yield CsvError("csv-columns", 1, f"missing columns: {sorted(missing)}")
 
     seen_ids: set[str] = set()
     saw_true = False
     saw_false = False
-    for i, row in enumerate(rows, start=2):
-        rid = (row.get("id") or "").strip()
-        st = (row.get("should_trigger") or "").strip().lower()
-        prompt = (row.get("prompt") or "").strip()
-        if not rid:
-            errors.append(f"row {i}: missing id")
-        elif rid in seen_ids:
-            errors.append(f"row {i}: duplicate id {rid!r}")
-        else:
-            seen_ids.add(rid)
-        if st not in {"true", "false"}:
-            errors.append(f"row {i}: should_trigger must be true/false (got {st!r})")
-        if not prompt:
-            errors.append(f"row {i}: missing prompt")
-        saw_true = saw_true or (st == "true")
-        saw_false = saw_false or (st == "false")
-
-        # Optional columns (best-effort validation)
-        sandbox = (row.get("sandbox") or "").strip()
-        if sandbox and sandbox not in {"read-only", "workspace-write"}:
-            errors.append(f"row {i}: sandbox must be read-only/workspace-write (got {sandbox!r})")
-
-        timeout_s = (row.get("timeout_s") or "").strip()
-        if timeout_s and not timeout_s.isdigit():
-            errors.append(f"row {i}: timeout_s must be integer seconds (got {timeout_s!r})")
-
-        max_commands = (row.get("max_commands") or "").strip()
-        if max_commands and not max_commands.isdigit():
-            errors.append(f"row {i}: max_commands must be integer (got {max_commands!r})")
-
-        for col in ["max_input_tokens", "max_output_tokens", "max_total_tokens"]:
-            raw = (row.get(col) or "").strip()
-            if raw and not raw.isdigit():
-                errors.append(f"row {i}: {col} must be integer (got {raw!r})")
-
-        output_schema = (row.get("output_schema") or "").strip()
-        if output_schema:
-            schema_path = (ROOT / output_schema).resolve()
-            if not schema_path.exists():
-                errors.append(f"row {i}: output_schema missing: {output_schema!r}")
-
-        fixture = (row.get("fixture") or "").strip()
-        if fixture:
-            fixture_path = (prompts_csv.parent / fixture).resolve()
-            if not fixture_path.exists():
-                errors.append(f"row {i}: fixture missing: {fixture!r}")
-
-        # Regex fields should compile (if present)
-        import re
-
-        for col in ["must_include", "must_not_include"]:
-            raw = (row.get(col) or "").strip()
-            if not raw:
-                continue
-            parts = [p.strip() for p in raw.split("|") if p.strip()]
-            for pat in parts:
-                try:
-                    re.compile(pat)
-                except re.error as e:
-                    errors.append(f"row {i}: invalid regex in {col}: {pat!r} ({e})")
+    rows = 0
+    i = 1
+    row: dict[str, Any] = {}
+
+    def err(rule: str, message: str) -> CsvError:
+        # Only computed for failing rows: quoted newlines make a row span several lines.
+        spans = sum(v.count("\n") for v in row.values() if isinstance(v, str))
+        return CsvError(rule, reader.line_num - spans, f"row {i}: {message}")
 
+    try:
+        for i, row in enumerate(reader, start=2):
+            rows += 1
+            rid = (row.get("id") or "").strip()
+            st = (row.get("should_trigger") or "").strip().lower()
+            prompt = (row.get("prompt") or "").strip()
+            if not rid:
+                yield err("csv-id", "missing id")
+            elif rid in seen_ids:
+                yield err("csv-id", f"duplicate id {rid!r}")
+            else:
+                seen_ids.add(rid)
+            if st not in {"true", "false"}:
+                yield err("csv-should-trigger", f"should_trigger must be true/false (got {st!r})")
+            if not prompt:
+                yield err("csv-prompt", "missing prompt")
+            saw_true = saw_true or (st == "true")
+            saw_false = saw_false or (st == "false")
+
+            # Optional columns (best-effort validation)
+            sandbox = (row.get("sandbox") or "").strip()
+            if sandbox and sandbox not in _SANDBOX_MODES:
+                yield err("csv-sandbox", f"sandbox must be read-only/workspace-write (got {sandbox!r})")
+
+            timeout_s = (row.get("timeout_s") or "").strip()
+            if timeout_s and not timeout_s.isdigit():
+                yield err("csv-integer", f"timeout_s must be integer seconds (got {timeout_s!r})")
+
+            for col in _INT_COLUMNS:
+                raw = (row.get(col) or "").strip()
+                if raw and not raw.isdigit():
+                    yield err("csv-integer", f"{col} must be integer (got {raw!r})")
+
+            output_schema = (row.get("output_schema") or "").strip()
+            if output_schema and not _exists("output_schema", output_schema):
+                yield err("csv-output-schema", f"output_schema missing: {output_schema!r}")
+
+            fixture = (row.get("fixture") or "").strip()
+            if fixture and not _exists("fixture", fixture):
+                yield err("csv-fixture", f"fixture missing: {fixture!r}")
+
+            # Regex fields should compile (if present)
+            for col in _REGEX_COLUMNS:
+                raw = (row.get(col) or "").strip()
+                if not raw:
+                    continue
+                for pat in raw.split("|"):
+                    pat = pat.strip()
+                    if pat:
+                        error = _regex_error(pat)
+                        if error is not None:
+                            yield err("csv-regex", f"invalid regex in {col}: {pat!r} ({error})")
+    except Exception as e:
+        yield CsvError("csv-read", reader.line_num + 1, f"failed to read CSV: {e}")
+        return
+
+    if not rows:
+        yield CsvError("csv-rows", 1, "no rows")
+        return
     if not saw_true:
-        errors.append("no should_trigger=true rows (need at least one positive case)")
+        yield CsvError("csv-rows", 1, "no should_trigger=true rows (need at least one positive case)")
     if not saw_false:
-        errors.append("no should_trigger=false rows (need at least one negative control)")
-    return errors
+        yield CsvError("csv-rows", 1, "no should_trigger=false rows (need at least one negative control)")
+
+
+class _HashingReader(io.RawIOBase):
+    """Raw stream wrapper that hashes every byte read through it."""
+
+    def __init__(self, raw: BinaryIO) -> None:
+        self.raw = raw
+        self.sha = hashlib.sha256()
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, b: Any) -> int:
+        n = self.raw.readinto(b)  # type: ignore[attr-defined]
+        if n:
+            self.sha.update(memoryview(b)[:n])
+        return n or 0
+
+
+def _sha256_file(path: Path) -> str:
+    h = hashlib.sha256()
+    with path.open("rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def _lint_prompts_csv_job(path: str) -> tuple[str, list[CsvError], dict[str, bool]]:
+    # Process-pool entry point: hash and lint in one streaming pass over the file.
+    deps: dict[str, bool] = {}
+    try:
+        with open(path, "rb", buffering=0) as raw:
+            hashing = _HashingReader(raw)
+            text = io.TextIOWrapper(io.BufferedReader(hashing), encoding="utf-8", newline="")
+            errors = list(_iter_prompts_csv_errors(text, Path(path), deps))
+            # Finish the digest if validation stopped before EOF (e.g. a decode error).
+            while hashing.read(1024 * 1024):
+                pass
+    except OSError as e:
+        return "", [CsvError("csv-read", None, f"failed to read CSV: {e}")], {}
+    return hashing.sha.hexdigest(), errors, deps
+
+
+def _timed_lint_prompts_csv_job(path: str) -> tuple[float, tuple[str, list[CsvError], dict[str, bool]]]:
+    start = time.perf_counter()
+    result = _lint_prompts_csv_job(path)
+    return time.perf_counter() - start, result
+
+
+def default_cache_path() -> Path:
+    return ROOT / "artifacts" / "lint-cache.json"
+
+
+def _linter_version() -> str:
+    digest = hashlib.sha256(Path(__file__).read_bytes()).hexdigest()[:16]
+    return f"{LINT_CACHE_VERSION}:{digest}"
+
+
+class _LintCache:
+    """
+    Lint results keyed by repo-relative path, valid while the file's sha256, the
+    linter version and the existence of every referenced path are unchanged.
+    """
+
+    def __init__(self, path: Optional[Path]) -> None:
+        self.path = path
+        self.version = _linter_version()
+        self.entries: dict[str, dict[str, Any]] = {}
+        self.hits = 0
+        self.dirty = False
+        if path is None:
+            return
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        if isinstance(data, dict) and data.get("version") == self.version:
+            self.entries = data.get("entries") or {}
+
+    def get(self, key: str, sha256: str) -> Optional[list[CsvError]]:
+        entry = self.entries.get(key)
+        if not entry or entry.get("sha256") != sha256:
+            return None
+        if any(Path(p).exists() != existed for p, existed in (entry.get("deps") or {}).items()):
+            return None
+        self.hits += 1
+        return [CsvError(*e) for e in entry.get("errors") or []]
+
+    def put(self, key: str, sha256: str, errors: list[CsvError], deps: dict[str, bool]) -> None:
+        self.entries[key] = {"sha256": sha256, "errors": errors, "deps": deps}
+        self.dirty = True
+
+    def save(self, keep: set[str]) -> None:
+        stale = set(self.entries) - keep
+        for key in stale:
+            del self.entries[key]
+        if self.path is None or not (self.dirty or stale):
+            return
+        # Best-effort, like the skill catalog index.
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_name(f".{self.path.name}.{os.getpid()}.tmp")
+            tmp.write_text(json.dumps({"version": self.version, "entries": self.entries}, sort_keys=True) + "\n", encoding="utf-8")
+            os.replace(tmp, self.path)
+        except OSError:
+            pass
+
+
+def _rel_path(path: Path) -> str:
+    try:
+        return path.relative_to(ROOT).as_posix()
+    except ValueError:
+        return str(path)
+
+
+def _cache_key(path: Path) -> str:
+    return _rel_path(path)
+
+
+def _lint_csv_files(
+    paths: list[Path], cache: _LintCache, jobs: int, timings: Optional["_Timings"] = None
+) -> dict[Path, list[CsvError]]:
+    """
+    Lint `paths`, re-validating only files whose cache entry is missing or stale.
+
+    When `timings` is given, per-file wall time (hash + lookup for cache hits, the
+    whole validation pass otherwise) is recorded in `timings.items`.
+    """
+    results: dict[Path, list[CsvError]] = {}
+    todo: list[Path] = []
+    for path in paths:
+        start = time.perf_counter()
+        key = _cache_key(path)
+        try:
+            sha256 = _sha256_file(path)
+        except OSError:
+            todo.append(path)
+            continue
+        cached = cache.get(key, sha256)
+        if cached is None:
+            todo.append(path)
+        else:
+            results[path] = cached
+            if timings is not None:
+                timings.items[key] = time.perf_counter() - start
+
+    if jobs > 1 and len(todo) > 1:
+        with ProcessPoolExecutor(max_workers=min(jobs, len(todo))) as pool:
+            done = list(pool.map(_timed_lint_prompts_csv_job, [str(p) for p in todo]))
+    else:
+        done = [_timed_lint_prompts_csv_job(str(p)) for p in todo]
+    for path, (elapsed, (sha256, errors, deps)) in zip(todo, done):
+        if sha256:
+            cache.put(_cache_key(path), sha256, errors, deps)
+        results[path] = errors
+        if timings is not None:
+            timings.items[_cache_key(path)] = elapsed
+    return results
+
+
+class _Timings:
+    """Wall time per lint phase, plus per-file time for SKILL.md and prompts.csv files."""
+
+    def __init__(self) -> None:
+        self.phases: dict[str, float] = {}
+        self.items: dict[str, float] = {}
+
+    @contextlib.contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases[name] = self.phases.get(name, 0.0) + time.perf_counter() - start
+
+    def slowest(self, top: int) -> list[tuple[str, float]]:
+        return sorted(self.items.items(), key=lambda kv: (-kv[1], kv[0]))[:top]
+
+    def as_dict(self, top: int) -> dict[str, Any]:
+        return {
+            "phases": {name: round(t, 6) for name, t in self.phases.items()},
+            "slowest": [{"path": path, "seconds": round(t, 6)} for path, t in self.slowest(top)],
+        }
+
+    def report(self, top: int) -> list[str]:
+        lines = ["Timings:"]
+        lines += [f"  {name:<16} {t * 1000:9.1f} ms" for name, t in self.phases.items()]
+        slowest = self.slowest(top)
+        if slowest:
+            lines.append(f"Slowest files (top {len(slowest)}):")
+            lines += [f"  {t * 1000:9.1f} ms  {path}" for path, t in slowest]
+        return lines
+
+
+def _json_report(findings: list[Finding], summary: dict[str, int], timings: Optional[dict[str, Any]]) -> dict[str, Any]:
+    out: dict[str, Any] = {
+        "findings": [
+            {"level": f.level, "rule": f.rule, "path": f.path, "line": f.line, "message": f.message} for f in findings
+        ],
+        "summary": summary,
+    }
+    if timings is not None:
+        out["timings"] = timings
+    return out
+
+
+def _sarif_report(findings: list[Finding]) -> dict[str, Any]:
+    rule_ids = sorted({f.rule for f in findings})
+    rule_index = {rule: i for i, rule in enumerate(rule_ids)}
+    results: list[dict[str, Any]] = []
+    for f in findings:
+        result: dict[str, Any] = {
+            "ruleId": f.rule,
+            "ruleIndex": rule_index[f.rule],
+            "level": f.level,
+            "message": {"text": f.message},
+        }
+        if f.path:
+            location: dict[str, Any] = {"artifactLocation": {"uri": f.path, "uriBaseId": "SRCROOT"}}
+            if f.line:
+                location["region"] = {"startLine": f.line}
+            result["locations"] = [{"physicalLocation": location}]
+        results.append(result)
+    return {
+        "$schema": "https://json.schemastore.org/sarif-2.1.0.json",
+        "version": "2.1.0",
+        "runs": [
+            {
+                "tool": {
+                    "driver": {
+                        "name": "lint_skills",
+                        "rules": [{"id": r, "shortDescription": {"text": RULES.get(r, r)}} for r in rule_ids],
+                    }
+                },
+                "originalUriBaseIds": {"SRCROOT": {"uri": ROOT.as_uri() + "/"}},
+                "results": results,
+            }
+        ],
+    }
+
+
+def _changed_files(base: str) -> set[Path]:
+    """Files that differ from `base` (committed, staged or unstaged), plus untracked files."""
+    cmds = [
+        ["git", "diff", "--name-only", "--no-renames", base, "--"],
+        ["git", "ls-files", "--others", "--exclude-standard"],
+    ]
+    changed: set[Path] = set()
+    for cmd in cmds:
+        proc = subprocess.run(cmd, cwd=str(ROOT), capture_output=True, text=True)
+        if proc.returncode != 0:
+            raise SystemExit(f"`{' '.join(cmd)}` failed: {proc.stderr.strip()}")
+        changed.update(ROOT / line for line in proc.stdout.splitlines() if line.strip())
+    return changed
 
 
 def main(argv: list[str]) -> int:
@@ -177,74 +502,149 @@ def main(argv: list[str]) -> int:
         action="store_true",
         help="Validate any committed prompts.csv under evals/skills/**/prompts.csv.",
     )
+    ap.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Lint changed prompts.csv files on N worker processes (default: 1; 0 = one per CPU).",
+    )
+    ap.add_argument("--no-cache", action="store_true", help="Ignore and do not update the lint result cache.")
+    ap.add_argument(
+        "--only-changed",
+        action="store_true",
+        help="Only report per-file problems for files changed relative to --base (cross-skill checks still run).",
+    )
+    ap.add_argument("--base", default="HEAD", help="Git ref for --only-changed (default: HEAD).")
+    ap.add_argument(
+        "--format",
+        choices=["text", "json", "sarif"],
+        default="text",
+        help="text: WARNING/ERROR lines on stderr (default); json/sarif: findings with path, line and rule id on stdout.",
+    )
+    ap.add_argument(
+        "--timings",
+        action="store_true",
+        help="Report time per lint phase and the slowest SKILL.md/prompts.csv files (on stderr; also in --format json).",
+    )
+    ap.add_argument("--timings-top", type=int, default=10, help="How many slowest files --timings lists (default: 10).")
     args = ap.parse_args(argv)
+    jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+    changed = _changed_files(args.base) if args.only_changed else None
+    timings = _Timings()
 
-    skills = _load_skills()
-    errors: list[str] = []
-    warnings: list[str] = []
+    skills, findings = _load_skills(timings)
+    if changed is not None:
+        findings = [f for f in findings if ROOT / (f.path or "") in changed]
 
-    if not skills:
-        errors.append("No canonical skills found.")
+    def error(rule: str, message: str, path: Optional[Path] = None, line: Optional[int] = None) -> None:
+        findings.append(Finding("error", rule, message, _rel_path(path) if path else None, line))
+
+    if not skills and not findings:
+        error("no-skills", "No canonical skills found.")
     else:
-        for s in skills:
-            if not s.name:
-                errors.append(f"{s.skill_md}: missing frontmatter name:")
-            elif not s.name.startswith("uv-"):
-                errors.append(f"{s.skill_md}: name must start with 'uv-': {s.name!r}")
-            if not s.description:
-                errors.append(f"{s.skill_md}: missing frontmatter description:")
+        # Frontmatter is parsed through the catalog, which only re-reads SKILL.md files
+        # whose stat changed; these per-skill checks are then just field lookups.
+        with timings.phase("frontmatter"):
+            for s in skills:
+                if changed is not None and s.skill_md not in changed:
+                    continue
+                if not s.name:
+                    error("skill-name", "missing frontmatter name:", s.skill_md, 1)
+                elif not s.name.startswith("uv-"):
+                    error("skill-name-prefix", f"name must start with 'uv-': {s.name!r}", s.skill_md, 1)
+                if not s.description:
+                    error("skill-description", "missing frontmatter description:", s.skill_md, 1)
 
     # Collisions
-    names: dict[str, Path] = {}
-    slugs: dict[str, Path] = {}
-    for s in skills:
-        if s.name:
-            if s.name in names:
-                errors.append(f"duplicate skill name {s.name!r}: {s.skill_md} and {names[s.name]}")
-            else:
-                names[s.name] = s.skill_md
-            try:
-                slug = _skill_slug(s.name)
-            except Exception as e:
-                errors.append(f"{s.skill_md}: slugify failed: {e}")
-                continue
-            if slug in slugs:
-                errors.append(f"slug collision {slug!r}: {s.skill_md} and {slugs[slug]}")
-            else:
-                slugs[slug] = s.skill_md
+    with timings.phase("collisions"):
+        names: dict[str, Path] = {}
+        slugs: dict[str, Path] = {}
+        for s in skills:
+            if s.name:
+                if s.name in names:
+                    error(
+                        "skill-duplicate-name",
+                        f"duplicate skill name {s.name!r} (also in {_rel_path(names[s.name])})",
+                        s.skill_md,
+                        1,
+                    )
+                else:
+                    names[s.name] = s.skill_md
+                try:
+                    slug = _skill_slug(s.name)
+                except Exception as e:
+                    error("skill-slug", f"slugify failed: {e}", s.skill_md, 1)
+                    continue
+                if slug in slugs:
+                    error(
+                        "skill-slug-collision",
+                        f"slug collision {slug!r} (also in {_rel_path(slugs[slug])})",
+                        s.skill_md,
+                        1,
+                    )
+                else:
+                    slugs[slug] = s.skill_md
 
     # Curated eval coverage (recommended, not required unless --strict)
     evals_root = ROOT / "evals" / "skills"
-    missing_cases: list[str] = []
-    for s in skills:
-        if not s.name:
-            continue
-        slug = _skill_slug(s.name)
-        prompts_csv = evals_root / slug / "prompts.csv"
-        if not prompts_csv.exists():
-            missing_cases.append(f"{s.name} -> {prompts_csv.relative_to(ROOT)}")
+    with timings.phase("eval coverage"):
+        missing_cases: list[str] = []
+        for s in skills:
+            if not s.name:
+                continue
+            slug = _skill_slug(s.name)
+            prompts_csv = evals_root / slug / "prompts.csv"
+            if not prompts_csv.exists():
+                missing_cases.append(f"{s.name} -> {prompts_csv.relative_to(ROOT)}")
 
     if missing_cases:
         msg = f"{len(missing_cases)}/{len(skills)} skills missing curated eval cases (prompts.csv)."
-        if args.strict:
-            errors.append(msg)
-        else:
-            warnings.append(msg)
+        findings.append(Finding("error" if args.strict else "warning", "eval-coverage", msg))
 
+    linted = cached = 0
     if args.check_evals and evals_root.exists():
-        for prompts_csv in sorted(evals_root.rglob("prompts.csv")):
-            errs = _lint_prompts_csv(prompts_csv)
-            if errs:
-                errors.append(f"{prompts_csv.relative_to(ROOT)}: " + "; ".join(errs))
-
-    for w in warnings:
-        print(f"WARNING: {w}", file=sys.stderr)
-    for e in errors:
-        print(f"ERROR: {e}", file=sys.stderr)
-
-    print(f"Skills: {len(skills)}", file=sys.stderr)
-    print(f"Warnings: {len(warnings)}", file=sys.stderr)
-    print(f"Errors: {len(errors)}", file=sys.stderr)
+        with timings.phase("csv validation"):
+            cache = _LintCache(None if args.no_cache else default_cache_path())
+            all_csvs = sorted(evals_root.rglob("prompts.csv"))
+            csvs = all_csvs
+            if changed is not None:
+                # A prompts.csv is affected by edits to itself or to anything in its case folder (fixtures).
+                changed_dirs = {d for p in changed for d in p.parents}
+                csvs = [p for p in all_csvs if p in changed or p.parent in changed_dirs]
+            results = _lint_csv_files(csvs, cache, jobs, timings)
+            for prompts_csv in csvs:
+                for e in results[prompts_csv]:
+                    error(e.rule, e.message, prompts_csv, e.line)
+            linted, cached = len(csvs), cache.hits
+            if not args.no_cache:
+                cache.save({_cache_key(p) for p in all_csvs})
+
+    warnings = [f for f in findings if f.level == "warning"]
+    errors = [f for f in findings if f.level == "error"]
+    summary = {"skills": len(skills), "warnings": len(warnings), "errors": len(errors)}
+    if args.check_evals:
+        summary.update(eval_case_files=linted, eval_case_files_cached=cached)
+
+    if args.format == "json":
+        report = _json_report(warnings + errors, summary, timings.as_dict(args.timings_top) if args.timings else None)
+        print(json.dumps(report, indent=2))
+    elif args.format == "sarif":
+        print(json.dumps(_sarif_report(warnings + errors), indent=2))
+    else:
+        for w in warnings:
+            print(f"WARNING: {w.text()}", file=sys.stderr)
+        for e in errors:
+            print(f"ERROR: {e.text()}", file=sys.stderr)
+
+        print(f"Skills: {len(skills)}", file=sys.stderr)
+        if args.check_evals:
+            print(f"Eval case files: {linted} ({cached} cached)", file=sys.stderr)
+        print(f"Warnings: {len(warnings)}", file=sys.stderr)
+        print(f"Errors: {len(errors)}", file=sys.stderr)
+
+    if args.timings:
+        for line in timings.report(args.timings_top):
+            print(line, file=sys.stderr)
 
     return 0 if not errors else 1
 
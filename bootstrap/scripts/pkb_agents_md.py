@@ -12,15 +12,11 @@ import sys
 from pathlib import Path
 from typing import Iterable, Optional
 
+from skill_catalog import load_catalog
+from skill_frontmatter import read_frontmatter
+
 
 REPO_ROOT = Path(__file__).resolve().parents[2]
-CANONICAL_ROOTS = [
-    REPO_ROOT / "bootstrap",
-    REPO_ROOT / "common",
-    REPO_ROOT / "human",
-    REPO_ROOT / "knowledge",
-    REPO_ROOT / "productivity",
-]
 MIRROR_ROOT = REPO_ROOT / "skills"
 
 START_MARKER = "<!-- PKBLLM-AGENTS-NOTE-START -->"
@@ -71,47 +67,24 @@ def _tokenize(text: str) -> list[str]:
     return [p for p in parts if p not in stop and len(p) > 1]
 
 
-def _read_frontmatter(skill_md: Path) -> dict[str, str]:
-    lines = _read_text(skill_md).splitlines()
-    if not lines or lines[0].strip() != "---":
-        return {}
-    out: dict[str, str] = {}
-    for line in lines[1:250]:
-        if line.strip() == "---":
-            break
-        if ":" not in line:
-            continue
-        k, v = line.split(":", 1)
-        key = k.strip()
-        val = v.strip().strip("'\"")
-        if key and key not in out:
-            out[key] = val
-    return out
-
-
 def iter_canonical_skills(repo_root: Path) -> Iterable[SkillDoc]:
-    for root in CANONICAL_ROOTS:
-        if not root.is_dir():
+    for entry in load_catalog(repo_root):
+        name = entry.name
+        if not name.startswith("uv-"):
             continue
-        for skill_md in root.rglob("SKILL.md"):
-            if skill_md.name != "SKILL.md":
-                continue
-            fm = _read_frontmatter(skill_md)
-            name = (fm.get("name") or "").strip()
-            if not name.startswith("uv-"):
-                continue
-            description = (fm.get("description") or "").strip()
-            body = _read_text(skill_md)
-            tokens = tuple(_tokenize(f"{name}\n{description}\n{body}"))
-            refs = tuple(sorted({m.lower() for m in _SKILL_REF.findall(body) if m.lower() != name.lower()}))
-            yield SkillDoc(
-                name=name,
-                description=description,
-                skill_md=skill_md,
-                body=body,
-                tokens=tokens,
-                outbound_refs=refs,
-            )
+        skill_md = entry.skill_md(repo_root)
+        description = entry.description
+        body = _read_text(skill_md)
+        tokens = tuple(_tokenize(f"{name}\n{description}\n{body}"))
+        refs = tuple(sorted({m.lower() for m in _SKILL_REF.findall(body) if m.lower() != name.lower()}))
+        yield SkillDoc(
+            name=name,
+            description=description,
+            skill_md=skill_md,
+            body=body,
+            tokens=tokens,
+            outbound_refs=refs,
+        )
 
 
 def iter_mirror_skills(repo_root: Path) -> Iterable[SkillDoc]:
@@ -124,7 +97,7 @@ def iter_mirror_skills(repo_root: Path) -> Iterable[SkillDoc]:
     if not root.is_dir():
         return
     for skill_md in sorted(root.glob("*/SKILL.md")):
-        fm = _read_frontmatter(skill_md)
+        fm = read_frontmatter(skill_md) or {}
         name = (fm.get("name") or "").strip()
         if not name.startswith("uv-"):
             continue
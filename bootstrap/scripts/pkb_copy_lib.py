@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import os
+import shutil
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Optional, Sequence
+
+
+@dataclass(frozen=True)
+class CopyJob:
+    key: str
+    src: Path
+    dst: Path
+
+
+@dataclass(frozen=True)
+class CopyResult:
+    key: str
+    duration_s: float
+    files: int
+    bytes: int
+
+
+# A copy function materializes one job and returns (files, bytes) it wrote.
+CopyFn = Callable[[CopyJob], "tuple[int, int]"]
+
+# Linux `FICLONE` ioctl (btrfs, xfs, bcachefs, overlayfs on those, ...).
+_FICLONE = 0x40049409
+
+
+def default_jobs() -> int:
+    # Copies are I/O bound (and slow on network homes), so oversubscribe the CPUs a bit.
+    return max(1, min(16, (os.cpu_count() or 2) * 2))
+
+
+def _remove(path: Path) -> None:
+    if path.is_symlink() or path.is_file():
+        path.unlink()
+    elif path.is_dir():
+        shutil.rmtree(path)
+
+
+def reflink_file(src: Path, dst: Path) -> None:
+    """Create `dst` as a copy-on-write clone of `src`; raises OSError where unsupported."""
+    try:
+        import fcntl
+    except ImportError as e:  # pragma: no cover - non-POSIX
+        raise OSError("reflink requires fcntl") from e
+    try:
+        with src.open("rb") as fsrc, dst.open("xb") as fdst:
+            fcntl.ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())
+    except OSError:
+        dst.unlink(missing_ok=True)
+        raise
+    shutil.copystat(src, dst)
+
+
+def copy_skill_dir(src: Path, dst: Path, *, symlinks: bool = False) -> tuple[int, int]:
+    """Replace `dst` with a copy of `src`; returns the number of files and bytes copied."""
+    if dst.exists() or dst.is_symlink():
+        _remove(dst)
+    dst.parent.mkdir(parents=True, exist_ok=True)
+    counts = [0, 0]
+
+    def _copy(s: str, d: str) -> str:
+        shutil.copy2(s, d)
+        counts[0] += 1
+        counts[1] += os.path.getsize(d)
+        return d
+
+    shutil.copytree(src, dst, symlinks=symlinks, copy_function=_copy)
+    return counts[0], counts[1]
+
+
+def _default_copy(job: CopyJob) -> tuple[int, int]:
+    return copy_skill_dir(job.src, job.dst)
+
+
+def run_copy_jobs(
+    jobs: Sequence[CopyJob],
+    copy_fn: Optional[CopyFn] = None,
+    *,
+    max_workers: Optional[int] = None,
+) -> list[CopyResult]:
+    """
+    Run `jobs` on a bounded thread pool and return results in `jobs` order.
+
+    Every job runs to completion even if another fails; the first failure (in job
+    order) is then re-raised so callers see the same error a serial loop would.
+    """
+    fn = copy_fn or _default_copy
+    workers = max(1, min(int(max_workers or default_jobs()), len(jobs) or 1))
+
+    def _timed(job: CopyJob) -> CopyResult:
+        start = time.perf_counter()
+        files, nbytes = fn(job)
+        return CopyResult(key=job.key, duration_s=time.perf_counter() - start, files=files, bytes=nbytes)
+
+    if workers == 1:
+        results: list[CopyResult] = []
+        first_error: Optional[BaseException] = None
+        for job in jobs:
+            try:
+                results.append(_timed(job))
+            except Exception as e:
+                first_error = first_error or e
+        if first_error is not None:
+            raise first_error
+        return results
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="pkb-copy") as pool:
+        futures = [pool.submit(_timed, job) for job in jobs]
+        errors = [f.exception() for f in futures]
+    for err in errors:
+        if err is not None:
+            raise err
+    return [f.result() for f in futures]
+
+
+def format_timings(results: Sequence[CopyResult], *, top: Optional[int] = None) -> list[str]:
+    """Human-readable per-job timing lines, slowest first."""
+    ordered = sorted(results, key=lambda r: r.duration_s, reverse=True)
+    if top is not None:
+        ordered = ordered[: max(0, top)]
+    return [f"{r.duration_s * 1000:8.1f} ms  {r.files:5d} files  {r.bytes:>10d} B  {r.key}" for r in ordered]
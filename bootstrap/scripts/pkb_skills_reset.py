@@ -9,6 +9,12 @@ import shutil
 import subprocess
 import sys
 from pathlib import Path
+from typing import Optional
+
+from pkb_copy_lib import CopyJob, copy_skill_dir, default_jobs, format_timings, run_copy_jobs
+from skill_bundle import SkillBundle
+from skill_catalog import load_catalog
+from skill_manifest import is_current, load_manifest
 
 
 def _repo_root() -> Path:
@@ -29,50 +35,12 @@ def _skill_slug(name: str) -> str:
     return slug
 
 
-def _parse_frontmatter_name(skill_md: Path) -> str | None:
-    try:
-        lines = skill_md.read_text(encoding="utf-8", errors="replace").splitlines()
-    except OSError:
-        return None
-    if not lines or lines[0].strip() != "---":
-        return None
-    for line in lines[1:120]:
-        if line.strip() == "---":
-            break
-        if line.startswith("name:"):
-            return line.split(":", 1)[1].strip().strip("'\"")
-    return None
-
-
-def _iter_canonical_skill_dirs(repo_root: Path) -> list[Path]:
-    canonical_roots = [
-        repo_root / "common",
-        repo_root / "knowledge",
-        repo_root / "productivity",
-        repo_root / "human",
-        repo_root / "bootstrap",
-    ]
-    dirs: set[Path] = set()
-    for root in canonical_roots:
-        if not root.is_dir():
-            continue
-        for skill_md in root.rglob("SKILL.md"):
-            if skill_md.name != "SKILL.md":
-                continue
-            parent = skill_md.parent
-            if parent.name.startswith("."):
-                continue
-            dirs.add(parent)
-    return sorted(dirs)
-
-
 def _scan_canonical_pkb_skill_names(repo_root: Path) -> list[str]:
     names: set[str] = set()
-    for skill_dir in _iter_canonical_skill_dirs(repo_root):
-        name = _parse_frontmatter_name(skill_dir / "SKILL.md")
-        if not name or not name.startswith("uv-"):
+    for entry in load_catalog(repo_root):
+        if not entry.name.startswith("uv-"):
             continue
-        names.add(name)
+        names.add(entry.name)
     return sorted(names)
 
 
@@ -346,13 +314,35 @@ def main(argv: list[str]) -> int:
         action="store_true",
         help="Overwrite existing skills under --install-root.",
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=default_jobs(),
+        help="Number of skills copied concurrently with --copy (default: %(default)s).",
+    )
+    parser.add_argument(
+        "--bundle",
+        default="",
+        help=(
+            "Install by extracting from a bundle written by `update_skills_mirror.py pack` "
+            "(implies --copy; skips the mirror rebuild)."
+        ),
+    )
     parser.add_argument(
         "--dry-run",
         action="store_true",
         help="Print actions without changing anything.",
     )
     args = parser.parse_args(argv)
+    if not args.bundle:
+        return _reset(repo_root, args, None)
+    args.copy = True
+    args.skip_mirror_update = True
+    with SkillBundle(Path(args.bundle).expanduser()) as bundle:
+        return _reset(repo_root, args, bundle)
 
+
+def _reset(repo_root: Path, args: argparse.Namespace, bundle: Optional[SkillBundle]) -> int:
     def log(msg: str) -> None:
         if args.quiet:
             return
@@ -370,6 +360,8 @@ def main(argv: list[str]) -> int:
     cleanup_roots = _default_cleanup_roots(project_root)
 
     removed = 0
+    keep_current = args.copy and not args.clean_only
+    deferred: set[str] = set()
     if not args.skip_clean:
         if not args.no_skills_cli:
             if not args.quiet and args.verbose:
@@ -385,8 +377,14 @@ def main(argv: list[str]) -> int:
 
         for root in cleanup_roots:
             for slug in slugs_for_cleanup:
+                if keep_current and root == install_root:
+                    # Checked against the manifest hashes below; unchanged copies are kept.
+                    deferred.add(slug)
+                    continue
                 removed += int(_rm_path(root / slug, dry_run=args.dry_run))
             for name in skill_names:
+                if name in deferred and root == install_root:
+                    continue
                 removed += int(_rm_path(root / name, dry_run=args.dry_run))
 
     if args.clean_only:
@@ -397,10 +395,15 @@ def main(argv: list[str]) -> int:
         log(f"[pkb-reset] building skills mirror via `update_skills_mirror.py build-mirror` (python={sys.executable})")
         _run_update_skills_mirror(repo_root, dry_run=args.dry_run)
 
-    slugs = _load_pkb_skill_slugs_from_manifest(repo_root)
-    mirror_dirs = _skills_mirror_dir_count(repo_root)
-    log(f"[pkb-reset] skills mirror dirs: {mirror_dirs} (expected {len(slugs)})")
-    missing = _missing_skill_sources(repo_root, slugs)
+    if bundle is not None:
+        slugs = bundle.slugs()
+        missing = []
+        log(f"[pkb-reset] installing from bundle {bundle.path} ({len(slugs)} skills)")
+    else:
+        slugs = _load_pkb_skill_slugs_from_manifest(repo_root)
+        mirror_dirs = _skills_mirror_dir_count(repo_root)
+        log(f"[pkb-reset] skills mirror dirs: {mirror_dirs} (expected {len(slugs)})")
+        missing = _missing_skill_sources(repo_root, slugs)
     if missing and not args.dry_run:
         print("[pkb-reset] ERROR: skills mirror is incomplete after build-mirror.", file=sys.stderr)
         print(f"[pkb-reset] missing sources (first 10): {', '.join(missing[:10])}", file=sys.stderr)
@@ -410,9 +413,18 @@ def main(argv: list[str]) -> int:
     _ensure_dir(install_root, dry_run=args.dry_run)
 
     installed = 0
+    unchanged = 0
+    copy_jobs: list[CopyJob] = []
+    extract: list[str] = []
+    if bundle is not None:
+        manifest = {e.get("slug"): e for e in bundle.manifest}
+    elif keep_current:
+        manifest = {e.get("slug"): e for e in load_manifest(repo_root / "skills" / "manifest.json")}
+    else:
+        manifest = {}
     for slug in slugs:
         src = repo_root / "skills" / slug
-        if not src.exists():
+        if bundle is None and not src.exists():
             if args.dry_run:
                 print(f"[dry-run] missing source {src} (would be created by `update_skills_mirror.py build-mirror`)")
                 continue
@@ -424,22 +436,48 @@ def main(argv: list[str]) -> int:
 
         dest = install_root / slug
         if dest.exists() or dest.is_symlink():
-            if not args.force:
+            overwrite = args.force or slug in deferred
+            if overwrite and keep_current and not dest.is_symlink() and is_current(manifest.get(slug, {}), dest):
+                unchanged += 1
+                continue
+            if not overwrite:
                 print(f"skip (exists): {dest}")
                 continue
+            removed += int(slug in deferred)
             _rm_path(dest, dry_run=args.dry_run)
 
-        if args.copy:
+        if bundle is not None:
+            if args.dry_run:
+                print(f"[dry-run] extract {slug} from {bundle.path} -> {dest}")
+            else:
+                extract.append(slug)
+        elif args.copy:
             if args.dry_run:
                 print(f"[dry-run] copytree {src} -> {dest}")
             else:
-                shutil.copytree(src, dest, symlinks=True)
+                copy_jobs.append(CopyJob(key=slug, src=src, dst=dest))
         else:
             _symlink(src, dest, dry_run=args.dry_run)
 
         installed += 1
 
-    log(f"Done. Removed {removed} existing installs. Installed {installed} skills to `{install_root}`.")
+    if copy_jobs:
+        results = run_copy_jobs(
+            copy_jobs,
+            lambda job: copy_skill_dir(job.src, job.dst, symlinks=True),
+            max_workers=args.jobs,
+        )
+        if args.verbose and not args.quiet:
+            log(f"[pkb-reset] copied {len(results)} skills ({max(1, args.jobs)} workers), slowest first:")
+            for line in format_timings(results, top=10):
+                log(f"  {line}")
+
+    if bundle is not None:
+        # Already filtered against the manifest above; extract in one pass over the archive.
+        bundle.extract(extract, install_root, skip_current=False)
+
+    kept = f" Kept {unchanged} unchanged copies." if unchanged else ""
+    log(f"Done. Removed {removed} existing installs. Installed {installed} skills to `{install_root}`.{kept}")
     return 0
 
 
@@ -11,7 +11,11 @@ import sys
 from pathlib import Path
 from typing import Any, Optional
 
+from pkb_copy_lib import CopyJob, format_timings, run_copy_jobs
 from pkb_install_lib import copy_install_root, prompt_choices_text, resolve_agent
+from skill_bundle import SkillBundle
+from skill_frontmatter import read_frontmatter
+from skill_manifest import load_manifest, stale_skills
 
 
 REPO_ROOT = Path(__file__).resolve().parents[2]
@@ -84,12 +88,6 @@ def _resolve_selector(requested: str) -> str:
     return "claude"
 
 
-def _copy_skill_dir(src: Path, dst: Path) -> None:
-    if dst.exists():
-        shutil.rmtree(dst)
-    shutil.copytree(src, dst, copy_function=shutil.copy2)
-
-
 def _list_mirror_skill_names(pkb_root: Path) -> set[str]:
     root = pkb_root / "skills"
     out: set[str] = set()
@@ -101,13 +99,9 @@ def _list_mirror_skill_names(pkb_root: Path) -> set[str]:
         skill_md = d / "SKILL.md"
         if not skill_md.exists():
             continue
-        text = _read_text(skill_md)
-        for line in text.splitlines()[:120]:
-            if line.startswith("name:"):
-                name = line.split(":", 1)[1].strip().strip("'\"")
-                if name.startswith("uv-"):
-                    out.add(name)
-                break
+        name = (read_frontmatter(skill_md) or {}).get("name", "")
+        if name.startswith("uv-"):
+            out.add(name)
     return out
 
 
@@ -268,6 +262,11 @@ def main(argv: Optional[list[str]] = None) -> int:
         default="copy",
         help="How to install selected skills into the target repo (default: copy).",
     )
+    ap.add_argument(
+        "--bundle",
+        default=None,
+        help="install-mode=copy: extract skills from this `update_skills_mirror.py pack` bundle instead of copying skills/.",
+    )
     ap.add_argument("--agents-md", default="AGENTS.md", help="AGENTS.md path relative to target (default: AGENTS.md).")
     ap.add_argument("--task", default=None, help="One-sentence task description (non-interactive).")
     ap.add_argument("--done", default=None, help="Definition of done (non-interactive).")
@@ -499,15 +498,39 @@ Constraints:
             cmd = ["npx", "-y", "skills", "add", str(pkb_root), "-a", args.agent, "--skill", s, "-y"]
             subprocess.run(cmd, check=True, cwd=str(target), text=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
         _write_text(debug_dir / "install.txt", f"installed {len(selected_skills)} via skills-cli\n")
+    elif args.bundle:
+        _ensure_dir(dest_root)
+        with SkillBundle(Path(args.bundle).expanduser()) as bundle:
+            try:
+                extracted, unchanged = bundle.extract(selected_skills, dest_root)
+            except KeyError as e:
+                raise SystemExit(f"Missing skill in bundle: {e}")
+        _write_text(
+            debug_dir / "install.txt",
+            f"installed {len(selected_skills)} from bundle {args.bundle} into {dest_root} "
+            f"({len(extracted)} extracted, {len(unchanged)} unchanged)\n",
+        )
     else:
         _ensure_dir(dest_root)
+        jobs: list[CopyJob] = []
         for s in selected_skills:
             src = pkb_root / "skills" / s
-            dst = dest_root / s
             if not src.is_dir():
                 raise SystemExit(f"Missing skill in mirror: {src}")
-            _copy_skill_dir(src, dst)
-        _write_text(debug_dir / "install.txt", f"installed {len(selected_skills)} by copy into {dest_root}\n")
+            jobs.append(CopyJob(key=s, src=src, dst=dest_root / s))
+        try:
+            stale = set(stale_skills(load_manifest(pkb_root / "skills" / "manifest.json"), dest_root, selected_skills))
+        except (OSError, ValueError):
+            stale = set(selected_skills)
+        # Installed copies whose hashes match the manifest are left alone.
+        unchanged = [j for j in jobs if j.key not in stale and not j.dst.is_symlink()]
+        results = run_copy_jobs([j for j in jobs if j not in unchanged])
+        timings = "".join(f"{line}\n" for line in format_timings(results))
+        _write_text(
+            debug_dir / "install.txt",
+            f"installed {len(selected_skills)} by copy into {dest_root} "
+            f"({len(results)} copied, {len(unchanged)} unchanged)\n{timings}",
+        )
 
     # Final summary for the user.
     print("\n== 完成 ==")
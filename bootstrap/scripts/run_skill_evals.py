@@ -3,31 +3,47 @@
 from __future__ import annotations
 
 import argparse
+import dataclasses
 import datetime as dt
+import hashlib
+import json
 import os
+import re
 import shutil
 import subprocess
 import sys
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Iterator, Optional, Union
 
+from pkb_copy_lib import reflink_file
 from skill_eval_lib import (
     ARTIFACTS_ROOT,
     EVALS_ROOT,
+    AgentBackend,
+    CodexRun,
     PromptCase,
     Skill,
+    TraceReducer,
     default_smoke_cases,
     deterministic_grade,
     discover_skills,
     ensure_dir,
-    iter_jsonl_events,
+    file_sha256,
     load_curated_cases,
-    run_codex_exec,
-    snapshot_skills_to_dir,
+    make_backend,
     summarize_markdown,
     write_json,
     write_text,
 )
+from skill_manifest import digest_tree
+from skill_snapshot_store import SnapshotStore, write_manifest
+
+
+# Bump when grading changes in a way that should invalidate cached case results.
+RESULT_CACHE_VERSION = 1
 
 
 def _repo_root() -> Path:
@@ -48,6 +64,20 @@ def _safe_symlink_dir(src: Path, dst: Path) -> None:
     dst.symlink_to(src, target_is_directory=True)
 
 
+def _local_case_dir(run_root: Path, skill_slug: str, case_id: str) -> Path:
+    """
+    The run's own work dir for a case, ready to be written to. A cached case is a
+    link into the run that produced it; it is replaced by a copy first so writes
+    never reach the other run's artifacts (or the cache entries pointing at them).
+    """
+    case_dir = run_root / "work" / skill_slug / case_id
+    if case_dir.is_symlink():
+        src = case_dir.resolve()
+        case_dir.unlink()
+        shutil.copytree(src, case_dir, symlinks=True)
+    return case_dir
+
+
 def _select_cases(skill: Skill, suite: str, max_cases: Optional[int]) -> list[PromptCase]:
     curated = load_curated_cases(skill)
     if curated:
@@ -80,6 +110,7 @@ def _judge_case(
     final_path: Path,
     judge_schema: Path,
     timeout_s: int,
+    backend: AgentBackend,
 ) -> dict[str, Any]:
     prompt = f"""Evaluate the previous agent run in this directory.
 
@@ -119,7 +150,7 @@ Notes:
 """
 
     judge_out = case_dir / "judge.json"
-    run = run_codex_exec(
+    run = backend.exec(
         prompt=prompt,
         work_dir=case_dir,
         sandbox="read-only",
@@ -141,7 +172,7 @@ Notes:
             ],
         }
     try:
-        return __import__("json").loads(judge_out.read_text(encoding="utf-8"))
+        return json.loads(judge_out.read_text(encoding="utf-8"))
     except Exception:
         return {
             "overall_pass": False,
@@ -155,7 +186,1037 @@ Notes:
         }
 
 
+def _judged(row: dict[str, Any], judge: dict[str, Any], judge_s: float) -> dict[str, Any]:
+    """`row` with its judge verdict folded in (the deterministic grade must pass too)."""
+    score = judge.get("score")
+    return {
+        **row,
+        "pass": bool((row.get("deterministic") or {}).get("pass")) and judge.get("overall_pass") is True,
+        "judge": judge,
+        "notes": f"judge score={score}" if isinstance(score, int) else "judge ran",
+        "timings": {**(row.get("timings") or {}), "judge_s": round(judge_s, 4)},
+    }
+
+
+class _Workspaces:
+    """
+    Per-run workspace templates, cloned into each case_dir without spawning processes.
+
+    The base template holds `.codex/skills` (a symlink to the run's snapshot) and a
+    `human_materials` git repo; each distinct fixture gets its own template on top of
+    it. Both are built once per run. Clones reflink (copy-on-write) where the
+    filesystem supports it and copy otherwise. Read-only cases get private copies
+    too: the read-only sandbox is only enforced by codex, and a stray write through
+    a hardlink would corrupt the template for every later case.
+    """
+
+    def __init__(self, run_root: Path, snapshot_dir: Path) -> None:
+        self.root = run_root / "templates"
+        self.snapshot_dir = snapshot_dir
+        self._templates: dict[str, Path] = {}
+        self._can_reflink = True
+        self._lock = threading.Lock()
+
+    def _build_base(self) -> Path:
+        base = self.root / "base"
+        if base.exists():
+            return base
+        staging = self.root / f".base.{os.getpid()}.tmp"
+        shutil.rmtree(staging, ignore_errors=True)
+        # Provide pkbllm skills to codex via repo-scoped .codex/skills.
+        ensure_dir(staging / ".codex")
+        (staging / ".codex" / "skills").symlink_to(self.snapshot_dir.resolve(), target_is_directory=True)
+        # Ensure a stable materials path for skills that emit outputs. Many pkbllm
+        # scripts look for `.git` to locate the repo root; in real usage the
+        # human-materials repo is its own git repo, so emulate that (once per run).
+        human_material_path = staging / "human_materials"
+        ensure_dir(human_material_path)
+        try:
+            subprocess.run(
+                ["git", "init", str(human_material_path)],
+                check=False,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+            )
+        except Exception:
+            pass
+        os.replace(staging, base)
+        return base
+
+    def template(self, case: PromptCase) -> Path:
+        fixture = case.fixture if case.fixture is not None and case.fixture.exists() else None
+        key = "base" if fixture is None else "fixture-" + hashlib.sha256(str(fixture.resolve()).encode()).hexdigest()[:16]
+        with self._lock:
+            cached = self._templates.get(key)
+            if cached is not None:
+                return cached
+            base = self._build_base()
+            path = base
+            if fixture is not None:
+                path = self.root / key
+                if not path.exists():
+                    staging = self.root / f".{key}.{os.getpid()}.tmp"
+                    shutil.rmtree(staging, ignore_errors=True)
+                    shutil.copytree(base, staging, symlinks=True)
+                    # Fixture entries never replace the .codex / human_materials scaffolding.
+                    for child in fixture.iterdir():
+                        dst = staging / child.name
+                        if dst.exists():
+                            continue
+                        if child.is_dir():
+                            shutil.copytree(child, dst, copy_function=shutil.copy2)
+                        else:
+                            shutil.copy2(child, dst)
+                    os.replace(staging, path)
+            self._templates[key] = path
+            return path
+
+    def _place(self, src: Path, dst: Path) -> None:
+        if self._can_reflink:
+            try:
+                reflink_file(src, dst)
+                return
+            except OSError:
+                self._can_reflink = False
+        shutil.copy2(src, dst)
+
+    def provision(self, case: PromptCase, case_dir: Path) -> None:
+        """Clone the case's template into `case_dir`, keeping anything already there (resume)."""
+        template = self.template(case)
+        ensure_dir(case_dir)
+        for dirpath, dirnames, filenames in os.walk(template):
+            src_dir = Path(dirpath)
+            dst_dir = case_dir / src_dir.relative_to(template)
+            for name in list(dirnames):
+                src = src_dir / name
+                dst = dst_dir / name
+                if src.is_symlink():
+                    # os.walk does not descend into directory symlinks; recreate them as links.
+                    if not (dst.exists() or dst.is_symlink()):
+                        os.symlink(os.readlink(src), dst)
+                    dirnames.remove(name)
+                else:
+                    dst.mkdir(exist_ok=True)
+            for name in filenames:
+                src = src_dir / name
+                dst = dst_dir / name
+                if dst.exists() or dst.is_symlink():
+                    continue
+                if src.is_symlink():
+                    os.symlink(os.readlink(src), dst)
+                else:
+                    self._place(src, dst)
+
+
+def _grade_case(
+    *,
+    skill: Skill,
+    case: PromptCase,
+    case_dir: Path,
+    run: CodexRun,
+    final_path: Path,
+    trace: Optional[TraceReducer] = None,
+) -> tuple[dict[str, Any], list[dict[str, Any]]]:
+    # `trace` is the live reduction of the run's events; without one, reduce the stored trace.
+    det = deterministic_grade(codex_run=run, trace=trace if trace is not None else run.reduce())
+
+    # Per-case deterministic checks
+    final_text = ""
+    try:
+        final_text = final_path.read_text(encoding="utf-8", errors="replace")
+    except Exception:
+        final_text = ""
+
+    case_checks: list[dict[str, Any]] = []
+    ok = bool(det.get("pass"))
+
+    # The runner killed the agent as soon as it went over a command/token cap.
+    if run.stop_reason is not None:
+        det["budget_exceeded"] = run.stop_reason
+        case_checks.append({"id": "budget", "pass": False, "notes": run.stop_reason})
+        ok = False
+
+    # Structured-output checks (when an output schema is used).
+    parsed: Optional[dict[str, Any]] = None
+    if case.output_schema is not None:
+        try:
+            parsed_obj = json.loads(final_text) if final_text.strip() else None
+            parsed = parsed_obj if isinstance(parsed_obj, dict) else None
+        except Exception:
+            parsed = None
+        if parsed is None:
+            case_checks.append({"id": "final_json", "pass": False, "notes": "final.txt not valid JSON object"})
+            ok = False
+        else:
+            inv = parsed.get("invoked_skills")
+            inv_list = inv if isinstance(inv, list) else []
+            inv_strs = [x for x in inv_list if isinstance(x, str)]
+            if case.should_trigger:
+                passed = skill.name in inv_strs
+                case_checks.append(
+                    {
+                        "id": "invoked_skills",
+                        "pass": passed,
+                        "notes": f"expected {skill.name!r} in invoked_skills",
+                    }
+                )
+                ok = ok and passed
+            else:
+                passed = skill.name not in inv_strs
+                case_checks.append(
+                    {
+                        "id": "invoked_skills",
+                        "pass": passed,
+                        "notes": f"expected {skill.name!r} not in invoked_skills",
+                    }
+                )
+                ok = ok and passed
+
+    if case.max_commands is not None:
+        passed = int(det.get("command_count_effective") or 0) <= int(case.max_commands)
+        case_checks.append(
+            {
+                "id": "max_commands",
+                "pass": passed,
+                "notes": (
+                    f"effective={det.get('command_count_effective')} "
+                    f"total={det.get('command_count_total')} "
+                    f"max={case.max_commands}"
+                ),
+            }
+        )
+        ok = ok and passed
+
+    usage = det.get("usage") or {}
+    total_tokens = usage.get("total_tokens") if isinstance(usage, dict) else None
+    input_tokens = usage.get("input_tokens") if isinstance(usage, dict) else None
+    output_tokens = usage.get("output_tokens") if isinstance(usage, dict) else None
+
+    if case.max_total_tokens is not None and isinstance(total_tokens, int):
+        passed = total_tokens <= int(case.max_total_tokens)
+        case_checks.append({"id": "max_total_tokens", "pass": passed, "notes": f"{total_tokens} <= {case.max_total_tokens}"})
+        ok = ok and passed
+
+    if case.max_input_tokens is not None and isinstance(input_tokens, int):
+        passed = input_tokens <= int(case.max_input_tokens)
+        case_checks.append({"id": "max_input_tokens", "pass": passed, "notes": f"{input_tokens} <= {case.max_input_tokens}"})
+        ok = ok and passed
+
+    if case.max_output_tokens is not None and isinstance(output_tokens, int):
+        passed = output_tokens <= int(case.max_output_tokens)
+        case_checks.append({"id": "max_output_tokens", "pass": passed, "notes": f"{output_tokens} <= {case.max_output_tokens}"})
+        ok = ok and passed
+
+    for rel in case.require_files:
+        target = case_dir / rel
+        passed = target.exists()
+        case_checks.append({"id": "require_files", "pass": passed, "notes": rel})
+        ok = ok and passed
+
+    for pat in case.must_include:
+        passed = re.search(pat, final_text, flags=re.IGNORECASE | re.MULTILINE) is not None
+        case_checks.append({"id": "must_include", "pass": passed, "notes": pat})
+        ok = ok and passed
+
+    for pat in case.must_not_include:
+        passed = re.search(pat, final_text, flags=re.IGNORECASE | re.MULTILINE) is None
+        case_checks.append({"id": "must_not_include", "pass": passed, "notes": pat})
+        ok = ok and passed
+
+    det["pass"] = bool(ok)
+    return det, case_checks
+
+
+def _wants_judge(args: argparse.Namespace, case: PromptCase) -> bool:
+    return (not bool(args.no_judge)) and (bool(args.judge) or bool(case.judge))
+
+
+def _parse_age(raw: str) -> float:
+    """Seconds in `raw`, which is a number with an optional s/m/h/d suffix (e.g. `90m`, `7d`)."""
+    units = {"s": 1, "m": 60, "h": 3600, "d": 86400}
+    raw = raw.strip().lower()
+    scale = units.get(raw[-1:], 0)
+    try:
+        return float(raw[:-1] if scale else raw) * (scale or 1)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid age: {raw!r} (expected e.g. 3600, 90m, 12h, 7d)") from None
+
+
+def _parse_shard(raw: str) -> tuple[int, int]:
+    """(K, N) from `K/N`, with 1 <= K <= N."""
+    m = re.fullmatch(r"\s*(\d+)\s*/\s*(\d+)\s*", raw)
+    if m is None or not (1 <= int(m.group(1)) <= int(m.group(2))):
+        raise argparse.ArgumentTypeError(f"invalid shard: {raw!r} (expected K/N with 1 <= K <= N, e.g. 2/4)")
+    return int(m.group(1)), int(m.group(2))
+
+
+def _shard_of(skill_slug: str, case_id: str, shards: int) -> int:
+    """
+    1-based shard that owns a case. Hash-based, so it depends only on the case key:
+    every host agrees without coordination, and adding cases does not move others.
+    """
+    digest = hashlib.sha256(f"{skill_slug}\0{case_id}".encode("utf-8")).digest()
+    return int.from_bytes(digest[:8], "big") % shards + 1
+
+
+class _ResultCache:
+    """
+    Finished case rows keyed by a hash of everything that decides the outcome: the
+    skill's own directory contents, the normalized case fields (with the output
+    schema and fixture tree replaced by content hashes), judge settings and the
+    agent backend fingerprint. Each entry points at the case_dir that produced it
+    and is only reused while that directory still exists.
+    """
+
+    def __init__(self, root: Optional[Path], *, max_age_s: Optional[float] = None) -> None:
+        self.root = root
+        self.max_age_s = max_age_s
+        self._tree_hashes: dict[Path, str] = {}
+        self._lock = threading.Lock()
+
+    def _tree_sha256(self, path: Path) -> str:
+        with self._lock:
+            cached = self._tree_hashes.get(path)
+        if cached is None:
+            cached = digest_tree(path).tree_sha256 if path.is_dir() else (file_sha256(path) or "missing")
+            with self._lock:
+                self._tree_hashes[path] = cached
+        return cached
+
+    def key(
+        self,
+        skill: Skill,
+        case: PromptCase,
+        *,
+        args: argparse.Namespace,
+        judge_schema: Path,
+        backend: AgentBackend,
+    ) -> str:
+        fields = dataclasses.asdict(case)
+        fields["output_schema"] = self._tree_sha256(case.output_schema) if case.output_schema else None
+        fields["fixture"] = self._tree_sha256(case.fixture) if case.fixture else None
+        judge = _wants_judge(args, case)
+        doc = {
+            "version": RESULT_CACHE_VERSION,
+            "skill": {"name": skill.name, "tree_sha256": self._tree_sha256(skill.canonical_dir)},
+            "case": fields,
+            "judge": {
+                "enabled": judge,
+                "schema_sha256": self._tree_sha256(judge_schema) if judge else None,
+                "timeout_s": args.judge_timeout_s if judge else None,
+            },
+            "budget_kill": not args.no_budget_kill,
+            "agent": backend.fingerprint(),
+        }
+        return hashlib.sha256(json.dumps(doc, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[dict[str, Any]]:
+        if self.root is None:
+            return None
+        try:
+            entry = json.loads((self.root / f"{key}.json").read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        if not isinstance(entry, dict) or not isinstance(entry.get("row"), dict):
+            return None
+        if self.max_age_s is not None and time.time() - float(entry.get("created_at") or 0) > self.max_age_s:
+            return None
+        if not Path(entry["row"].get("case_dir") or "").is_dir():
+            return None
+        return entry["row"]
+
+    def put(self, key: str, row: dict[str, Any]) -> None:
+        if self.root is None:
+            return
+        # Best-effort, like the lint cache.
+        try:
+            ensure_dir(self.root)
+            path = self.root / f"{key}.json"
+            tmp = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+            tmp.write_text(json.dumps({"created_at": time.time(), "row": row}, sort_keys=True) + "\n", encoding="utf-8")
+            os.replace(tmp, path)
+        except OSError:
+            pass
+
+
+# `--status` folds in at most this much of the journal tail past the last snapshot.
+_STATUS_TAIL_BYTES = 1024 * 1024
+
+
+def _iter_journal(path: Path, offset: int = 0, *, aligned: bool = True) -> Iterator[dict[str, Any]]:
+    """
+    Records in a progress journal from byte `offset` on; unparseable lines are skipped.
+
+    With `aligned=False` the offset may fall inside a record, whose remainder is dropped.
+    """
+    try:
+        f = path.open("rb")
+    except OSError:
+        return
+    with f:
+        f.seek(offset)
+        if offset and not aligned:
+            f.readline()
+        for line in f:
+            try:
+                obj = json.loads(line)
+            except ValueError:
+                continue
+            if isinstance(obj, dict):
+                yield obj
+
+
+class _Progress:
+    """
+    Progress files for a run (progress.jsonl, summary.partial.json, current.json).
+
+    progress.jsonl is an append-only journal: each finished case is one O_APPEND
+    write, so concurrent writers never interleave partial lines. Aggregates are kept
+    incrementally and summary.partial.json is an atomic snapshot of them, written at
+    most every `snapshot_interval_s` seconds (and on close); it records how far into
+    the journal it reaches so `--status` only reads the tail past it.
+
+    Safe to call from worker threads: every update happens under one lock, so the
+    files always describe a consistent set of finished and running cases. Live trace
+    counters for running cases are flushed to current.json at most every
+    `live_interval_s` seconds.
+    """
+
+    live_interval_s = 1.0
+    snapshot_interval_s = 1.0
+
+    def __init__(
+        self,
+        run_root: Path,
+        *,
+        run_id: str,
+        suite: str,
+        judge: bool,
+        skills: int,
+        enabled: bool,
+        shard: Optional[str] = None,
+    ) -> None:
+        self.progress_path = run_root / "progress.jsonl"
+        self.partial_summary_path = run_root / "summary.partial.json"
+        self.current_path = run_root / "current.json"
+        self.run_id = run_id
+        self.suite = suite
+        self.judge = judge
+        self.skills = skills
+        self.enabled = enabled
+        self.shard = shard
+        self.cases_done = 0
+        self.pass_count = 0
+        self.last: Optional[dict[str, Any]] = None
+        self.running: dict[str, dict[str, Any]] = {}
+        self._journal_fd: Optional[int] = None
+        self._journal_bytes = 0
+        self._last_current: dict[str, Any] = {}
+        self._last_live_write = 0.0
+        self._last_snapshot = float("-inf")
+        self._lock = threading.Lock()
+
+    def resume(self) -> set[tuple[str, str]]:
+        """Stream the existing journal once: returns finished cases and seeds the aggregates."""
+        done: set[tuple[str, str]] = set()
+        for obj in _iter_journal(self.progress_path):
+            skill_slug = obj.get("skill_slug")
+            case_id = obj.get("case_id")
+            if not (isinstance(skill_slug, str) and isinstance(case_id, str)):
+                continue
+            self.last = obj
+            if (skill_slug, case_id) in done:
+                continue
+            done.add((skill_slug, case_id))
+            self.cases_done += 1
+            self.pass_count += 1 if obj.get("pass") else 0
+        try:
+            self._journal_bytes = self.progress_path.stat().st_size
+        except OSError:
+            self._journal_bytes = 0
+        return done
+
+    def _snapshot(self, *, force: bool = False, status: str = "running") -> None:
+        now = time.monotonic()
+        if not force and now - self._last_snapshot < self.snapshot_interval_s:
+            return
+        self._last_snapshot = now
+        write_json(
+            self.partial_summary_path,
+            {
+                "run_id": self.run_id,
+                "suite": self.suite,
+                "judge": self.judge,
+                "skills": self.skills,
+                "shard": self.shard,
+                "status": status,
+                "cases_done": self.cases_done,
+                "pass_count": self.pass_count,
+                "fail_count": self.cases_done - self.pass_count,
+                "last": self.last,
+                "journal_bytes": self._journal_bytes,
+            },
+        )
+
+    def _write_current(self, record: dict[str, Any]) -> None:
+        # `running` lists every in-flight case; the top-level fields describe the latest event.
+        self._last_current = record
+        write_json(self.current_path, {**record, "running": list(self.running.values())})
+
+    def live(self, case_dir: Path, counters: TraceReducer) -> None:
+        if not self.enabled:
+            return
+        now = time.monotonic()
+        with self._lock:
+            record = self.running.get(str(case_dir))
+            if record is None:
+                return
+            record["live"] = counters.as_dict()
+            if now - self._last_live_write >= self.live_interval_s:
+                self._last_live_write = now
+                self._write_current(self._last_current)
+
+    def start(self, skill: Skill, case: PromptCase, case_dir: Path) -> None:
+        print(f"[....] {skill.name} :: {case.case_id} (starting)", file=sys.stderr, flush=True)
+        if not self.enabled:
+            return
+        record = {
+            "ts": dt.datetime.now(dt.timezone.utc).isoformat(),
+            "skill": skill.name,
+            "skill_slug": skill.slug,
+            "case_id": case.case_id,
+            "case_dir": str(case_dir),
+            "status": "running",
+        }
+        with self._lock:
+            self.running[str(case_dir)] = record
+            self._write_current(record)
+
+    def stage(self, case_dir: Path, status: str) -> None:
+        """Mark a running case as being in a later stage (e.g. waiting for its judge)."""
+        if not self.enabled:
+            return
+        with self._lock:
+            record = self.running.get(str(case_dir))
+            if record is not None:
+                record["status"] = status
+                self._write_current(record)
+
+    def finish(self, row: dict[str, Any]) -> None:
+        status = "PASS" if row["pass"] else "FAIL"
+        print(f"[{status}] {row['skill']} :: {row['case_id']} -> {row['case_dir']}", file=sys.stderr, flush=True)
+        if not self.enabled:
+            return
+        record = {
+            "ts": dt.datetime.now(dt.timezone.utc).isoformat(),
+            "skill": row["skill"],
+            "skill_slug": row["skill_slug"],
+            "case_id": row["case_id"],
+            "pass": row["pass"],
+            "case_dir": row["case_dir"],
+        }
+        line = (json.dumps(record) + "\n").encode("utf-8")
+        with self._lock:
+            if self._journal_fd is None:
+                self._journal_fd = os.open(self.progress_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+            os.write(self._journal_fd, line)
+            self._journal_bytes = os.lseek(self._journal_fd, 0, os.SEEK_CUR)
+            self.running.pop(row["case_dir"], None)
+            self.cases_done += 1
+            self.pass_count += 1 if row["pass"] else 0
+            self.last = record
+            self._snapshot()
+            self._write_current({**record, "status": "completed"})
+
+    def close(self) -> None:
+        if not self.enabled:
+            return
+        with self._lock:
+            self._snapshot(force=True, status="finished")
+            if self._journal_fd is not None:
+                os.close(self._journal_fd)
+                self._journal_fd = None
+
+
+def _status(run_root: Path) -> dict[str, Any]:
+    """
+    Run status from the last progress snapshot plus the journal tail written after it.
+
+    Reads a bounded amount of data however many cases the run has.
+    """
+    try:
+        status = json.loads((run_root / "summary.partial.json").read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        status = {"cases_done": 0, "pass_count": 0, "fail_count": 0, "last": None, "journal_bytes": 0}
+    journal = run_root / "progress.jsonl"
+    try:
+        size = journal.stat().st_size
+    except OSError:
+        size = 0
+    offset = int(status.get("journal_bytes") or 0)
+    if size > offset:
+        start = max(offset, size - _STATUS_TAIL_BYTES)
+        if start > offset:
+            status["tail_truncated"] = True
+        for obj in _iter_journal(journal, start, aligned=start == offset):
+            status["cases_done"] = int(status.get("cases_done") or 0) + 1
+            key = "pass_count" if obj.get("pass") else "fail_count"
+            status[key] = int(status.get(key) or 0) + 1
+            status["last"] = obj
+        status["journal_bytes"] = size
+    return status
+
+
+def _run_case(
+    skill: Skill,
+    case: PromptCase,
+    *,
+    args: argparse.Namespace,
+    run_root: Path,
+    workspaces: _Workspaces,
+    judge_schema: Path,
+    progress: _Progress,
+    backend: AgentBackend,
+    cache: _ResultCache,
+    judges: ThreadPoolExecutor,
+) -> Union[dict[str, Any], Future]:
+    """
+    Run and grade one case. A case that needs a judge is handed to the `judges` pool
+    and a future for its row is returned, so the caller's next agent run starts while
+    the judge works; otherwise the finished row is returned directly.
+    """
+    # Wall time per stage; everything but `agent_s` is harness overhead.
+    timings: dict[str, float] = {}
+    t0 = time.perf_counter()
+
+    cache_key = cache.key(skill, case, args=args, judge_schema=judge_schema, backend=backend)
+    hit = cache.get(cache_key)
+    if hit is not None:
+        # Inputs are unchanged: reuse the earlier grade and link to its artifacts.
+        # Anything else at the link path (e.g. an interrupted attempt) is replaced.
+        link = run_root / "work" / skill.slug / case.case_id
+        if link.resolve() != Path(hit["case_dir"]).resolve():
+            _safe_symlink_dir(Path(hit["case_dir"]), link)
+        row = {
+            **hit,
+            "case_dir": str(link),
+            "cached": True,
+            "cached_from": hit["case_dir"],
+            "notes": "; ".join(n for n in ("cached", hit.get("notes") or "") if n),
+            "timings": {"cache_s": round(time.perf_counter() - t0, 4)},
+        }
+        progress.finish(row)
+        return row
+
+    case_dir = run_root / "work" / skill.slug / case.case_id
+    workspaces.provision(case, case_dir)
+    progress.start(skill, case, case_dir)
+
+    trace_path = case_dir / "trace.jsonl"
+    stderr_path = case_dir / "stderr.txt"
+    final_path = case_dir / "final.txt"
+    meta_path = case_dir / "meta.json"
+    grade_path = case_dir / "grade.json"
+
+    meta = {
+        "skill": {"name": skill.name, "slug": skill.slug},
+        "case": {"id": case.case_id, "should_trigger": case.should_trigger, "prompt": case.prompt},
+        "suite": args.suite,
+    }
+    write_json(meta_path, meta)
+
+    env_overrides = {
+        "HUMAN_MATERIAL_PATH": str(case_dir / "human_materials"),
+        "PKB_PATH": str(_repo_root()),
+    }
+
+    # Reduced as events arrive; grading reuses it instead of re-reading the trace.
+    counters = TraceReducer()
+
+    def on_event(event: dict[str, Any]) -> Optional[str]:
+        counters.update(event, time.monotonic())
+        progress.live(case_dir, counters)
+        return None if args.no_budget_kill else counters.budget_violation(case)
+
+    # Streamed straight to trace.jsonl/stderr.txt, so partial output survives a timeout or crash.
+    t1 = time.perf_counter()
+    timings["setup_s"] = t1 - t0
+    run = backend.exec(
+        prompt=case.prompt,
+        work_dir=case_dir,
+        sandbox=case.sandbox or "workspace-write",
+        output_schema=case.output_schema,
+        output_last_message=final_path,
+        env_overrides=env_overrides,
+        timeout_s=max(1, int(case.timeout_s or args.timeout_s)),
+        trace_path=trace_path,
+        stderr_path=stderr_path,
+        on_event=on_event,
+    )
+
+    t2 = time.perf_counter()
+    timings["agent_s"] = t2 - t1
+
+    det, case_checks = _grade_case(
+        skill=skill, case=case, case_dir=case_dir, run=run, final_path=final_path, trace=counters
+    )
+    write_json(grade_path, {"deterministic": det, "case_checks": case_checks})
+    t3 = time.perf_counter()
+    timings["grade_s"] = t3 - t2
+
+    row = {
+        "skill": skill.name,
+        "skill_slug": skill.slug,
+        "case_id": case.case_id,
+        "should_trigger": case.should_trigger,
+        "pass": bool(det.get("pass")),
+        "deterministic": det,
+        "judge": None,
+        "case_dir": str(case_dir),
+        "notes": f"killed: {run.stop_reason}" if run.stop_reason is not None else "",
+        "timings": {k: round(v, 4) for k, v in timings.items()},
+    }
+    # Timeouts and launch failures say more about the machine than the skill; rerun those.
+    cacheable = run.exit_code == 0 or run.stop_reason is not None
+
+    # A case killed for exceeding its budget has already failed; don't pay for a judge run.
+    if not (_wants_judge(args, case) and run.stop_reason is None):
+        if cacheable:
+            cache.put(cache_key, row)
+        progress.finish(row)
+        return row
+
+    def judge_and_finish() -> dict[str, Any]:
+        t4 = time.perf_counter()
+        judge = _judge_case(
+            case_dir=case_dir,
+            skill=skill,
+            case=case,
+            trace_path=trace_path,
+            final_path=final_path,
+            judge_schema=judge_schema,
+            timeout_s=args.judge_timeout_s,
+            backend=backend,
+        )
+        write_json(case_dir / "judge.normalized.json", judge)
+        judged = _judged(row, judge, time.perf_counter() - t4)
+        if cacheable:
+            cache.put(cache_key, judged)
+        progress.finish(judged)
+        return judged
+
+    progress.stage(case_dir, "judging")
+    return judges.submit(judge_and_finish)
+
+
+def _summary(rows: list[dict[str, Any]], **meta: Any) -> dict[str, Any]:
+    return {
+        **meta,
+        "cases": len(rows),
+        "pass_count": sum(1 for r in rows if r.get("pass")),
+        "fail_count": sum(1 for r in rows if not r.get("pass")),
+        "cached": sum(1 for r in rows if r.get("cached")),
+        "timings": {
+            key: round(sum((r.get("timings") or {}).get(key, 0.0) for r in rows), 4)
+            for key in ("setup_s", "agent_s", "grade_s", "judge_s", "cache_s")
+        },
+        "rows": rows,
+    }
+
+
+def _resolve_run(raw: str) -> Optional[Path]:
+    path = Path(raw)
+    if path.is_dir():
+        return path
+    path = ARTIFACTS_ROOT / raw
+    return path if path.is_dir() else None
+
+
+def _merge_rows(run_root: Path) -> tuple[dict[tuple[str, str], dict[str, Any]], dict[str, Any]]:
+    """
+    Finished cases of one run, keyed by (skill_slug, case_id), plus its summary metadata.
+
+    progress.jsonl lists every finished case even across `--resume` invocations (whose
+    summary.json only holds that invocation's rows); full summary rows replace the
+    journal records where available.
+    """
+    rows: dict[tuple[str, str], dict[str, Any]] = {}
+    for obj in _iter_journal(run_root / "progress.jsonl"):
+        skill_slug = obj.get("skill_slug")
+        case_id = obj.get("case_id")
+        if isinstance(skill_slug, str) and isinstance(case_id, str):
+            rows[(skill_slug, case_id)] = {**{k: v for k, v in obj.items() if k != "ts"}, "notes": ""}
+    meta: dict[str, Any] = {}
+    for name in ("summary.partial.json", "summary.json"):
+        try:
+            data = json.loads((run_root / name).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            continue
+        if not isinstance(data, dict):
+            continue
+        meta.update({k: v for k, v in data.items() if k != "rows"})
+        for row in data.get("rows") or []:
+            if isinstance(row, dict):
+                rows[(str(row.get("skill_slug")), str(row.get("case_id")))] = row
+    return rows, meta
+
+
+def merge_main(argv: list[str]) -> int:
+    ap = argparse.ArgumentParser(
+        prog="run_skill_evals.py merge",
+        description="Combine shard runs (summary.json + progress.jsonl) into one run summary and report.",
+    )
+    ap.add_argument("runs", nargs="+", help="Shard run ids (under artifacts/skill-evals/) or run directories.")
+    ap.add_argument("--run-id", default=None, help="Run id for the merged run (default: UTC timestamp).")
+    args = ap.parse_args(argv)
+
+    run_id = args.run_id or _now_run_id()
+    out_root = ARTIFACTS_ROOT / run_id
+    if out_root.exists():
+        print(f"ERROR: run id already exists: {out_root}", file=sys.stderr)
+        return 2
+
+    merged: dict[tuple[str, str], dict[str, Any]] = {}
+    shards: list[dict[str, Any]] = []
+    metas: list[dict[str, Any]] = []
+    for raw in args.runs:
+        run_root = _resolve_run(raw)
+        if run_root is None:
+            print(f"ERROR: unknown run: {raw}", file=sys.stderr)
+            return 2
+        rows, meta = _merge_rows(run_root)
+        overlap = merged.keys() & rows.keys()
+        if overlap:
+            print(
+                f"WARNING: {len(overlap)} case(s) of {run_root.name} already merged; keeping the later run's",
+                file=sys.stderr,
+            )
+        merged.update(rows)
+        metas.append(meta)
+        complete = (run_root / "summary.json").exists() and meta.get("status") in (None, "finished")
+        if not complete:
+            print(f"WARNING: {run_root.name} has not finished; merging the cases it completed", file=sys.stderr)
+        shards.append(
+            {"run_id": meta.get("run_id") or run_root.name, "shard": meta.get("shard"), "cases": len(rows), "complete": complete}
+        )
+
+    counts = {shard["shard"].split("/")[1] for shard in shards if isinstance(shard.get("shard"), str)}
+    if len(counts) > 1:
+        print(f"WARNING: runs were sharded different ways: {sorted(counts)}", file=sys.stderr)
+
+    def common(key: str) -> Any:
+        values = {json.dumps(m.get(key), sort_keys=True) for m in metas}
+        return metas[0].get(key) if len(values) == 1 else None
+
+    # Rows sorted by case key: shards interleave, so there is no single planned order.
+    rows = [merged[key] for key in sorted(merged)]
+    ensure_dir(out_root)
+    with (out_root / "progress.jsonl").open("w", encoding="utf-8") as f:
+        for row in rows:
+            f.write(json.dumps({k: row.get(k) for k in ("skill", "skill_slug", "case_id", "pass", "case_dir")}) + "\n")
+    summary_md = out_root / "summary.md"
+    write_json(
+        out_root / "summary.json",
+        _summary(
+            rows,
+            run_id=run_id,
+            suite=common("suite"),
+            judge=common("judge"),
+            skills=len({r.get("skill_slug") for r in rows}),
+            backend=common("backend"),
+            merged_from=shards,
+        ),
+    )
+    write_text(summary_md, summarize_markdown(rows))
+
+    fails = [r for r in rows if not r.get("pass")]
+    verdict = f"FAIL: {len(fails)}/{len(rows)} cases failed." if fails else f"PASS: {len(rows)} cases."
+    print(f"{verdict} Merged {len(shards)} run(s). See {summary_md}", file=sys.stderr, flush=True)
+    return 1 if fails else 0
+
+
+def _finished_cases(
+    run_root: Path, suite: Optional[str]
+) -> tuple[list[tuple[Skill, PromptCase, dict[str, Any]]], dict[str, Any]]:
+    """
+    The current definition of every case `run_root` finished, in planned order, with
+    the case's recorded row; plus the run's summary metadata.
+    """
+    finished, meta = _merge_rows(run_root)
+    suite = meta.get("suite") or suite or "smoke"
+    meta["suite"] = suite
+    targets: list[tuple[Skill, PromptCase, dict[str, Any]]] = []
+    for skill in discover_skills():
+        for case in _select_cases(skill, suite, None):
+            prev = finished.pop((skill.slug, case.case_id), None)
+            if prev is not None:
+                targets.append((skill, case, prev))
+    if finished:
+        print(f"WARNING: {len(finished)} finished case(s) are no longer defined; leaving them out", file=sys.stderr)
+    return targets, meta
+
+
+def _rewrite_summary(run_root: Path, rows: list[dict[str, Any]], meta: dict[str, Any], verb: str, **extra: Any) -> int:
+    summary_md = run_root / "summary.md"
+    write_json(
+        run_root / "summary.json",
+        _summary(
+            rows,
+            run_id=meta.get("run_id") or run_root.name,
+            suite=meta.get("suite"),
+            judge=meta.get("judge"),
+            skills=len({r["skill_slug"] for r in rows}),
+            shard=meta.get("shard"),
+            backend=meta.get("backend"),
+            **extra,
+        ),
+    )
+    write_text(summary_md, summarize_markdown(rows))
+    fails = [r for r in rows if not r.get("pass")]
+    verdict = f"FAIL: {len(fails)}/{len(rows)} cases failed." if fails else f"PASS: {len(rows)} cases."
+    print(f"{verdict} {verb} run {run_root.name}. See {summary_md}", file=sys.stderr, flush=True)
+    return 1 if fails else 0
+
+
+def _judge_only(args: argparse.Namespace, judge_schema: Path) -> int:
+    """Judge the finished cases of an existing run from their artifacts; no agent runs."""
+    run_root = ARTIFACTS_ROOT / args.run_id
+    if not run_root.is_dir():
+        print(f"ERROR: unknown run id: {run_root}", file=sys.stderr)
+        return 2
+    replay_from: Optional[Path] = None
+    if args.replay_from:
+        replay_from = _resolve_run(args.replay_from)
+        if replay_from is None:
+            print(f"ERROR: unknown --replay-from run: {args.replay_from}", file=sys.stderr)
+            return 2
+    try:
+        backend = make_backend(args.backend, run_root=run_root, replay_from=replay_from, stub_exec=args.stub_exec)
+    except ValueError as e:
+        print(f"ERROR: {e}", file=sys.stderr)
+        return 2
+
+    targets, meta = _finished_cases(run_root, args.suite)
+
+    def judge_one(item: tuple[Skill, PromptCase, dict[str, Any]]) -> dict[str, Any]:
+        skill, case, prev = item
+        case_dir = _local_case_dir(run_root, skill.slug, case.case_id)
+        try:
+            grade = json.loads((case_dir / "grade.json").read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            grade = {}
+        det = grade.get("deterministic") or prev.get("deterministic") or {"pass": bool(prev.get("pass"))}
+        row = {**prev, "skill": skill.name, "should_trigger": case.should_trigger, "deterministic": det}
+        if det.get("budget_exceeded"):
+            row = {**row, "pass": False, "judge": None}
+        else:
+            t0 = time.perf_counter()
+            judge = _judge_case(
+                case_dir=case_dir,
+                skill=skill,
+                case=case,
+                trace_path=case_dir / "trace.jsonl",
+                final_path=case_dir / "final.txt",
+                judge_schema=judge_schema,
+                timeout_s=args.judge_timeout_s,
+                backend=backend,
+            )
+            write_json(case_dir / "judge.normalized.json", judge)
+            row = _judged(row, judge, time.perf_counter() - t0)
+        status = "PASS" if row["pass"] else "FAIL"
+        print(f"[{status}] {skill.name} :: {case.case_id} (judged)", file=sys.stderr, flush=True)
+        return row
+
+    judge_jobs = max(1, int(args.judge_jobs or args.jobs))
+    with ThreadPoolExecutor(max_workers=judge_jobs) as pool:
+        rows = list(pool.map(judge_one, targets))
+    return _rewrite_summary(run_root, rows, {**meta, "judge": True}, "Judged")
+
+
+def _recorded_run(case_dir: Path) -> CodexRun:
+    """The agent run behind `case_dir`, rebuilt from its trace, stderr and last grade."""
+    try:
+        det = json.loads((case_dir / "grade.json").read_text(encoding="utf-8")).get("deterministic") or {}
+    except (OSError, ValueError, AttributeError):
+        det = {}
+    stderr_path = case_dir / "stderr.txt"
+    exit_code = det.get("exit_code")
+    stop_reason = det.get("budget_exceeded")
+    if not isinstance(exit_code, int):
+        # No usable grade: fall back to the notes the runner appends to stderr.txt.
+        try:
+            notes = stderr_path.read_text(encoding="utf-8", errors="replace")
+        except OSError:
+            notes = ""
+        exit_code = 124 if "TIMEOUT after" in notes else 0
+        m = re.search(r"^STOPPED: (.+)$", notes, flags=re.MULTILINE)
+        stop_reason = m.group(1) if m else None
+    return CodexRun(
+        exit_code=exit_code,
+        stdout="",
+        stderr="",
+        duration_s=float(det.get("duration_s") or 0.0),
+        trace_path=case_dir / "trace.jsonl",
+        stderr_path=stderr_path,
+        stop_reason=stop_reason if isinstance(stop_reason, str) else None,
+    )
+
+
+def regrade_main(argv: list[str]) -> int:
+    ap = argparse.ArgumentParser(
+        prog="run_skill_evals.py regrade",
+        description="Re-apply the current case definitions and deterministic checks to a finished run's artifacts.",
+    )
+    ap.add_argument("--run-id", required=True, help="Run id (under artifacts/skill-evals/) to regrade in place.")
+    ap.add_argument("--jobs", type=int, default=os.cpu_count() or 1, help="Cases to grade concurrently.")
+    args = ap.parse_args(argv)
+
+    run_root = ARTIFACTS_ROOT / args.run_id
+    if not run_root.is_dir():
+        print(f"ERROR: unknown run id: {run_root}", file=sys.stderr)
+        return 2
+    targets, meta = _finished_cases(run_root, None)
+
+    def regrade_one(item: tuple[Skill, PromptCase, dict[str, Any]]) -> dict[str, Any]:
+        skill, case, prev = item
+        case_dir = _local_case_dir(run_root, skill.slug, case.case_id)
+        run = _recorded_run(case_dir)
+        t0 = time.perf_counter()
+        det, case_checks = _grade_case(
+            skill=skill, case=case, case_dir=case_dir, run=run, final_path=case_dir / "final.txt"
+        )
+        write_json(case_dir / "grade.json", {"deterministic": det, "case_checks": case_checks})
+        row = {
+            **prev,
+            "skill": skill.name,
+            "should_trigger": case.should_trigger,
+            "pass": bool(det.get("pass")),
+            "deterministic": det,
+            "judge": None,
+            "timings": {**(prev.get("timings") or {}), "grade_s": round(time.perf_counter() - t0, 4)},
+        }
+        # Judge verdicts are kept as they were; `--judge-only` refreshes them.
+        try:
+            judge = json.loads((case_dir / "judge.normalized.json").read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            judge = prev.get("judge")
+        if isinstance(judge, dict) and run.stop_reason is None:
+            row = _judged(row, judge, float(row["timings"].get("judge_s") or 0.0))
+        # The outcome behind the notes (cached, killed, judge score) is unchanged by regrading.
+        row["notes"] = prev.get("notes") or ""
+        return row
+
+    with ThreadPoolExecutor(max_workers=max(1, int(args.jobs))) as pool:
+        rows = list(pool.map(regrade_one, targets))
+    return _rewrite_summary(run_root, rows, meta, "Regraded", regraded=True)
+
+
 def main(argv: list[str]) -> int:
+    if argv and argv[0] == "merge":
+        return merge_main(argv[1:])
+    if argv and argv[0] == "regrade":
+        return regrade_main(argv[1:])
+
     ap = argparse.ArgumentParser(description="Run LLM-backed evals for pkbllm skills (Codex).")
     ap.add_argument("--skill", action="append", help="Filter by exact skill name (repeatable).")
     ap.add_argument("--case", action="append", help="Filter by exact case id (repeatable).")
@@ -168,6 +1229,13 @@ def main(argv: list[str]) -> int:
     ap.add_argument("--max-cases", type=int, default=None, help="Max cases per skill.")
     ap.add_argument("--max-skills", type=int, default=None, help="Max number of skills to run.")
     ap.add_argument("--run-id", default=None, help="Override run id (default: UTC timestamp).")
+    ap.add_argument(
+        "--shard",
+        type=_parse_shard,
+        default=None,
+        metavar="K/N",
+        help="Only run the cases hashed to shard K of N (stable per skill/case; combine shards with `merge`).",
+    )
     ap.add_argument(
         "--resume",
         action="store_true",
@@ -185,6 +1253,17 @@ def main(argv: list[str]) -> int:
     )
     ap.add_argument("--judge", action="store_true", help="Run a read-only rubric judge pass for all cases.")
     ap.add_argument("--no-judge", action="store_true", help="Disable rubric judge pass (overrides case.judge).")
+    ap.add_argument(
+        "--judge-only",
+        action="store_true",
+        help="Judge the finished cases of an existing run (requires --run-id) without re-running agents.",
+    )
+    ap.add_argument(
+        "--judge-jobs",
+        type=int,
+        default=None,
+        help="Run up to N judge passes concurrently, alongside the agent runs (default: same as --jobs).",
+    )
     ap.add_argument(
         "--timeout-s",
         type=int,
@@ -202,6 +1281,44 @@ def main(argv: list[str]) -> int:
         action="store_true",
         help="Continuously append progress to artifacts (progress.jsonl + partial summary).",
     )
+    ap.add_argument(
+        "--backend",
+        default="codex",
+        choices=["codex", "replay", "stub"],
+        help="Agent backend: codex (default), replay (serve a recorded run, see --replay-from) or stub (--stub-exec).",
+    )
+    ap.add_argument(
+        "--replay-from",
+        default=None,
+        help="Run id (under artifacts/skill-evals/) or run directory whose traces --backend replay serves.",
+    )
+    ap.add_argument(
+        "--stub-exec",
+        default=None,
+        help="Fake codex-compatible executable for --backend stub.",
+    )
+    ap.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Run every case even if an earlier run graded identical inputs (and do not record results).",
+    )
+    ap.add_argument(
+        "--cache-max-age",
+        type=_parse_age,
+        default=None,
+        help="Ignore cached results older than this (seconds, or with s/m/h/d suffix, e.g. 7d).",
+    )
+    ap.add_argument(
+        "--no-budget-kill",
+        action="store_true",
+        help="Let cases run to completion even after exceeding max_commands/token caps (checked afterwards only).",
+    )
+    ap.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Run up to N cases concurrently (default: 1). Summary rows keep the sequential order.",
+    )
     args = ap.parse_args(argv)
 
     # Status mode: no LLM calls, purely reads artifacts.
@@ -214,19 +1331,33 @@ def main(argv: list[str]) -> int:
             print(f"ERROR: unknown run id: {run_root}", file=sys.stderr)
             return 2
         partial = run_root / "summary.partial.json"
+        journal = run_root / "progress.jsonl"
         current = run_root / "current.json"
         summary = run_root / "summary.json"
+        if partial.exists() or journal.exists():
+            # Snapshot + bounded journal tail; never re-reads the whole run.
+            status = _status(run_root)
+            print(json.dumps(status, indent=2, sort_keys=True))
+            if status.get("status") != "finished" and current.exists():
+                print(current.read_text(encoding="utf-8", errors="replace"))
+            return 0
         if summary.exists():
             print(summary.read_text(encoding="utf-8", errors="replace"))
             return 0
-        if partial.exists():
-            print(partial.read_text(encoding="utf-8", errors="replace"))
-        if current.exists():
-            print(current.read_text(encoding="utf-8", errors="replace"))
-        if not partial.exists() and not current.exists():
-            print(f"No progress files found under {run_root}", file=sys.stderr)
+        print(f"No progress files found under {run_root}", file=sys.stderr)
         return 0
 
+    judge_schema = EVALS_ROOT / "schemas" / "style_rubric.schema.json"
+    if (args.judge or args.judge_only) and not judge_schema.exists():
+        print(f"ERROR: missing judge schema: {judge_schema}", file=sys.stderr)
+        return 2
+
+    if args.judge_only:
+        if not args.run_id:
+            print("ERROR: --judge-only requires --run-id", file=sys.stderr)
+            return 2
+        return _judge_only(args, judge_schema)
+
     # Background mode: spawn a detached child process that runs this script.
     if args.background:
         run_id = args.run_id or _now_run_id()
@@ -278,308 +1409,114 @@ def main(argv: list[str]) -> int:
     if run_root.exists() and not args.resume:
         print(f"ERROR: run id already exists (use --resume): {run_root}", file=sys.stderr)
         return 2
+    shard = f"{args.shard[0]}/{args.shard[1]}" if args.shard else None
+    if args.resume:
+        # A shard's progress only covers its own cases; resuming it as another shard would mix them.
+        try:
+            prev = json.loads((run_root / "summary.partial.json").read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            prev = {}
+        if isinstance(prev, dict) and "shard" in prev and prev["shard"] != shard:
+            print(f"ERROR: run {run_id} was started with --shard {prev['shard']}, not {shard}", file=sys.stderr)
+            return 2
     ensure_dir(run_root)
 
     snapshot_dir = run_root / "skills_snapshot"
     if not snapshot_dir.exists():
-        snapshot_skills_to_dir(skills, snapshot_dir)
-
-    judge_schema = EVALS_ROOT / "schemas" / "style_rubric.schema.json"
-    if args.judge and not judge_schema.exists():
-        print(f"ERROR: missing judge schema: {judge_schema}", file=sys.stderr)
+        # Hardlinks into the shared content-addressed store; only changed files are
+        # hashed and stored. `skill_snapshot_store.py gc` drops objects no run uses.
+        store = SnapshotStore(ARTIFACTS_ROOT / ".store")
+        manifest, snap = store.materialize(((s.slug, s.canonical_dir) for s in skills), snapshot_dir)
+        write_manifest(run_root, manifest)
+        print(
+            f"Snapshot: {snap.files} files ({snap.hashed} hashed, {snap.stored} new objects, "
+            f"{snap.linked} linked, {snap.copied} copied)",
+            file=sys.stderr,
+        )
+
+    replay_from: Optional[Path] = None
+    if args.replay_from:
+        replay_from = _resolve_run(args.replay_from)
+        if replay_from is None:
+            print(f"ERROR: unknown --replay-from run: {args.replay_from}", file=sys.stderr)
+            return 2
+    cache = _ResultCache(
+        None if args.no_cache else ARTIFACTS_ROOT / ".cache" / "results",
+        max_age_s=args.cache_max_age,
+    )
+    try:
+        backend = make_backend(args.backend, run_root=run_root, replay_from=replay_from, stub_exec=args.stub_exec)
+    except ValueError as e:
+        print(f"ERROR: {e}", file=sys.stderr)
         return 2
 
-    rows: list[dict[str, Any]] = []
-    progress_path = run_root / "progress.jsonl"
-    partial_summary_path = run_root / "summary.partial.json"
-    current_path = run_root / "current.json"
-
-    done: set[tuple[str, str]] = set()
-    if args.resume and progress_path.exists():
-        for line in progress_path.read_text(encoding="utf-8", errors="replace").splitlines():
-            try:
-                obj = __import__("json").loads(line)
-            except Exception:
-                continue
-            skill_slug = obj.get("skill_slug")
-            case_id = obj.get("case_id")
-            if isinstance(skill_slug, str) and isinstance(case_id, str):
-                done.add((skill_slug, case_id))
+    progress = _Progress(
+        run_root,
+        run_id=run_id,
+        suite=args.suite,
+        judge=bool(args.judge),
+        skills=len(skills),
+        enabled=bool(args.write_progress),
+        shard=shard,
+    )
+    done = progress.resume() if args.resume else set()
 
+    planned: list[tuple[Skill, PromptCase]] = []
     for skill in skills:
         cases = _select_cases(skill, args.suite, args.max_cases)
         if args.case:
             wanted_cases = set(args.case)
             cases = [c for c in cases if c.case_id in wanted_cases]
-        for case in cases:
-            if args.resume and (skill.slug, case.case_id) in done:
-                continue
-            print(f"[....] {skill.name} :: {case.case_id} (starting)", file=sys.stderr, flush=True)
-            case_dir = run_root / "work" / skill.slug / case.case_id
-            ensure_dir(case_dir)
-
-            # Provide pkbllm skills to codex via repo-scoped .codex/skills.
-            ensure_dir(case_dir / ".codex")
-            _safe_symlink_dir(snapshot_dir, case_dir / ".codex" / "skills")
-
-            # Ensure a stable materials path for skills that emit outputs.
-            human_material_path = case_dir / "human_materials"
-            ensure_dir(human_material_path)
-            # Many pkbllm scripts look for `.git` to locate the repo root. In real usage
-            # the human-materials repo is typically its own git repo; emulate that here.
-            try:
-                if not (human_material_path / ".git").exists():
-                    subprocess.run(
-                        ["git", "init", str(human_material_path)],
-                        check=False,
-                        stdout=subprocess.DEVNULL,
-                        stderr=subprocess.DEVNULL,
-                    )
-            except Exception:
-                pass
-
-            # Apply fixture, if any (copied into the case dir).
-            if case.fixture is not None and case.fixture.exists():
-                for child in case.fixture.iterdir():
-                    dst = case_dir / child.name
-                    if dst.exists():
-                        continue
-                    if child.is_dir():
-                        shutil.copytree(child, dst, copy_function=shutil.copy2)
-                    else:
-                        shutil.copy2(child, dst)
-
-            trace_path = case_dir / "trace.jsonl"
-            stderr_path = case_dir / "stderr.txt"
-            final_path = case_dir / "final.txt"
-            meta_path = case_dir / "meta.json"
-            grade_path = case_dir / "grade.json"
-
-            meta = {
-                "skill": {"name": skill.name, "slug": skill.slug},
-                "case": {"id": case.case_id, "should_trigger": case.should_trigger, "prompt": case.prompt},
-                "suite": args.suite,
-            }
-            write_json(meta_path, meta)
-
-            env_overrides = {
-                "HUMAN_MATERIAL_PATH": str(human_material_path),
-                "PKB_PATH": str(_repo_root()),
-            }
-
-            if args.write_progress:
-                write_json(
-                    current_path,
-                    {
-                        "ts": dt.datetime.now(dt.timezone.utc).isoformat(),
-                        "skill": skill.name,
-                        "skill_slug": skill.slug,
-                        "case_id": case.case_id,
-                        "case_dir": str(case_dir),
-                        "status": "running",
-                    },
-                )
-
-            run = run_codex_exec(
-                prompt=case.prompt,
-                work_dir=case_dir,
-                sandbox=case.sandbox or "workspace-write",
-                output_schema=case.output_schema,
-                output_last_message=final_path,
-                env_overrides=env_overrides,
-                timeout_s=max(1, int(case.timeout_s or args.timeout_s)),
-            )
-            write_text(trace_path, run.stdout)
-            write_text(stderr_path, run.stderr)
-
-            events = list(iter_jsonl_events(run.stdout))
-            det = deterministic_grade(codex_run=run, trace_events=events)
-
-            # Per-case deterministic checks
-            final_text = ""
-            try:
-                final_text = final_path.read_text(encoding="utf-8", errors="replace")
-            except Exception:
-                final_text = ""
-
-            case_checks: list[dict[str, Any]] = []
-            ok = bool(det.get("pass"))
-
-            # Structured-output checks (when an output schema is used).
-            parsed: Optional[dict[str, Any]] = None
-            if case.output_schema is not None:
-                try:
-                    parsed_obj = __import__("json").loads(final_text) if final_text.strip() else None
-                    parsed = parsed_obj if isinstance(parsed_obj, dict) else None
-                except Exception:
-                    parsed = None
-                if parsed is None:
-                    case_checks.append({"id": "final_json", "pass": False, "notes": "final.txt not valid JSON object"})
-                    ok = False
-                else:
-                    inv = parsed.get("invoked_skills")
-                    inv_list = inv if isinstance(inv, list) else []
-                    inv_strs = [x for x in inv_list if isinstance(x, str)]
-                    if case.should_trigger:
-                        passed = skill.name in inv_strs
-                        case_checks.append(
-                            {
-                                "id": "invoked_skills",
-                                "pass": passed,
-                                "notes": f"expected {skill.name!r} in invoked_skills",
-                            }
-                        )
-                        ok = ok and passed
-                    else:
-                        passed = skill.name not in inv_strs
-                        case_checks.append(
-                            {
-                                "id": "invoked_skills",
-                                "pass": passed,
-                                "notes": f"expected {skill.name!r} not in invoked_skills",
-                            }
-                        )
-                        ok = ok and passed
-
-            if case.max_commands is not None:
-                passed = int(det.get("command_count_effective") or 0) <= int(case.max_commands)
-                case_checks.append(
-                    {
-                        "id": "max_commands",
-                        "pass": passed,
-                        "notes": (
-                            f"effective={det.get('command_count_effective')} "
-                            f"total={det.get('command_count_total')} "
-                            f"max={case.max_commands}"
-                        ),
-                    }
-                )
-                ok = ok and passed
-
-            usage = det.get("usage") or {}
-            total_tokens = usage.get("total_tokens") if isinstance(usage, dict) else None
-            input_tokens = usage.get("input_tokens") if isinstance(usage, dict) else None
-            output_tokens = usage.get("output_tokens") if isinstance(usage, dict) else None
-
-            if case.max_total_tokens is not None and isinstance(total_tokens, int):
-                passed = total_tokens <= int(case.max_total_tokens)
-                case_checks.append({"id": "max_total_tokens", "pass": passed, "notes": f"{total_tokens} <= {case.max_total_tokens}"})
-                ok = ok and passed
-
-            if case.max_input_tokens is not None and isinstance(input_tokens, int):
-                passed = input_tokens <= int(case.max_input_tokens)
-                case_checks.append({"id": "max_input_tokens", "pass": passed, "notes": f"{input_tokens} <= {case.max_input_tokens}"})
-                ok = ok and passed
-
-            if case.max_output_tokens is not None and isinstance(output_tokens, int):
-                passed = output_tokens <= int(case.max_output_tokens)
-                case_checks.append({"id": "max_output_tokens", "pass": passed, "notes": f"{output_tokens} <= {case.max_output_tokens}"})
-                ok = ok and passed
-
-            for rel in case.require_files:
-                target = case_dir / rel
-                passed = target.exists()
-                case_checks.append({"id": "require_files", "pass": passed, "notes": rel})
-                ok = ok and passed
-
-            import re as _re
-
-            for pat in case.must_include:
-                passed = _re.search(pat, final_text, flags=_re.IGNORECASE | _re.MULTILINE) is not None
-                case_checks.append({"id": "must_include", "pass": passed, "notes": pat})
-                ok = ok and passed
-
-            for pat in case.must_not_include:
-                passed = _re.search(pat, final_text, flags=_re.IGNORECASE | _re.MULTILINE) is None
-                case_checks.append({"id": "must_not_include", "pass": passed, "notes": pat})
-                ok = ok and passed
-
-            det["pass"] = bool(ok)
-            write_json(grade_path, {"deterministic": det, "case_checks": case_checks})
-
-            judge: Optional[dict[str, Any]] = None
-            do_judge = (not bool(args.no_judge)) and (bool(args.judge) or bool(case.judge))
-            if do_judge:
-                judge = _judge_case(
-                    case_dir=case_dir,
-                    skill=skill,
-                    case=case,
-                    trace_path=trace_path,
-                    final_path=final_path,
-                    judge_schema=judge_schema,
-                    timeout_s=args.judge_timeout_s,
-                )
-                write_json(case_dir / "judge.normalized.json", judge)
-
-            overall_pass = bool(det.get("pass"))
-            notes = ""
-            if do_judge and judge is not None:
-                overall_pass = overall_pass and bool(judge.get("overall_pass") is True)
-                score = judge.get("score")
-                notes = f"judge score={score}" if isinstance(score, int) else "judge ran"
-
-            rows.append(
-                {
-                    "skill": skill.name,
-                    "skill_slug": skill.slug,
-                    "case_id": case.case_id,
-                    "should_trigger": case.should_trigger,
-                    "pass": overall_pass,
-                    "deterministic": det,
-                    "judge": judge,
-                    "case_dir": str(case_dir),
-                    "notes": notes,
-                }
-            )
-            status = "PASS" if overall_pass else "FAIL"
-            print(f"[{status}] {skill.name} :: {case.case_id} -> {case_dir}", file=sys.stderr, flush=True)
-
-            if args.write_progress:
-                record = {
-                    "ts": dt.datetime.now(dt.timezone.utc).isoformat(),
-                    "skill": skill.name,
-                    "skill_slug": skill.slug,
-                    "case_id": case.case_id,
-                    "pass": overall_pass,
-                    "case_dir": str(case_dir),
-                }
-                with progress_path.open("a", encoding="utf-8") as f:
-                    f.write(__import__("json").dumps(record) + "\n")
-                write_json(
-                    partial_summary_path,
-                    {
-                        "run_id": run_id,
-                        "suite": args.suite,
-                        "judge": bool(args.judge),
-                        "skills": len(skills),
-                        "cases_done": len(rows),
-                        "pass_count": sum(1 for r in rows if r.get("pass")),
-                        "fail_count": sum(1 for r in rows if not r.get("pass")),
-                        "last": record,
-                    },
-                )
-                write_json(
-                    current_path,
-                    {
-                        **record,
-                        "status": "completed",
-                    },
-                )
+        if args.shard:
+            cases = [c for c in cases if _shard_of(skill.slug, c.case_id, args.shard[1]) == args.shard[0]]
+        planned.extend((skill, case) for case in cases if (skill.slug, case.case_id) not in done)
+
+    workspaces = _Workspaces(run_root, snapshot_dir)
+
+    def run_one(item: tuple[Skill, PromptCase]) -> Union[dict[str, Any], Future]:
+        skill, case = item
+        return _run_case(
+            skill,
+            case,
+            args=args,
+            run_root=run_root,
+            workspaces=workspaces,
+            judge_schema=judge_schema,
+            progress=progress,
+            backend=backend,
+            cache=cache,
+            judges=judges,
+        )
+
+    # Every case has its own case_dir and fake HOME, so cases can run side by side;
+    # `map` keeps rows in planned order whatever order they finish in. Judges run in
+    # their own pool, so judging a case overlaps with the next agent runs.
+    jobs = max(1, int(args.jobs))
+    judges = ThreadPoolExecutor(max_workers=max(1, int(args.judge_jobs or jobs)))
+    try:
+        with judges:
+            if jobs > 1 and len(planned) > 1:
+                with ThreadPoolExecutor(max_workers=min(jobs, len(planned))) as pool:
+                    results = list(pool.map(run_one, planned))
+            else:
+                results = [run_one(item) for item in planned]
+            rows = [r.result() if isinstance(r, Future) else r for r in results]
+    finally:
+        progress.close()
 
     summary_json = run_root / "summary.json"
     summary_md = run_root / "summary.md"
     write_json(
         summary_json,
-        {
-            "run_id": run_id,
-            "suite": args.suite,
-            "judge": bool(args.judge),
-            "skills": len(skills),
-            "cases": len(rows),
-            "pass_count": sum(1 for r in rows if r.get("pass")),
-            "fail_count": sum(1 for r in rows if not r.get("pass")),
-            "rows": rows,
-        },
+        _summary(
+            rows,
+            run_id=run_id,
+            suite=args.suite,
+            judge=bool(args.judge),
+            skills=len(skills),
+            shard=shard,
+            backend=backend.name,
+        ),
     )
     write_text(summary_md, summarize_markdown(rows))
 
@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import shutil
+import stat
+import sys
+import zipfile
+from pathlib import Path, PurePosixPath
+from typing import Any, Iterable, Optional
+
+from skill_manifest import is_current
+
+
+ROOT = Path(__file__).resolve().parents[2]
+MANIFEST_NAME = "manifest.json"
+
+# Fixed member timestamp so packing the same mirror twice yields identical bytes.
+_ZIP_EPOCH = (1980, 1, 1, 0, 0, 0)
+
+
+def default_bundle_path(root: Path = ROOT) -> Path:
+    return root / "artifacts" / "skills-bundle.zip"
+
+
+def _check_slug(slug: object) -> str:
+    """`slug` if it is a single safe path component, else ValueError (slugs come from the bundle)."""
+    if not isinstance(slug, str) or slug in {"", ".", ".."} or "/" in slug or "\\" in slug or "\0" in slug:
+        raise ValueError(f"unsafe skill slug in bundle: {slug!r}")
+    return slug
+
+
+def _member(slug: str, rel: str) -> str:
+    return f"{slug}/{rel}"
+
+
+def write_bundle(skills_root: Path, out_path: Path, *, compresslevel: int = 6) -> int:
+    """
+    Pack `skills_root/manifest.json` and every skill it lists into one zip file.
+
+    Members are written slug by slug in sorted order, so extracting a subset is a
+    forward read through the archive. Returns the number of files packed.
+    """
+    manifest = json.loads((skills_root / MANIFEST_NAME).read_text(encoding="utf-8"))
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = out_path.with_name(f".{out_path.name}.tmp-{os.getpid()}")
+    count = 0
+    try:
+        with zipfile.ZipFile(tmp, "w", compression=zipfile.ZIP_DEFLATED, compresslevel=compresslevel) as zf:
+            info = zipfile.ZipInfo(MANIFEST_NAME, date_time=_ZIP_EPOCH)
+            info.external_attr = 0o644 << 16
+            zf.writestr(info, json.dumps(manifest, indent=2, sort_keys=True) + "\n", compress_type=zipfile.ZIP_DEFLATED)
+            for entry in sorted(manifest, key=lambda e: e["slug"]):
+                slug = entry["slug"]
+                skill_dir = skills_root / slug
+                files = entry.get("files")
+                if not isinstance(files, dict):
+                    raise ValueError(f"manifest entry for {slug!r} has no file list; rebuild the mirror first")
+                for rel in sorted(files):
+                    src = skill_dir / rel
+                    mode = stat.S_IMODE(src.stat().st_mode)
+                    info = zipfile.ZipInfo(_member(slug, rel), date_time=_ZIP_EPOCH)
+                    info.external_attr = (stat.S_IFREG | mode) << 16
+                    info.compress_type = zipfile.ZIP_DEFLATED
+                    with src.open("rb") as fsrc, zf.open(info, "w") as fdst:
+                        shutil.copyfileobj(fsrc, fdst, 1024 * 1024)
+                    count += 1
+        os.replace(tmp, out_path)
+    finally:
+        tmp.unlink(missing_ok=True)
+    return count
+
+
+class SkillBundle:
+    """Read side of a packed bundle; the zip central directory is the index."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._zf = zipfile.ZipFile(path)
+        try:
+            self.manifest: list[dict[str, Any]] = json.loads(self._zf.read(MANIFEST_NAME))
+            # Slugs become directory names under the install root.
+            self._by_slug = {_check_slug(e["slug"]): e for e in self.manifest if isinstance(e, dict) and "slug" in e}
+        except BaseException:
+            self._zf.close()
+            raise
+
+    def __enter__(self) -> "SkillBundle":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._zf.close()
+
+    def slugs(self) -> list[str]:
+        return sorted(self._by_slug)
+
+    def entry(self, slug: str) -> Optional[dict[str, Any]]:
+        return self._by_slug.get(slug)
+
+    def extract(self, slugs: Iterable[str], dest_root: Path, *, skip_current: bool = True) -> tuple[list[str], list[str]]:
+        """
+        Install `slugs` as `dest_root/<slug>/`, replacing whatever is there.
+
+        Copies whose content already matches the bundled manifest are left alone when
+        `skip_current` is set. Returns (extracted, unchanged) slugs.
+        """
+        wanted: set[str] = set()
+        unchanged: list[str] = []
+        for slug in slugs:
+            entry = self._by_slug.get(slug)
+            if entry is None:
+                raise KeyError(f"skill {slug!r} is not in bundle {self.path}")
+            dst = dest_root / slug
+            if skip_current and not dst.is_symlink() and is_current(entry, dst):
+                unchanged.append(slug)
+            else:
+                wanted.add(slug)
+
+        staged: dict[str, Path] = {}
+        try:
+            # Members are grouped by slug, so this is one forward pass over the archive.
+            for info in self._zf.infolist():
+                slug, _, rel = info.filename.partition("/")
+                if slug not in wanted or not rel or info.is_dir():
+                    continue
+                rel_path = PurePosixPath(rel)
+                if rel_path.is_absolute() or ".." in rel_path.parts:
+                    raise ValueError(f"unsafe path in bundle: {info.filename!r}")
+                staging = staged.get(slug)
+                if staging is None:
+                    staging = staged[slug] = dest_root / f".{slug}.bundle-{os.getpid()}"
+                    if staging.exists():
+                        shutil.rmtree(staging)
+                    staging.mkdir(parents=True)
+                target = staging.joinpath(*rel_path.parts)
+                target.parent.mkdir(parents=True, exist_ok=True)
+                with self._zf.open(info) as fsrc, target.open("wb") as fdst:
+                    shutil.copyfileobj(fsrc, fdst, 1024 * 1024)
+                mode = stat.S_IMODE(info.external_attr >> 16)
+                if mode:
+                    os.chmod(target, mode)
+
+            for slug in sorted(wanted):
+                dst = dest_root / slug
+                staging = staged.pop(slug, None)
+                if staging is None:
+                    # A skill with no files still gets its (empty) folder.
+                    staging = dest_root / f".{slug}.bundle-{os.getpid()}"
+                    staging.mkdir(parents=True, exist_ok=True)
+                if dst.is_symlink() or dst.is_file():
+                    dst.unlink()
+                elif dst.exists():
+                    shutil.rmtree(dst)
+                os.rename(staging, dst)
+        finally:
+            for staging in staged.values():
+                shutil.rmtree(staging, ignore_errors=True)
+        return sorted(wanted), unchanged
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    ap = argparse.ArgumentParser(description="Inspect or install from a packed pkbllm skills bundle.")
+    ap.add_argument("bundle", help="Path to a bundle written by `update_skills_mirror.py pack`.")
+    ap.add_argument("--list", action="store_true", help="List bundled skills and exit.")
+    ap.add_argument("--install-root", default="", help="Extract skills into this directory.")
+    ap.add_argument("--skill", action="append", default=[], help="Skill slug to extract (repeatable; default: all).")
+    args = ap.parse_args(argv)
+
+    with SkillBundle(Path(args.bundle).expanduser()) as bundle:
+        if args.list or not args.install_root:
+            for slug in bundle.slugs():
+                entry = bundle.entry(slug) or {}
+                print(f"{slug}\t{entry.get('bytes', '?')} B\t~{entry.get('est_tokens', '?')} tokens")
+            return 0
+        dest_root = Path(args.install_root).expanduser()
+        dest_root.mkdir(parents=True, exist_ok=True)
+        extracted, unchanged = bundle.extract(args.skill or bundle.slugs(), dest_root)
+    print(f"Extracted {len(extracted)} skill(s), {len(unchanged)} already current -> {dest_root}", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
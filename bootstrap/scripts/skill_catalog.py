@@ -0,0 +1,313 @@
+#!/usr/bin/env python3
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import sys
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Iterable, Optional
+
+from skill_frontmatter import parse_frontmatter
+
+
+ROOT = Path(__file__).resolve().parents[2]
+CANONICAL_ROOT_NAMES = ("bootstrap", "common", "human", "knowledge", "productivity")
+CATALOG_VERSION = 2
+
+# Entries whose mtime falls within this window of the previous scan may have been
+# modified in the same timestamp tick without a visible stat change; re-read them.
+_RACY_WINDOW_NS = 2_000_000_000
+
+
+def default_index_path(root: Path = ROOT) -> Path:
+    return root / "artifacts" / "skill-catalog.json"
+
+
+_SLUG_BAD = re.compile(r"[^a-z0-9._-]+")
+
+
+def skill_slug(name: str) -> str:
+    slug = name.strip().lower()
+    slug = re.sub(r"\s+", "-", slug)
+    slug = slug.replace("/", "").replace("\\", "").replace(":", "")
+    slug = _SLUG_BAD.sub("-", slug).strip("-")
+    if not slug:
+        raise ValueError(f"Could not slugify skill name: {name!r}")
+    return slug
+
+
+@dataclass(frozen=True)
+class CatalogEntry:
+    """One canonical skill, keyed by its directory relative to the repo root."""
+
+    path: str
+    name: str
+    slug: str
+    description: str
+    license: str
+    size: int
+    mtime_ns: int
+    sha256: str
+    has_frontmatter: bool = True
+
+    def skill_dir(self, root: Path = ROOT) -> Path:
+        return root / self.path
+
+    def skill_md(self, root: Path = ROOT) -> Path:
+        return root / self.path / "SKILL.md"
+
+
+def _entry_sort_key(entry: CatalogEntry) -> list[str]:
+    # Match `sorted(Path(...))` ordering (component-wise), which callers relied on.
+    return entry.path.split("/")
+
+
+def _read_entry(root: Path, rel_dir: str, st: os.stat_result) -> CatalogEntry:
+    data = (root / rel_dir / "SKILL.md").read_bytes()
+    fm = parse_frontmatter(data.decode("utf-8", errors="replace").splitlines())
+    name = ((fm or {}).get("name") or "").strip()
+    try:
+        slug = skill_slug(name) if name else ""
+    except ValueError:
+        slug = ""
+    return CatalogEntry(
+        path=rel_dir,
+        name=name,
+        slug=slug,
+        description=((fm or {}).get("description") or "").strip(),
+        license=((fm or {}).get("license") or "").strip(),
+        size=st.st_size,
+        mtime_ns=st.st_mtime_ns,
+        sha256=hashlib.sha256(data).hexdigest(),
+        has_frontmatter=fm is not None,
+    )
+
+
+class SkillCatalog:
+    """
+    In-memory view of the on-disk skill index.
+
+    Entries are sorted by path, so iteration order is stable across runs.
+    `parse_times` maps the path of every SKILL.md re-read during this load to the
+    seconds spent reading and parsing it (entries served from the index are absent).
+    """
+
+    def __init__(
+        self, root: Path, entries: Iterable[CatalogEntry], parse_times: Optional[dict[str, float]] = None
+    ) -> None:
+        self.root = root
+        self.entries: list[CatalogEntry] = sorted(entries, key=_entry_sort_key)
+        self.parse_times: dict[str, float] = dict(parse_times or {})
+        self._by_path = {e.path: e for e in self.entries}
+        self._by_name: dict[str, CatalogEntry] = {}
+        self._by_slug: dict[str, CatalogEntry] = {}
+        for e in self.entries:
+            if e.name:
+                self._by_name.setdefault(e.name, e)
+            if e.slug:
+                self._by_slug.setdefault(e.slug, e)
+
+    def __iter__(self):
+        return iter(self.entries)
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def under(self, path: Path) -> list[CatalogEntry]:
+        """Entries whose skill directory is `path` or lives below it."""
+        try:
+            rel = path.resolve().relative_to(self.root.resolve()).as_posix()
+        except ValueError:
+            return []
+        if rel == ".":
+            return list(self.entries)
+        prefix = rel + "/"
+        return [e for e in self.entries if e.path == rel or e.path.startswith(prefix)]
+
+    def by_path(self, skill_dir: Path) -> Optional[CatalogEntry]:
+        try:
+            rel = skill_dir.resolve().relative_to(self.root.resolve()).as_posix()
+        except ValueError:
+            return None
+        return self._by_path.get(rel)
+
+    def by_name(self, name: str) -> Optional[CatalogEntry]:
+        return self._by_name.get(name)
+
+    def by_slug(self, slug: str) -> Optional[CatalogEntry]:
+        return self._by_slug.get(slug)
+
+
+class _Scanner:
+    def __init__(self, root: Path, previous: dict[str, Any]) -> None:
+        self.root = root
+        self.prev_entries: dict[str, dict[str, Any]] = {
+            e["path"]: e for e in previous.get("skills", []) if isinstance(e, dict) and "path" in e
+        }
+        self.prev_dirs: dict[str, dict[str, Any]] = previous.get("dirs", {}) or {}
+        self.trusted_before_ns = int(previous.get("scanned_at_ns") or 0) - _RACY_WINDOW_NS
+        self.dirs: dict[str, dict[str, Any]] = {}
+        self.entries: list[CatalogEntry] = []
+        self.parse_times: dict[str, float] = {}
+        self.reread = 0
+
+    def _trusted(self, cached: Optional[dict[str, Any]], st: os.stat_result) -> bool:
+        return (
+            cached is not None
+            and cached.get("mtime_ns") == st.st_mtime_ns
+            and st.st_mtime_ns < self.trusted_before_ns
+        )
+
+    def scan(self, rel_dir: str) -> None:
+        abs_dir = self.root / rel_dir
+        try:
+            st = os.stat(abs_dir)
+        except OSError:
+            return
+        cached = self.prev_dirs.get(rel_dir)
+        if self._trusted(cached, st):
+            subdirs = list(cached["subdirs"])
+            has_skill = bool(cached["skill"])
+        else:
+            subdirs = []
+            has_skill = False
+            try:
+                with os.scandir(abs_dir) as it:
+                    for entry in it:
+                        if entry.name == "SKILL.md" and entry.is_file():
+                            has_skill = True
+                        elif not entry.name.startswith(".") and entry.is_dir(follow_symlinks=False):
+                            subdirs.append(entry.name)
+            except OSError:
+                return
+            subdirs.sort()
+        self.dirs[rel_dir] = {"mtime_ns": st.st_mtime_ns, "subdirs": subdirs, "skill": has_skill}
+
+        if has_skill:
+            self._scan_skill(rel_dir)
+        for name in subdirs:
+            self.scan(f"{rel_dir}/{name}")
+
+    def _scan_skill(self, rel_dir: str) -> None:
+        try:
+            st = os.stat(self.root / rel_dir / "SKILL.md")
+        except OSError:
+            return
+        cached = self.prev_entries.get(rel_dir)
+        if self._trusted(cached, st) and cached.get("size") == st.st_size:
+            try:
+                self.entries.append(CatalogEntry(**cached))
+                return
+            except TypeError:
+                pass
+        start = time.perf_counter()
+        self.entries.append(_read_entry(self.root, rel_dir, st))
+        self.parse_times[rel_dir] = time.perf_counter() - start
+        self.reread += 1
+
+
+def _load_index(index_path: Path, root: Path) -> dict[str, Any]:
+    try:
+        data = json.loads(index_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict):
+        return {}
+    if data.get("version") != CATALOG_VERSION or data.get("root") != str(root):
+        return {}
+    return data
+
+
+def _write_index(index_path: Path, payload: dict[str, Any]) -> None:
+    # Best-effort: a read-only checkout still gets a correct (just uncached) catalog.
+    try:
+        index_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = index_path.with_name(f".{index_path.name}.{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(payload, sort_keys=True) + "\n", encoding="utf-8")
+        os.replace(tmp, index_path)
+    except OSError:
+        pass
+
+
+def load_catalog(
+    root: Path = ROOT,
+    *,
+    index_path: Optional[Path] = None,
+    refresh: bool = True,
+    write: bool = True,
+) -> SkillCatalog:
+    """
+    Load the skill catalog for `root`, refreshing only entries whose stat changed.
+
+    With `refresh=False` the on-disk index is trusted as-is (falling back to a scan
+    when no index exists yet).
+    """
+    root = root.resolve()
+    index_path = index_path or default_index_path(root)
+    previous = _load_index(index_path, root)
+
+    if previous and not refresh:
+        entries = []
+        for raw in previous.get("skills", []):
+            try:
+                entries.append(CatalogEntry(**raw))
+            except TypeError:
+                continue
+        return SkillCatalog(root, entries)
+
+    scanned_at_ns = time.time_ns()
+    scanner = _Scanner(root, previous)
+    for name in CANONICAL_ROOT_NAMES:
+        scanner.scan(name)
+
+    dirty = (
+        not previous
+        or scanner.reread > 0
+        or scanner.dirs != previous.get("dirs")
+        or len(scanner.entries) != len(previous.get("skills", []))
+    )
+    if write and dirty:
+        _write_index(
+            index_path,
+            {
+                "version": CATALOG_VERSION,
+                "root": str(root),
+                "scanned_at_ns": scanned_at_ns,
+                "skills": [asdict(e) for e in sorted(scanner.entries, key=_entry_sort_key)],
+                "dirs": scanner.dirs,
+            },
+        )
+    return SkillCatalog(root, scanner.entries, scanner.parse_times)
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    ap = argparse.ArgumentParser(description="Refresh and query the canonical skill catalog index.")
+    ap.add_argument("command", nargs="?", default="refresh", choices=["refresh", "list"], help="What to do.")
+    ap.add_argument("--rebuild", action="store_true", help="Ignore the existing index and rescan everything.")
+    args = ap.parse_args(argv)
+
+    index_path = default_index_path(ROOT)
+    if args.rebuild and index_path.exists():
+        index_path.unlink()
+
+    start = time.perf_counter()
+    catalog = load_catalog(ROOT, index_path=index_path)
+    elapsed = time.perf_counter() - start
+
+    if args.command == "list":
+        for e in catalog:
+            print(f"{e.name or '(unnamed)'}  ({e.path})")
+        return 0
+
+    print(f"Skills: {len(catalog)} ({elapsed * 1000:.1f} ms) -> {index_path}", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,25 +1,24 @@
 from __future__ import annotations
 
 import csv
+import hashlib
 import json
 import os
 import re
+import shutil
+import signal
 import subprocess
+import threading
 import time
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Iterable, Optional
+from typing import Any, Callable, Iterable, Optional
 
+from skill_catalog import load_catalog
+from skill_frontmatter import read_frontmatter as _read_frontmatter
 
-REPO_ROOT = Path(__file__).resolve().parents[2]
-CANONICAL_ROOTS = [
-    REPO_ROOT / "bootstrap",
-    REPO_ROOT / "common",
-    REPO_ROOT / "human",
-    REPO_ROOT / "knowledge",
-    REPO_ROOT / "productivity",
-]
 
+REPO_ROOT = Path(__file__).resolve().parents[2]
 EVALS_ROOT = REPO_ROOT / "evals"
 EVALS_SKILLS_ROOT = EVALS_ROOT / "skills"
 ARTIFACTS_ROOT = REPO_ROOT / "artifacts" / "skill-evals"
@@ -55,10 +54,32 @@ class PromptCase:
 
 @dataclass(frozen=True)
 class CodexRun:
+    """
+    Result of one `codex exec`. When the run was streamed to files, `stdout`/`stderr`
+    are empty and `trace_path`/`stderr_path` hold the output instead. `stop_reason`
+    is set when an `on_event` callback ended the run early.
+    """
+
     exit_code: int
     stdout: str
     stderr: str
     duration_s: float
+    trace_path: Optional[Path] = None
+    stderr_path: Optional[Path] = None
+    stop_reason: Optional[str] = None
+
+    def iter_events(self) -> Iterable[dict[str, Any]]:
+        if self.trace_path is None:
+            return iter_jsonl_events(self.stdout)
+        return iter_trace_events(self.trace_path)
+
+    def reduce(self) -> "TraceReducer":
+        """One pass over the recorded output (see `TraceReducer`)."""
+        if self.trace_path is None:
+            return TraceReducer.from_text(self.stdout)
+        if not self.trace_path.exists():
+            return TraceReducer()
+        return TraceReducer.from_trace(self.trace_path)
 
 
 _SLUG_BAD = re.compile(r"[^a-z0-9._-]+")
@@ -75,47 +96,29 @@ def skill_slug(name: str) -> str:
 
 
 def read_frontmatter(skill_md: Path) -> dict[str, str]:
-    lines = skill_md.read_text(encoding="utf-8", errors="replace").splitlines()
-    if not lines or lines[0].strip() != "---":
+    fm = _read_frontmatter(skill_md)
+    if fm is None:
         raise ValueError(f"SKILL.md missing frontmatter (expected leading '---'): {skill_md}")
-    out: dict[str, str] = {}
-    for line in lines[1:250]:
-        if line.strip() == "---":
-            break
-        if ":" not in line:
-            continue
-        key, value = line.split(":", 1)
-        key = key.strip()
-        value = value.strip().strip("'\"")
-        if key and key not in out:
-            out[key] = value
-    return out
+    return fm
 
 
 def discover_skills() -> list[Skill]:
-    skill_mds: list[Path] = []
-    for root in CANONICAL_ROOTS:
-        if not root.exists():
-            continue
-        skill_mds.extend(p for p in root.rglob("SKILL.md") if p.name == "SKILL.md")
-    skill_mds = sorted(set(skill_mds))
-
     skills: list[Skill] = []
     seen_slugs: dict[str, Path] = {}
-    for skill_md in skill_mds:
-        fm = read_frontmatter(skill_md)
-        name = (fm.get("name") or "").strip()
-        description = (fm.get("description") or "").strip()
-        if not name:
+    for entry in load_catalog(REPO_ROOT):
+        skill_md = entry.skill_md(REPO_ROOT)
+        if not entry.has_frontmatter:
+            raise ValueError(f"SKILL.md missing frontmatter (expected leading '---'): {skill_md}")
+        if not entry.name:
             raise ValueError(f"Missing frontmatter name: {skill_md}")
-        slug = skill_slug(name)
+        slug = skill_slug(entry.name)
         if slug in seen_slugs:
             raise ValueError(f"slug collision: {slug!r} from {skill_md} and {seen_slugs[slug]}")
         seen_slugs[slug] = skill_md
         skills.append(
             Skill(
-                name=name,
-                description=description,
+                name=entry.name,
+                description=entry.description,
                 canonical_dir=skill_md.parent,
                 skill_md=skill_md,
                 slug=slug,
@@ -250,23 +253,11 @@ def write_text(path: Path, content: str) -> None:
 
 
 def write_json(path: Path, obj: Any) -> None:
+    # Atomic replace: readers (e.g. `--status`) never see a half-written file.
     ensure_dir(path.parent)
-    path.write_text(json.dumps(obj, indent=2, sort_keys=True) + "\n", encoding="utf-8")
-
-
-def snapshot_skills_to_dir(skills: Iterable[Skill], snapshot_dir: Path) -> None:
-    """
-    Create a snapshot of canonical skills in `snapshot_dir/<skill-slug>/...`.
-    Intended to be referenced from eval workspaces via symlink.
-    """
-    import shutil
-
-    ensure_dir(snapshot_dir)
-    for s in skills:
-        dst = snapshot_dir / s.slug
-        if dst.exists():
-            shutil.rmtree(dst)
-        shutil.copytree(s.canonical_dir, dst, copy_function=shutil.copy2)
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    tmp.write_text(json.dumps(obj, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+    os.replace(tmp, path)
 
 
 def _safe_env_for_codex(base_env: dict[str, str], fake_home: Path) -> dict[str, str]:
@@ -288,13 +279,24 @@ def run_codex_exec(
     extra_args: Optional[list[str]] = None,
     env_overrides: Optional[dict[str, str]] = None,
     timeout_s: int = 60 * 20,
+    trace_path: Optional[Path] = None,
+    stderr_path: Optional[Path] = None,
+    on_event: Optional[Callable[[dict[str, Any]], Optional[str]]] = None,
+    executable: str = "codex",
 ) -> CodexRun:
     """
     Runs codex non-interactively in `work_dir` and captures stdout/stderr.
 
+    stdout is consumed line by line as codex writes it. With `trace_path` (and
+    `stderr_path`) the output is teed to those files and flushed per line instead of
+    being held in memory, so a timeout or crash keeps everything streamed so far.
+    `on_event` is called with each parsed JSONL event as it arrives; if it returns a
+    reason string, codex is killed right away and the reason lands in `stop_reason`.
+
     Notes:
     - Uses `--skip-git-repo-check` since eval workspaces are often not git repos.
     - Sets HOME to an empty directory inside the workspace to avoid loading user-level skills/config.
+    - codex runs in its own process group; a timeout kills the whole group.
     """
     ensure_dir(work_dir)
     fake_home = work_dir / ".eval_home"
@@ -323,7 +325,7 @@ def run_codex_exec(
         pass
 
     args: list[str] = [
-        "codex",
+        executable,
         "exec",
         "--json",
         "--sandbox",
@@ -343,79 +345,341 @@ def run_codex_exec(
     args.append(prompt)
 
     start = time.time()
+    out_f = trace_path.open("w", encoding="utf-8") if trace_path is not None else None
+    err_f = stderr_path.open("w", encoding="utf-8") if stderr_path is not None else None
+    out_chunks: list[str] = []
+    err_chunks: list[str] = []
+    stop_reason: Optional[str] = None
     try:
-        res = subprocess.run(
+        with subprocess.Popen(
             args,
             cwd=str(work_dir),
             env={
                 **_safe_env_for_codex(os.environ, fake_home),
                 **(env_overrides or {}),
             },
+            stdout=subprocess.PIPE,
+            stderr=err_f if err_f is not None else subprocess.PIPE,
             text=True,
-            capture_output=True,
-            timeout=timeout_s,
-        )
-        end = time.time()
-        return CodexRun(
-            exit_code=int(res.returncode),
-            stdout=res.stdout,
-            stderr=res.stderr,
-            duration_s=end - start,
+            encoding="utf-8",
+            errors="replace",
+            start_new_session=True,
+        ) as proc:
+            timed_out = threading.Event()
+
+            def _on_timeout() -> None:
+                timed_out.set()
+                kill_process_group(proc)
+
+            timer = threading.Timer(timeout_s, _on_timeout)
+            timer.daemon = True
+            timer.start()
+            drain: Optional[threading.Thread] = None
+            if proc.stderr is not None:
+                drain = threading.Thread(target=lambda: err_chunks.extend(proc.stderr), daemon=True)  # type: ignore[arg-type]
+                drain.start()
+            assert proc.stdout is not None
+            try:
+                for line in proc.stdout:
+                    if out_f is not None:
+                        out_f.write(line)
+                        out_f.flush()
+                    else:
+                        out_chunks.append(line)
+                    if on_event is not None:
+                        event = _parse_event_line(line)
+                        reason = on_event(event) if event is not None else None
+                        if reason and stop_reason is None:
+                            stop_reason = reason
+                            kill_process_group(proc)
+            except BaseException:
+                # Don't wait on a live codex while a callback or trace-write error propagates.
+                kill_process_group(proc)
+                raise
+            finally:
+                proc.stdout.close()
+                # codex may close stdout before exiting; the timer still bounds the wait.
+                proc.wait()
+                timer.cancel()
+                if drain is not None:
+                    drain.join()
+
+        exit_code = int(proc.returncode)
+        note = ""
+        if stop_reason is not None:
+            note = f"STOPPED: {stop_reason}\n"
+        elif timed_out.is_set():
+            exit_code = 124
+            note = f"TIMEOUT after {timeout_s}s\n"
+        if note:
+            if err_f is not None:
+                err_f.write(note)
+            else:
+                stderr = "".join(err_chunks)
+                err_chunks[:] = [(stderr + "\n" if stderr else "") + note]
+    finally:
+        for f in (out_f, err_f):
+            if f is not None:
+                f.close()
+
+    end = time.time()
+    return CodexRun(
+        exit_code=exit_code,
+        stdout="".join(out_chunks),
+        stderr="".join(err_chunks),
+        duration_s=end - start,
+        trace_path=trace_path,
+        stderr_path=stderr_path,
+        stop_reason=stop_reason,
+    )
+
+
+EventCallback = Callable[[dict[str, Any]], Optional[str]]
+
+
+class AgentBackend:
+    """
+    Runs one agent invocation for the eval runner.
+
+    `exec` takes the keyword arguments of `run_codex_exec` (minus `extra_args` and
+    `executable`) and returns a `CodexRun`.
+    """
+
+    name = "codex"
+
+    def __init__(self, executable: str = "codex") -> None:
+        self.executable = executable
+
+    def fingerprint(self) -> dict[str, Any]:
+        """Settings that decide what the agent does (model config included), for result-cache keys."""
+        config = Path(os.path.expanduser("~")) / ".codex" / "config.toml"
+        return {"backend": self.name, "executable": self.executable, "config_sha256": file_sha256(config)}
+
+    def exec(
+        self,
+        *,
+        prompt: str,
+        work_dir: Path,
+        sandbox: str,
+        output_schema: Optional[Path] = None,
+        output_last_message: Optional[Path] = None,
+        env_overrides: Optional[dict[str, str]] = None,
+        timeout_s: int = 60 * 20,
+        trace_path: Optional[Path] = None,
+        stderr_path: Optional[Path] = None,
+        on_event: Optional[EventCallback] = None,
+    ) -> CodexRun:
+        return run_codex_exec(
+            prompt=prompt,
+            work_dir=work_dir,
+            sandbox=sandbox,
+            output_schema=output_schema,
+            output_last_message=output_last_message,
+            env_overrides=env_overrides,
+            timeout_s=timeout_s,
+            trace_path=trace_path,
+            stderr_path=stderr_path,
+            on_event=on_event,
+            executable=self.executable,
         )
-    except subprocess.TimeoutExpired as e:
-        end = time.time()
-        stdout = e.stdout if isinstance(e.stdout, str) else ""
-        stderr = e.stderr if isinstance(e.stderr, str) else ""
-        stderr = (stderr + "\n" if stderr else "") + f"TIMEOUT after {timeout_s}s\n"
+
+
+class StubBackend(AgentBackend):
+    """
+    Runs a local fake executable with the same command line and isolated HOME as
+    codex. It must accept `exec --json ... <prompt>` and print JSONL on stdout.
+    """
+
+    name = "stub"
+
+    def __init__(self, executable: str) -> None:
+        super().__init__(str(Path(executable).resolve()))
+
+    def fingerprint(self) -> dict[str, Any]:
+        return {"backend": self.name, "executable": self.executable, "sha256": file_sha256(Path(self.executable))}
+
+
+class ReplayBackend(AgentBackend):
+    """
+    Serves recorded output from a previous run instead of starting an agent.
+
+    A call in `<target_root>/<rel>` replays `<source_root>/<rel>`: the recorded
+    trace/stderr files named like `trace_path`/`stderr_path`, and the file named like
+    `output_last_message` (final.txt for cases, judge.json for judge runs). The exit
+    code comes from the recorded grade.json. Events still go through `on_event`, so
+    budget enforcement stops a replay early just like a live run.
+    """
+
+    name = "replay"
+
+    def __init__(self, source_root: Path, target_root: Path) -> None:
+        super().__init__()
+        self.source_root = source_root
+        self.target_root = target_root
+
+    def fingerprint(self) -> dict[str, Any]:
+        return {"backend": self.name, "source": str(self.source_root.resolve())}
+
+    def exec(
+        self,
+        *,
+        prompt: str,
+        work_dir: Path,
+        sandbox: str,
+        output_schema: Optional[Path] = None,
+        output_last_message: Optional[Path] = None,
+        env_overrides: Optional[dict[str, str]] = None,
+        timeout_s: int = 60 * 20,
+        trace_path: Optional[Path] = None,
+        stderr_path: Optional[Path] = None,
+        on_event: Optional[EventCallback] = None,
+    ) -> CodexRun:
+        start = time.time()
+        ensure_dir(work_dir)
+        try:
+            src_dir = self.source_root / work_dir.resolve().relative_to(self.target_root.resolve())
+        except ValueError:
+            src_dir = self.source_root / work_dir.name
+        if not src_dir.is_dir():
+            return self._finish(
+                start, 127, [], f"replay: no recording at {src_dir}\n", trace_path, stderr_path, None
+            )
+
+        exit_code = 0
+        try:
+            det = json.loads((src_dir / "grade.json").read_text(encoding="utf-8")).get("deterministic") or {}
+            if trace_path is not None and isinstance(det.get("exit_code"), int):
+                exit_code = det["exit_code"]
+        except (OSError, ValueError, AttributeError):
+            pass
+
+        if output_last_message is not None:
+            recorded = src_dir / output_last_message.name
+            if recorded.exists():
+                ensure_dir(output_last_message.parent)
+                shutil.copyfile(recorded, output_last_message)
+            elif trace_path is None:
+                exit_code = 1
+
+        lines: list[str] = []
+        stop_reason: Optional[str] = None
+        if trace_path is not None and (src_dir / trace_path.name).exists():
+            with (src_dir / trace_path.name).open("r", encoding="utf-8", errors="replace") as f:
+                for line in f:
+                    lines.append(line)
+                    event = _parse_event_line(line) if on_event is not None else None
+                    reason = on_event(event) if event is not None and on_event is not None else None
+                    if reason:
+                        stop_reason = reason
+                        exit_code = -signal.SIGKILL
+                        break
+
+        stderr = ""
+        if stderr_path is not None and (src_dir / stderr_path.name).exists():
+            stderr = (src_dir / stderr_path.name).read_text(encoding="utf-8", errors="replace")
+        if stop_reason is not None:
+            stderr += f"STOPPED: {stop_reason}\n"
+        return self._finish(start, exit_code, lines, stderr, trace_path, stderr_path, stop_reason)
+
+    @staticmethod
+    def _finish(
+        start: float,
+        exit_code: int,
+        lines: list[str],
+        stderr: str,
+        trace_path: Optional[Path],
+        stderr_path: Optional[Path],
+        stop_reason: Optional[str],
+    ) -> CodexRun:
+        stdout = "".join(lines)
+        if trace_path is not None:
+            write_text(trace_path, stdout)
+            stdout = ""
+        if stderr_path is not None:
+            write_text(stderr_path, stderr)
+            stderr = ""
         return CodexRun(
-            exit_code=124,
+            exit_code=exit_code,
             stdout=stdout,
             stderr=stderr,
-            duration_s=end - start,
+            duration_s=time.time() - start,
+            trace_path=trace_path,
+            stderr_path=stderr_path,
+            stop_reason=stop_reason,
         )
 
 
+def make_backend(
+    name: str,
+    *,
+    run_root: Path,
+    replay_from: Optional[Path] = None,
+    stub_exec: Optional[str] = None,
+) -> AgentBackend:
+    if name == "codex":
+        return AgentBackend()
+    if name == "stub":
+        if not stub_exec:
+            raise ValueError("stub backend requires an executable")
+        return StubBackend(stub_exec)
+    if name == "replay":
+        if replay_from is None:
+            raise ValueError("replay backend requires a recorded run directory")
+        return ReplayBackend(replay_from, run_root)
+    raise ValueError(f"Unknown agent backend: {name}")
+
+
+def file_sha256(path: Path) -> Optional[str]:
+    """sha256 of the file at `path`, or None if it cannot be read."""
+    try:
+        return hashlib.sha256(path.read_bytes()).hexdigest()
+    except OSError:
+        return None
+
+
+def kill_process_group(proc: subprocess.Popen) -> None:
+    """Kill `proc` and everything it spawned (it must have been started in its own session)."""
+    try:
+        os.killpg(proc.pid, signal.SIGKILL)
+    except (ProcessLookupError, PermissionError):
+        pass
+    except OSError:
+        proc.kill()
+
+
+def _parse_event_line(line: str) -> Optional[dict[str, Any]]:
+    line = line.strip()
+    if not line.startswith("{") or not line.endswith("}"):
+        return None
+    try:
+        event = json.loads(line)
+    except Exception:
+        return None
+    return event if isinstance(event, dict) else None
+
+
 def iter_jsonl_events(jsonl_text: str) -> Iterable[dict[str, Any]]:
     for line in jsonl_text.splitlines():
-        line = line.strip()
-        if not line.startswith("{") or not line.endswith("}"):
-            continue
-        try:
-            yield json.loads(line)
-        except Exception:
-            continue
+        event = _parse_event_line(line)
+        if event is not None:
+            yield event
+
+
+def iter_trace_events(trace_path: Path) -> Iterable[dict[str, Any]]:
+    """Like `iter_jsonl_events`, reading a trace file line by line."""
+    with trace_path.open("r", encoding="utf-8", errors="replace") as f:
+        for line in f:
+            event = _parse_event_line(line)
+            if event is not None:
+                yield event
 
 
 def extract_commands(events: Iterable[dict[str, Any]]) -> list[str]:
-    cmds: list[str] = []
-    seen_ids: set[str] = set()
-    for e in events:
-        if e.get("type") != "item.completed":
-            continue
-        item = e.get("item") or {}
-        if item.get("type") == "command_execution":
-            item_id = item.get("id")
-            if isinstance(item_id, str):
-                if item_id in seen_ids:
-                    continue
-                seen_ids.add(item_id)
-            cmd = item.get("command")
-            if isinstance(cmd, str):
-                cmds.append(cmd)
-    return cmds
+    return TraceReducer.over(events).commands
 
 
 def extract_final_agent_message(events: Iterable[dict[str, Any]]) -> Optional[str]:
-    text: Optional[str] = None
-    for e in events:
-        if e.get("type") != "item.completed":
-            continue
-        item = e.get("item") or {}
-        if item.get("type") == "agent_message":
-            t = item.get("text")
-            if isinstance(t, str):
-                text = t
-    return text
+    return TraceReducer.over(events).final_message
 
 
 def _is_skill_doc_read_command(cmd: str) -> bool:
@@ -446,38 +710,209 @@ def extract_token_usage(events: Iterable[dict[str, Any]]) -> dict[str, int]:
 
     We sum across all `turn.completed` events.
     """
-    totals = {"turns": 0, "input_tokens": 0, "cached_input_tokens": 0, "output_tokens": 0, "total_tokens": 0}
-    for e in events:
-        if e.get("type") != "turn.completed":
-            continue
-        totals["turns"] += 1
-        usage = e.get("usage") or {}
-        for k in ["input_tokens", "cached_input_tokens", "output_tokens"]:
-            v = usage.get(k)
-            if isinstance(v, int):
-                totals[k] += v
-            elif isinstance(v, str) and v.isdigit():
-                totals[k] += int(v)
-    totals["total_tokens"] = totals["input_tokens"] + totals["output_tokens"]
-    return totals
-
-
-def deterministic_grade(*, codex_run: CodexRun, trace_events: list[dict[str, Any]]) -> dict[str, Any]:
-    cmds = extract_commands(trace_events)
-    effective_cmds = [c for c in cmds if not _is_skill_doc_read_command(c)]
-    final_msg = extract_final_agent_message(trace_events)
-    usage = extract_token_usage(trace_events)
+    return TraceReducer.over(events).usage()
+
+
+# Event types `TraceReducer` reads. Trace lines that mention none of them (e.g.
+# `item.updated` streaming deltas) are counted without being decoded.
+_REDUCED_TYPES_RE = re.compile(r'"(?:item\.started|item\.completed|turn\.started|turn\.completed|turn\.failed)"')
+
+# Upper bounds (seconds) of the tool-call latency histogram buckets; the last bucket is open.
+TOOL_LATENCY_BUCKETS_S = (0.1, 0.5, 1.0, 5.0, 30.0, 120.0)
+
+# Item types that are the agent talking rather than calling a tool.
+_NON_TOOL_ITEMS = {"agent_message", "reasoning"}
+
+
+class TraceReducer:
+    """
+    Everything the runner reads from a codex event stream, reduced in one pass:
+    commands (deduplicated by item id), the final agent message, token usage,
+    per-turn durations and a tool-call latency histogram.
+
+    Works live (`update` each parsed event as it arrives, e.g. from `on_event`) and
+    over archived traces (`from_trace`, which only decodes lines whose event type
+    it uses). Durations need arrival times (`now`, in monotonic seconds); codex
+    events carry no timestamps, so an archived trace yields no timings.
+    """
+
+    def __init__(self) -> None:
+        self.events = 0
+        self.commands: list[str] = []
+        self.commands_effective = 0
+        self.final_message: Optional[str] = None
+        self.turns = 0
+        self.input_tokens = 0
+        self.cached_input_tokens = 0
+        self.output_tokens = 0
+        self.turn_durations_s: list[float] = []
+        self.tool_calls_timed = 0
+        self.tool_latency_hist = [0] * (len(TOOL_LATENCY_BUCKETS_S) + 1)
+        self.tool_latency_max_s = 0.0
+        self._command_ids: set[str] = set()
+        self._turn_started: Optional[float] = None
+        self._items_started: dict[str, float] = {}
+
+    @classmethod
+    def over(cls, events: Iterable[dict[str, Any]]) -> "TraceReducer":
+        reducer = cls()
+        for event in events:
+            reducer.update(event)
+        return reducer
+
+    @classmethod
+    def from_trace(cls, trace_path: Path) -> "TraceReducer":
+        reducer = cls()
+        with trace_path.open("r", encoding="utf-8", errors="replace") as f:
+            for line in f:
+                reducer.feed_line(line)
+        return reducer
+
+    @classmethod
+    def from_text(cls, jsonl_text: str) -> "TraceReducer":
+        reducer = cls()
+        for line in jsonl_text.splitlines():
+            reducer.feed_line(line)
+        return reducer
+
+    def feed_line(self, line: str, now: Optional[float] = None) -> None:
+        line = line.strip()
+        if not line.startswith("{") or not line.endswith("}"):
+            return
+        if _REDUCED_TYPES_RE.search(line) is None:
+            self.events += 1
+            return
+        event = _parse_event_line(line)
+        if event is not None:
+            self.update(event, now)
+
+    def update(self, event: dict[str, Any], now: Optional[float] = None) -> None:
+        self.events += 1
+        etype = event.get("type")
+        if etype == "item.started" or etype == "item.completed":
+            item = event.get("item") or {}
+            itype = item.get("type")
+            item_id = item.get("id")
+            if now is not None and isinstance(item_id, str) and itype not in _NON_TOOL_ITEMS:
+                if etype == "item.started":
+                    self._items_started.setdefault(item_id, now)
+                elif item_id in self._items_started:
+                    self._record_latency(now - self._items_started.pop(item_id))
+            if etype == "item.started":
+                return
+            if itype == "command_execution":
+                if isinstance(item_id, str):
+                    if item_id in self._command_ids:
+                        return
+                    self._command_ids.add(item_id)
+                cmd = item.get("command")
+                if isinstance(cmd, str):
+                    self.commands.append(cmd)
+                    if not _is_skill_doc_read_command(cmd):
+                        self.commands_effective += 1
+            elif itype == "agent_message":
+                text = item.get("text")
+                if isinstance(text, str):
+                    self.final_message = text
+        elif etype == "turn.started":
+            self._turn_started = now
+        elif etype == "turn.completed" or etype == "turn.failed":
+            if now is not None and self._turn_started is not None:
+                self.turn_durations_s.append(now - self._turn_started)
+            self._turn_started = None
+            if etype == "turn.failed":
+                return
+            self.turns += 1
+            usage = event.get("usage") or {}
+            for k in ["input_tokens", "cached_input_tokens", "output_tokens"]:
+                v = usage.get(k)
+                if isinstance(v, int):
+                    setattr(self, k, getattr(self, k) + v)
+                elif isinstance(v, str) and v.isdigit():
+                    setattr(self, k, getattr(self, k) + int(v))
+
+    def _record_latency(self, latency_s: float) -> None:
+        self.tool_calls_timed += 1
+        self.tool_latency_max_s = max(self.tool_latency_max_s, latency_s)
+        for i, bound in enumerate(TOOL_LATENCY_BUCKETS_S):
+            if latency_s <= bound:
+                self.tool_latency_hist[i] += 1
+                return
+        self.tool_latency_hist[-1] += 1
+
+    @property
+    def commands_total(self) -> int:
+        return len(self.commands)
+
+    @property
+    def total_tokens(self) -> int:
+        return self.input_tokens + self.output_tokens
+
+    def budget_violation(self, case: PromptCase) -> Optional[str]:
+        """First of `case`'s command/token caps the counts so far exceed, if any."""
+        if case.max_commands is not None and self.commands_effective > case.max_commands:
+            return f"max_commands exceeded: effective={self.commands_effective} > {case.max_commands}"
+        for name, used in (
+            ("max_input_tokens", self.input_tokens),
+            ("max_output_tokens", self.output_tokens),
+            ("max_total_tokens", self.total_tokens),
+        ):
+            cap = getattr(case, name)
+            if cap is not None and used > cap:
+                return f"{name} exceeded: {used} > {cap}"
+        return None
+
+    def usage(self) -> dict[str, int]:
+        return {
+            "turns": self.turns,
+            "input_tokens": self.input_tokens,
+            "cached_input_tokens": self.cached_input_tokens,
+            "output_tokens": self.output_tokens,
+            "total_tokens": self.total_tokens,
+        }
+
+    def timings(self) -> Optional[dict[str, Any]]:
+        """Per-turn durations and tool-call latencies, or None when no arrival times were seen."""
+        if not (self.turn_durations_s or self.tool_calls_timed):
+            return None
+        labels = [f"<={b:g}s" for b in TOOL_LATENCY_BUCKETS_S] + [f">{TOOL_LATENCY_BUCKETS_S[-1]:g}s"]
+        return {
+            "turn_durations_s": [round(d, 3) for d in self.turn_durations_s],
+            "tool_calls": self.tool_calls_timed,
+            "tool_latency_max_s": round(self.tool_latency_max_s, 3),
+            "tool_latency_hist": dict(zip(labels, self.tool_latency_hist)),
+        }
+
+    def as_dict(self) -> dict[str, int]:
+        return {
+            "events": self.events,
+            "command_count_total": self.commands_total,
+            "command_count_effective": self.commands_effective,
+            "turns": self.turns,
+            "input_tokens": self.input_tokens,
+            "cached_input_tokens": self.cached_input_tokens,
+            "output_tokens": self.output_tokens,
+            "total_tokens": self.total_tokens,
+        }
+
+
+def deterministic_grade(*, codex_run: CodexRun, trace: TraceReducer) -> dict[str, Any]:
+    final_msg = trace.final_message
 
     # Lightweight smoke checks; keep this explainable.
-    return {
+    det = {
         "exit_code": codex_run.exit_code,
         "duration_s": round(codex_run.duration_s, 3),
-        "command_count_total": len(cmds),
-        "command_count_effective": len(effective_cmds),
-        "usage": usage,
+        "command_count_total": trace.commands_total,
+        "command_count_effective": trace.commands_effective,
+        "usage": trace.usage(),
         "has_final_message": bool(final_msg and final_msg.strip()),
         "pass": (codex_run.exit_code == 0) and bool(final_msg and final_msg.strip()),
     }
+    timings = trace.timings()
+    if timings is not None:
+        det["trace_timings"] = timings
+    return det
 
 
 def summarize_markdown(rows: list[dict[str, Any]]) -> str:
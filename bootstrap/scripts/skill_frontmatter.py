@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+import re
+from pathlib import Path
+from typing import Iterable, Iterator, Optional
+
+
+# Frontmatter blocks are short; never scan deep into a SKILL.md body looking for a
+# closing delimiter that is not there.
+MAX_FRONTMATTER_LINES = 250
+
+_KEY_LINE = re.compile(r"^([A-Za-z0-9_][A-Za-z0-9_.-]*)\s*:(.*)$")
+_BLOCK_HEADER = re.compile(r"^([|>])[+-]?\d*\s*(?:#.*)?$")
+
+
+def _unquote(value: str) -> str:
+    if len(value) >= 2 and value[0] == value[-1] == '"':
+        return value[1:-1].replace('\\"', '"').replace("\\\\", "\\")
+    if len(value) >= 2 and value[0] == value[-1] == "'":
+        return value[1:-1].replace("''", "'")
+    # Unbalanced quotes: keep the historical `strip("'\"")` behavior.
+    return value.strip("'\"")
+
+
+def _fold(lines: list[str]) -> str:
+    # YAML folding: single newlines become spaces, each blank line becomes a newline.
+    text = ""
+    breaks = 0
+    for line in lines:
+        stripped = line.strip()
+        if not stripped:
+            breaks += 1
+            continue
+        if text:
+            text += "\n" * breaks if breaks else " "
+        text += stripped
+        breaks = 0
+    return text
+
+
+def _block_value(style: str, lines: list[str]) -> str:
+    indents = [len(line) - len(line.lstrip(" ")) for line in lines if line.strip()]
+    indent = min(indents) if indents else 0
+    body = [line[indent:] if line.strip() else "" for line in lines]
+    if style == "|":
+        return "\n".join(body).strip("\n")
+    return _fold(body)
+
+
+def _is_structured(lines: list[str]) -> bool:
+    first = next((line.strip() for line in lines if line.strip()), "")
+    return first == "-" or first.startswith("- ") or bool(_KEY_LINE.match(first))
+
+
+def _iter_block(lines: Iterator[str]) -> Iterator[str]:
+    for i, line in enumerate(lines):
+        if i >= MAX_FRONTMATTER_LINES:
+            return
+        line = line.rstrip("\r\n")
+        if line.strip() == "---":
+            return
+        yield line
+
+
+def parse_frontmatter(lines: Iterable[str]) -> Optional[dict[str, str]]:
+    """
+    Parse a SKILL.md frontmatter block from an iterable of lines.
+
+    Consumes `lines` only up to the closing `---` and returns None when the first
+    line is not `---`. Top-level keys map to strings (first occurrence wins). YAML
+    block scalars (`key: >`, `key: |`), quoted values and plain multi-line values
+    are folded into one string without a trailing newline; nested mappings and
+    lists map to an empty string.
+    """
+    it = iter(lines)
+    first = next(it, None)
+    if first is None or first.strip() != "---":
+        return None
+
+    out: dict[str, str] = {}
+    key: Optional[str] = None
+    head = ""
+    cont: list[str] = []
+
+    def flush() -> None:
+        if key is None or key in out:
+            return
+        block = _BLOCK_HEADER.match(head)
+        if block:
+            out[key] = _block_value(block.group(1), cont)
+        elif cont and not head and _is_structured(cont):
+            out[key] = ""
+        elif cont:
+            out[key] = _unquote(" ".join(_fold([head, *cont]).split()))
+        else:
+            out[key] = _unquote(head)
+
+    for line in _iter_block(it):
+        if line.strip() and line[0] not in " \t":
+            if line.startswith("#"):
+                continue
+            m = _KEY_LINE.match(line)
+            if m:
+                flush()
+                key = m.group(1)
+                head = (m.group(2) or "").strip()
+                cont = []
+                continue
+        if key is not None:
+            cont.append(line)
+    flush()
+    return out
+
+
+def read_frontmatter(path: Path) -> Optional[dict[str, str]]:
+    """
+    Read the frontmatter of `path` line by line, stopping at the closing delimiter.
+
+    Returns None when the file has no frontmatter; raises OSError if unreadable.
+    """
+    with path.open("r", encoding="utf-8", errors="replace") as f:
+        return parse_frontmatter(f)
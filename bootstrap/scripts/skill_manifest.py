@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Iterable, Optional, TypedDict
+
+
+ROOT = Path(__file__).resolve().parents[2]
+
+# Rough tokenizer-agnostic estimate for English prose and code.
+BYTES_PER_TOKEN = 4
+
+
+class FileDigest(TypedDict):
+    sha256: str
+    size: int
+
+
+@dataclass(frozen=True)
+class TreeDigest:
+    files: dict[str, FileDigest]
+    tree_sha256: str
+    bytes: int
+    est_tokens: int
+
+    def manifest_fields(self) -> dict[str, Any]:
+        return {
+            "bytes": self.bytes,
+            "est_tokens": self.est_tokens,
+            "files": self.files,
+            "tree_sha256": self.tree_sha256,
+        }
+
+
+def default_manifest_path(root: Path = ROOT) -> Path:
+    return root / "skills" / "manifest.json"
+
+
+def tree_sha256(files: dict[str, FileDigest]) -> str:
+    """Hash of the `sha256sum`-style listing of `files`, sorted by relative path."""
+    h = hashlib.sha256()
+    for rel in sorted(files):
+        h.update(f"{files[rel]['sha256']}  {rel}\n".encode("utf-8"))
+    return h.hexdigest()
+
+
+def _iter_files(root: Path) -> Iterable[tuple[str, Path]]:
+    for dirpath, dirnames, filenames in os.walk(root, followlinks=True):
+        dirnames.sort()
+        base = Path(dirpath)
+        for fname in sorted(filenames):
+            path = base / fname
+            yield path.relative_to(root).as_posix(), path
+
+
+def digest_tree(root: Path) -> TreeDigest:
+    """Per-file sha256 and size for every file under `root`, plus totals."""
+    files: dict[str, FileDigest] = {}
+    total = 0
+    text_bytes = 0
+    for rel, path in _iter_files(root):
+        data = path.read_bytes()
+        files[rel] = {"sha256": hashlib.sha256(data).hexdigest(), "size": len(data)}
+        total += len(data)
+        if b"\0" not in data:
+            text_bytes += len(data)
+    return TreeDigest(
+        files=files,
+        tree_sha256=tree_sha256(files),
+        bytes=total,
+        est_tokens=-(-text_bytes // BYTES_PER_TOKEN),
+    )
+
+
+def load_manifest(path: Optional[Path] = None) -> list[dict[str, Any]]:
+    path = path or default_manifest_path()
+    data = json.loads(path.read_text(encoding="utf-8"))
+    if not isinstance(data, list):
+        raise ValueError(f"Unexpected manifest format in `{path}` (expected JSON list).")
+    return [e for e in data if isinstance(e, dict)]
+
+
+def is_current(entry: dict[str, Any], installed_dir: Path) -> bool:
+    """
+    True when `installed_dir` holds exactly the files recorded in `entry`.
+
+    Sizes are compared first, so a stale install is usually detected without reading
+    file contents. Entries written before digests were recorded are never current.
+    """
+    expected = entry.get("files")
+    if not isinstance(expected, dict) or not installed_dir.is_dir():
+        return False
+    found = dict(_iter_files(installed_dir))
+    if found.keys() != expected.keys():
+        return False
+    for rel, path in found.items():
+        try:
+            if path.stat().st_size != expected[rel].get("size"):
+                return False
+        except OSError:
+            return False
+    for rel, path in found.items():
+        if hashlib.sha256(path.read_bytes()).hexdigest() != expected[rel].get("sha256"):
+            return False
+    return True
+
+
+def stale_skills(
+    entries: Iterable[dict[str, Any]],
+    install_root: Path,
+    slugs: Optional[Iterable[str]] = None,
+) -> list[str]:
+    """
+    Slugs (optionally limited to `slugs`) whose copy under `install_root` is missing or differs.
+
+    A requested slug with no manifest entry cannot be verified, so it is always reported.
+    """
+    wanted = set(slugs) if slugs is not None else None
+    stale: set[str] = set(wanted) if wanted is not None else set()
+    for entry in entries:
+        slug = entry.get("slug")
+        if not isinstance(slug, str) or (wanted is not None and slug not in wanted):
+            continue
+        if is_current(entry, install_root / slug):
+            stale.discard(slug)
+        else:
+            stale.add(slug)
+    return sorted(stale)
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    ap = argparse.ArgumentParser(description="List installed pkbllm skills that differ from skills/manifest.json.")
+    ap.add_argument("install_root", help="Directory holding installed `<slug>/` skill folders.")
+    ap.add_argument("--manifest", default=str(default_manifest_path()), help="Path to manifest.json.")
+    args = ap.parse_args(argv)
+
+    entries = load_manifest(Path(args.manifest))
+    stale = stale_skills(entries, Path(args.install_root).expanduser())
+    for slug in stale:
+        print(slug)
+    print(f"{len(stale)} of {len(entries)} skill(s) stale", file=sys.stderr)
+    return 1 if stale else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
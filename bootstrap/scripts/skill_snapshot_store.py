@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import os
+import shutil
+import stat
+import sys
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Iterable, Optional
+
+
+ROOT = Path(__file__).resolve().parents[2]
+STORE_VERSION = 1
+MANIFEST_NAME = "skills_snapshot.json"
+
+# Same racy-mtime guard as the skill catalog: a file modified within this window of
+# the previous scan may have changed without a visible stat change, so rehash it.
+_RACY_WINDOW_NS = 2_000_000_000
+
+
+def default_runs_root(root: Path = ROOT) -> Path:
+    return root / "artifacts" / "skill-evals"
+
+
+def default_store_path(root: Path = ROOT) -> Path:
+    return default_runs_root(root) / ".store"
+
+
+@dataclass
+class SnapshotStats:
+    files: int = 0
+    hashed: int = 0
+    stored: int = 0
+    linked: int = 0
+    copied: int = 0
+    bytes_stored: int = 0
+
+
+def _sha256_file(path: Path) -> str:
+    h = hashlib.sha256()
+    with path.open("rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+class SnapshotStore:
+    """
+    Content-addressed file objects shared by every eval run's skills snapshot.
+
+    An object id is the file's sha256, plus an `x` suffix for executable files (a
+    hardlink shares its mode with the object, so modes get separate objects).
+    Objects are read-only. `index.json` maps source paths to the object of their last
+    seen (size, mtime), so only files whose stat changed are rehashed.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.objects = path / "objects"
+        self.index_path = path / "index.json"
+        self._index: dict[str, dict[str, Any]] = {}
+        self._trusted_before_ns = 0
+        try:
+            data = json.loads(self.index_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            data = None
+        if isinstance(data, dict) and data.get("version") == STORE_VERSION:
+            self._index = data.get("files") or {}
+            self._trusted_before_ns = int(data.get("scanned_at_ns") or 0) - _RACY_WINDOW_NS
+
+    def object_path(self, oid: str) -> Path:
+        return self.objects / oid[:2] / oid[2:]
+
+    def add(self, src: Path, st: os.stat_result, stats: SnapshotStats) -> str:
+        """Object id for `src`, storing its content if the store lacks it."""
+        key = str(src)
+        cached = self._index.get(key)
+        if (
+            cached is not None
+            and cached.get("size") == st.st_size
+            and cached.get("mtime_ns") == st.st_mtime_ns
+            and st.st_mtime_ns < self._trusted_before_ns
+            and self.object_path(cached["oid"]).exists()
+        ):
+            return cached["oid"]
+
+        stats.hashed += 1
+        executable = bool(st.st_mode & stat.S_IXUSR)
+        oid = _sha256_file(src) + ("x" if executable else "")
+        obj = self.object_path(oid)
+        if not obj.exists():
+            obj.parent.mkdir(parents=True, exist_ok=True)
+            tmp = obj.with_name(f".{obj.name}.{os.getpid()}.tmp")
+            shutil.copyfile(src, tmp)
+            os.chmod(tmp, 0o555 if executable else 0o444)
+            os.replace(tmp, obj)
+            stats.stored += 1
+            stats.bytes_stored += st.st_size
+        self._index[key] = {"size": st.st_size, "mtime_ns": st.st_mtime_ns, "oid": oid}
+        return oid
+
+    def save_index(self, scanned_at_ns: int) -> None:
+        # Best-effort: a lost index only costs rehashing on the next snapshot.
+        try:
+            self.path.mkdir(parents=True, exist_ok=True)
+            tmp = self.index_path.with_name(f".{self.index_path.name}.{os.getpid()}.tmp")
+            payload = {"version": STORE_VERSION, "scanned_at_ns": scanned_at_ns, "files": self._index}
+            tmp.write_text(json.dumps(payload, sort_keys=True) + "\n", encoding="utf-8")
+            os.replace(tmp, self.index_path)
+        except OSError:
+            pass
+
+    def materialize(self, trees: Iterable[tuple[str, Path]], dest: Path) -> tuple[dict[str, str], SnapshotStats]:
+        """
+        Build `dest/<name>/...` for each (name, source dir) as a farm of hardlinks into
+        the store (copies where hardlinks fail, e.g. across filesystems).
+
+        Returns the manifest (`<name>/<rel path>` -> object id) and counters.
+        """
+        scanned_at_ns = time.time_ns()
+        stats = SnapshotStats()
+        manifest: dict[str, str] = {}
+        can_link = True
+        for name, src_root in trees:
+            for dirpath, dirnames, filenames in os.walk(src_root, followlinks=True):
+                dirnames.sort()
+                base = Path(dirpath)
+                out_dir = dest / name / base.relative_to(src_root)
+                out_dir.mkdir(parents=True, exist_ok=True)
+                for fname in sorted(filenames):
+                    src = base / fname
+                    st = src.stat()
+                    oid = self.add(src, st, stats)
+                    out = out_dir / fname
+                    manifest[out.relative_to(dest).as_posix()] = oid
+                    stats.files += 1
+                    if can_link:
+                        try:
+                            os.link(self.object_path(oid), out)
+                            stats.linked += 1
+                            continue
+                        except OSError:
+                            can_link = False
+                    shutil.copy2(self.object_path(oid), out)
+                    os.chmod(out, st.st_mode & 0o777)
+                    stats.copied += 1
+        self.save_index(scanned_at_ns)
+        return manifest, stats
+
+    def gc(self, referenced: set[str], *, dry_run: bool = False) -> tuple[int, int]:
+        """
+        Delete objects that are not in `referenced` and have no other hardlinks.
+
+        Returns the number of objects and bytes removed (or that would be, with
+        `dry_run`).
+        """
+        removed = 0
+        freed = 0
+        if not self.objects.is_dir():
+            return removed, freed
+        for shard in sorted(self.objects.iterdir()):
+            if not shard.is_dir():
+                continue
+            for obj in sorted(shard.iterdir()):
+                oid = shard.name + obj.name
+                if obj.name.startswith(".") or oid in referenced:
+                    continue
+                st = obj.stat()
+                # A snapshot without a manifest (e.g. an interrupted run) still pins its links.
+                if st.st_nlink > 1:
+                    continue
+                removed += 1
+                freed += st.st_size
+                if not dry_run:
+                    obj.unlink()
+        if not dry_run and removed:
+            live = {k: v for k, v in self._index.items() if self.object_path(v.get("oid", "")).exists()}
+            self._index = live
+            self.save_index(time.time_ns())
+        return removed, freed
+
+
+def write_manifest(run_root: Path, manifest: dict[str, str]) -> None:
+    (run_root / MANIFEST_NAME).write_text(json.dumps(manifest, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+
+
+def referenced_objects(runs_root: Path) -> set[str]:
+    """Object ids listed in the snapshot manifest of any run under `runs_root`."""
+    referenced: set[str] = set()
+    if not runs_root.is_dir():
+        return referenced
+    for manifest in runs_root.glob(f"*/{MANIFEST_NAME}"):
+        try:
+            data = json.loads(manifest.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            continue
+        if isinstance(data, dict):
+            referenced.update(v for v in data.values() if isinstance(v, str))
+    return referenced
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    ap = argparse.ArgumentParser(description="Maintain the content-addressed skills snapshot store for eval runs.")
+    ap.add_argument("command", nargs="?", default="gc", choices=["gc"], help="What to do.")
+    ap.add_argument("--dry-run", action="store_true", help="Report what gc would delete without deleting it.")
+    args = ap.parse_args(argv)
+
+    runs_root = default_runs_root(ROOT)
+    store = SnapshotStore(default_store_path(ROOT))
+    removed, freed = store.gc(referenced_objects(runs_root), dry_run=args.dry_run)
+    verb = "Would remove" if args.dry_run else "Removed"
+    print(f"{verb} {removed} unreferenced objects ({freed} bytes) from {store.path}", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,126 @@
+import hashlib
+import io
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+
+# Scripts import each other as top-level modules (they run as `python bootstrap/scripts/x.py`).
+SCRIPTS_DIR = Path(__file__).resolve().parent
+if str(SCRIPTS_DIR) not in sys.path:
+    sys.path.insert(0, str(SCRIPTS_DIR))
+
+import lint_skills  # noqa: E402
+
+
+GOOD_CSV = "id,should_trigger,prompt,fixture\nyes,true,do it,fixtures/case\nno,false,other,\n"
+
+
+class LintCacheTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.base = Path(self.temp_dir.name)
+        self.cache_path = self.base / "lint-cache.json"
+        self.csvs = []
+        for slug in ("uv-a", "uv-b"):
+            case_dir = self.base / slug
+            (case_dir / "fixtures" / "case").mkdir(parents=True)
+            (case_dir / "prompts.csv").write_text(GOOD_CSV, encoding="utf-8")
+            self.csvs.append(case_dir / "prompts.csv")
+
+    def _run(self, jobs: int = 1):
+        cache = lint_skills._LintCache(self.cache_path)
+        results = lint_skills._lint_csv_files(self.csvs, cache, jobs)
+        cache.save({lint_skills._cache_key(p) for p in self.csvs})
+        return results, cache.hits
+
+    def test_only_changed_files_are_relinted(self) -> None:
+        results, hits = self._run(jobs=2)
+        self.assertEqual(hits, 0)
+        self.assertEqual(list(results.values()), [[], []])
+
+        self.csvs[0].write_text(GOOD_CSV.replace("no,false", "no,maybe"), encoding="utf-8")
+        results, hits = self._run()
+        self.assertEqual(hits, 1)
+        self.assertIn("should_trigger must be true/false", results[self.csvs[0]][0].message)
+
+    def test_missing_fixture_invalidates_entry(self) -> None:
+        self._run()
+        (self.base / "uv-b" / "fixtures" / "case").rmdir()
+        results, hits = self._run()
+        self.assertEqual(hits, 1)
+        self.assertEqual(results[self.csvs[1]], [("csv-fixture", 2, "row 2: fixture missing: 'fixtures/case'")])
+
+
+class PromptsCsvStreamTests(unittest.TestCase):
+    def test_errors_stream_and_path_checks_are_memoized(self) -> None:
+        rows = ["id,should_trigger,prompt,fixture,must_include"]
+        rows += [f"c{i},{'true' if i % 2 else 'false'},p,fixtures/missing,ok|x[" for i in range(500)]
+        rows.append("c1,true,p,,")
+        deps: dict = {}
+        errors = lint_skills._iter_prompts_csv_errors(
+            io.StringIO("\n".join(rows) + "\n"), Path("/nonexistent/evals/prompts.csv"), deps
+        )
+
+        self.assertEqual(next(errors), ("csv-fixture", 2, "row 2: fixture missing: 'fixtures/missing'"))
+        rest = [e.message for e in errors]
+        self.assertIn("row 502: duplicate id 'c1'", rest)
+        self.assertEqual(sum("invalid regex" in e for e in rest), 500)
+        self.assertEqual(deps, {"/nonexistent/evals/fixtures/missing": False})
+
+    def test_job_hashes_whole_file_even_on_decode_error(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "prompts.csv"
+            data = b"id,should_trigger,prompt\n" + b"a,true,p\n" * 5000 + b"\xff\n"
+            path.write_bytes(data)
+            sha256, errors, _ = lint_skills._lint_prompts_csv_job(str(path))
+        self.assertEqual(sha256, hashlib.sha256(data).hexdigest())
+        self.assertTrue(errors[-1].message.startswith("failed to read CSV"))
+
+    def test_line_points_at_first_line_of_multiline_row(self) -> None:
+        text = 'id,should_trigger,prompt\na,true,"two\nlines"\nb,maybe,"three\nmore\nlines"\nc,false,p\n'
+        errors = list(lint_skills._iter_prompts_csv_errors(io.StringIO(text), Path("/x/prompts.csv"), {}))
+        self.assertEqual(errors, [("csv-should-trigger", 4, "row 3: should_trigger must be true/false (got 'maybe')")])
+
+
+class ReportFormatTests(unittest.TestCase):
+    FINDINGS = [
+        lint_skills.Finding("warning", "eval-coverage", "1/2 skills missing curated eval cases (prompts.csv)."),
+        lint_skills.Finding("error", "csv-id", "row 3: missing id", "evals/skills/uv-a/prompts.csv", 3),
+    ]
+
+    def test_json_carries_rule_path_and_line(self) -> None:
+        report = lint_skills._json_report(self.FINDINGS, {"errors": 1}, None)
+        self.assertEqual(
+            report["findings"][1],
+            {"level": "error", "rule": "csv-id", "path": "evals/skills/uv-a/prompts.csv", "line": 3, "message": "row 3: missing id"},
+        )
+        self.assertNotIn("timings", report)
+
+    def test_sarif_results_reference_known_rules(self) -> None:
+        run = lint_skills._sarif_report(self.FINDINGS)["runs"][0]
+        rules = [r["id"] for r in run["tool"]["driver"]["rules"]]
+        self.assertEqual(rules, ["csv-id", "eval-coverage"])
+        self.assertTrue(all(r in lint_skills.RULES for r in rules))
+        error = run["results"][1]
+        self.assertEqual(rules[error["ruleIndex"]], "csv-id")
+        self.assertEqual(
+            error["locations"][0]["physicalLocation"],
+            {"artifactLocation": {"uri": "evals/skills/uv-a/prompts.csv", "uriBaseId": "SRCROOT"}, "region": {"startLine": 3}},
+        )
+        self.assertNotIn("locations", run["results"][0])
+
+    def test_timings_list_slowest_files_first(self) -> None:
+        timings = lint_skills._Timings()
+        with timings.phase("collisions"):
+            pass
+        timings.items.update({"a.csv": 0.1, "b.csv": 0.3, "c.csv": 0.2})
+        data = timings.as_dict(top=2)
+        self.assertEqual(list(data["phases"]), ["collisions"])
+        self.assertEqual([s["path"] for s in data["slowest"]], ["b.csv", "c.csv"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,436 @@
+import dataclasses
+import json
+import os
+import stat
+import sys
+import tempfile
+import textwrap
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+
+# Scripts import each other as top-level modules (they run as `python bootstrap/scripts/x.py`).
+SCRIPTS_DIR = Path(__file__).resolve().parent
+if str(SCRIPTS_DIR) not in sys.path:
+    sys.path.insert(0, str(SCRIPTS_DIR))
+
+import run_skill_evals  # noqa: E402
+import skill_eval_lib  # noqa: E402
+from skill_eval_lib import Skill  # noqa: E402
+
+
+# Stand-in for `codex exec --json`: emits a minimal trace, writes the final message and
+# sleeps longest for the first smoke case so cases finish in reverse order. A "hang"
+# prompt emits one command event and then never finishes. Judge prompts get a passing
+# rubric; with FAKE_CODEX_LOG set, each call logs its start and end time there.
+FAKE_CODEX = textwrap.dedent(
+    """\
+    #!{python}
+    import json, os, sys, time
+    argv = sys.argv[1:]
+    prompt = argv[-1]
+    kind = "judge" if prompt.startswith("Evaluate") else "agent"
+    log = os.environ.get("FAKE_CODEX_LOG")
+    started = time.time()
+    if "--output-last-message" in argv:
+        out = argv[argv.index("--output-last-message") + 1]
+        with open(out, "w", encoding="utf-8") as f:
+            if kind == "judge":
+                f.write(json.dumps({{"overall_pass": True, "score": 4, "checks": []}}))
+            else:
+                f.write(json.dumps({{"invoked_skills": []}}))
+    if kind == "judge":
+        time.sleep(0.3)
+    if prompt == "hang":
+        print(json.dumps({{"type": "item.completed", "item": {{"id": "c1", "type": "command_execution", "command": "make"}}}}), flush=True)
+        time.sleep(60)
+    if prompt.startswith("Use the "):
+        time.sleep(0.6)
+    elif prompt.startswith("Do the following"):
+        time.sleep(0.3)
+    print(json.dumps({{"type": "item.completed", "item": {{"id": "m1", "type": "agent_message", "text": "done"}}}}))
+    print(json.dumps({{"type": "turn.completed", "usage": {{"input_tokens": 10, "output_tokens": 2}}}}))
+    if log:
+        with open(log, "a", encoding="utf-8") as f:
+            f.write(json.dumps([kind, started, time.time()]) + "\\n")
+    """
+)
+
+
+class EvalRunnerTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.base = Path(self.temp_dir.name)
+
+        bin_dir = self.base / "bin"
+        bin_dir.mkdir()
+        codex = bin_dir / "codex"
+        codex.write_text(FAKE_CODEX.format(python=sys.executable), encoding="utf-8")
+        codex.chmod(codex.stat().st_mode | stat.S_IXUSR)
+
+        skill_dir = self.base / "skills" / "uv-fake"
+        skill_dir.mkdir(parents=True)
+        (skill_dir / "SKILL.md").write_text("---\nname: uv-fake\ndescription: Fake.\n---\n", encoding="utf-8")
+        skill = Skill(
+            name="uv-fake",
+            description="Fake.",
+            canonical_dir=skill_dir,
+            skill_md=skill_dir / "SKILL.md",
+            slug="uv-fake-test-only",
+        )
+
+        self.artifacts = self.base / "artifacts"
+        for patch in (
+            mock.patch.dict(os.environ, {"PATH": f"{bin_dir}{os.pathsep}{os.environ.get('PATH', '')}"}),
+            mock.patch.object(run_skill_evals, "ARTIFACTS_ROOT", self.artifacts),
+            mock.patch.object(run_skill_evals, "discover_skills", lambda: [skill]),
+        ):
+            patch.start()
+            self.addCleanup(patch.stop)
+
+    def _main(self, *extra: str, run_id: str = "r1") -> int:
+        judge = [] if any(a.startswith("--judge") for a in extra) else ["--no-judge"]
+        argv = ["--run-id", run_id, *judge, "--write-progress", *extra]
+        with mock.patch("sys.stderr"):
+            return run_skill_evals.main(argv)
+
+    def test_concurrent_rows_keep_planned_order_and_resume_skips_done(self) -> None:
+        self._main("--jobs", "3")
+        run_root = self.artifacts / "r1"
+        summary = json.loads((run_root / "summary.json").read_text(encoding="utf-8"))
+        self.assertEqual([r["case_id"] for r in summary["rows"]], ["smoke-explicit", "smoke-implicit", "smoke-negative"])
+
+        finished = [json.loads(line)["case_id"] for line in (run_root / "progress.jsonl").read_text().splitlines()]
+        self.assertEqual(finished, ["smoke-negative", "smoke-implicit", "smoke-explicit"])
+        partial = json.loads((run_root / "summary.partial.json").read_text(encoding="utf-8"))
+        self.assertEqual((partial["cases_done"], partial["pass_count"]), (3, 1))
+        self.assertEqual(json.loads((run_root / "current.json").read_text(encoding="utf-8"))["running"], [])
+
+        self.assertEqual(self._main("--resume", "--jobs", "3"), 0)
+        summary = json.loads((run_root / "summary.json").read_text(encoding="utf-8"))
+        self.assertEqual(summary["rows"], [])
+
+    def test_status_folds_journal_tail_past_snapshot(self) -> None:
+        run_root = self.artifacts / "r1"
+        run_root.mkdir(parents=True)
+
+        def record(case_id: str, passed: bool) -> dict:
+            return {"skill_slug": "uv-fake-test-only", "skill": "uv-fake", "case_id": case_id, "pass": passed, "case_dir": case_id}
+
+        progress = run_skill_evals._Progress(run_root, run_id="r1", suite="smoke", judge=False, skills=1, enabled=True)
+        progress.snapshot_interval_s = 3600
+        with mock.patch("sys.stderr"):
+            progress.finish(record("a", True))  # first finish always snapshots
+            progress.finish(record("b", False))
+            progress.finish(record("a", True))  # duplicate key: counted once on resume
+        partial = json.loads((run_root / "summary.partial.json").read_text(encoding="utf-8"))
+        self.assertEqual((partial["cases_done"], partial["status"]), (1, "running"))
+
+        status = run_skill_evals._status(run_root)
+        self.assertEqual((status["cases_done"], status["pass_count"], status["fail_count"]), (3, 2, 1))
+        self.assertEqual(status["journal_bytes"], (run_root / "progress.jsonl").stat().st_size)
+        self.assertNotIn("tail_truncated", status)
+        with mock.patch.object(run_skill_evals, "_STATUS_TAIL_BYTES", 10):
+            self.assertTrue(run_skill_evals._status(run_root)["tail_truncated"])
+        progress.close()
+
+        resumed = run_skill_evals._Progress(run_root, run_id="r1", suite="smoke", judge=False, skills=1, enabled=True)
+        done = resumed.resume()
+        self.assertEqual(done, {("uv-fake-test-only", "a"), ("uv-fake-test-only", "b")})
+        self.assertEqual((resumed.cases_done, resumed.pass_count, resumed.last["case_id"]), (2, 1, "a"))
+        resumed.close()
+        status = run_skill_evals._status(run_root)
+        self.assertEqual((status["cases_done"], status["status"]), (2, "finished"))
+
+    def test_shards_partition_cases_and_merge_back(self) -> None:
+        for k in (1, 2):
+            self._main("--shard", f"{k}/2", "--no-cache", run_id=f"s{k}")
+        shard_cases = [
+            {r["case_id"] for r in json.loads((self.artifacts / f"s{k}" / "summary.json").read_text())["rows"]} for k in (1, 2)
+        ]
+        self.assertFalse(shard_cases[0] & shard_cases[1])
+        self.assertEqual(shard_cases[0] | shard_cases[1], {"smoke-explicit", "smoke-implicit", "smoke-negative"})
+
+        # A resumed shard's summary.json only has that invocation's rows; the journal has the rest.
+        self.assertEqual(self._main("--shard", "1/2", "--resume", run_id="s1"), 0)
+        self.assertEqual(self._main("--shard", "2/2", "--resume", run_id="s1"), 2)
+        with mock.patch("sys.stderr"):
+            self.assertEqual(run_skill_evals.main(["merge", "s1", "s2", "--run-id", "all"]), 1)
+        merged = json.loads((self.artifacts / "all" / "summary.json").read_text(encoding="utf-8"))
+        self.assertEqual(
+            [r["case_id"] for r in merged["rows"]], ["smoke-explicit", "smoke-implicit", "smoke-negative"]
+        )
+        self.assertEqual((merged["cases"], merged["pass_count"], merged["suite"]), (3, 1, "smoke"))
+        self.assertEqual(sorted(s["shard"] for s in merged["merged_from"]), ["1/2", "2/2"])
+        self.assertIn("smoke-negative", (self.artifacts / "all" / "summary.md").read_text(encoding="utf-8"))
+
+    def test_judges_overlap_agent_runs_and_judge_only_skips_agents(self) -> None:
+        log = self.base / "calls.jsonl"
+        with mock.patch.dict(os.environ, {"FAKE_CODEX_LOG": str(log)}):
+            self._main("--judge", "--no-cache", run_id="judged")
+        calls = [json.loads(line) for line in log.read_text(encoding="utf-8").splitlines()]
+        agent_ends = [end for kind, _, end in calls if kind == "agent"]
+        judge_starts = [start for kind, start, _ in calls if kind == "judge"]
+        self.assertEqual((len(agent_ends), len(judge_starts)), (3, 3))
+        self.assertLess(min(judge_starts), max(agent_ends))
+        summary = json.loads((self.artifacts / "judged" / "summary.json").read_text(encoding="utf-8"))
+        self.assertEqual([r["notes"] for r in summary["rows"]], ["judge score=4"] * 3)
+        self.assertEqual(summary["pass_count"], 1)  # deterministic checks still apply
+
+        self._main("--no-cache", run_id="plain")
+        log.unlink()
+        with mock.patch.dict(os.environ, {"FAKE_CODEX_LOG": str(log)}):
+            self._main("--judge-only", "--judge-jobs", "3", run_id="plain")
+        self.assertEqual([kind for kind, _, _ in map(json.loads, log.read_text().splitlines())], ["judge"] * 3)
+        rejudged = json.loads((self.artifacts / "plain" / "summary.json").read_text(encoding="utf-8"))
+        self.assertTrue(rejudged["judge"])
+        self.assertEqual([r["case_id"] for r in rejudged["rows"]], ["smoke-explicit", "smoke-implicit", "smoke-negative"])
+        self.assertEqual([r["pass"] for r in rejudged["rows"]], [r["pass"] for r in summary["rows"]])
+        self.assertTrue((self.artifacts / "plain" / "work" / "uv-fake-test-only" / "smoke-negative" / "judge.normalized.json").exists())
+
+    def test_regrade_applies_current_checks_without_agents(self) -> None:
+        self.assertEqual(self._main("--no-cache", run_id="graded"), 1)
+        select = run_skill_evals._select_cases
+
+        def stricter(*a, **kw):
+            return [dataclasses.replace(c, must_include=["invoked_skills"], max_commands=0) for c in select(*a, **kw)]
+
+        with mock.patch.object(run_skill_evals, "_select_cases", stricter), mock.patch.dict(os.environ, {"PATH": ""}):
+            with mock.patch("sys.stderr"):
+                self.assertEqual(run_skill_evals.main(["regrade", "--run-id", "graded", "--jobs", "2"]), 1)
+        summary = json.loads((self.artifacts / "graded" / "summary.json").read_text(encoding="utf-8"))
+        self.assertTrue(summary["regraded"])
+        self.assertEqual([r["case_id"] for r in summary["rows"]], ["smoke-explicit", "smoke-implicit", "smoke-negative"])
+        self.assertEqual(summary["pass_count"], 1)
+        grade = json.loads(
+            (self.artifacts / "graded" / "work" / "uv-fake-test-only" / "smoke-negative" / "grade.json").read_text()
+        )
+        self.assertIn({"id": "must_include", "pass": True, "notes": "invoked_skills"}, grade["case_checks"])
+        self.assertEqual(grade["deterministic"]["exit_code"], 0)
+
+        def unmet(*a, **kw):
+            return [dataclasses.replace(c, require_files=["missing.txt"]) for c in select(*a, **kw)]
+
+        with mock.patch.object(run_skill_evals, "_select_cases", unmet), mock.patch("sys.stderr"):
+            run_skill_evals.main(["regrade", "--run-id", "graded"])
+        summary = json.loads((self.artifacts / "graded" / "summary.json").read_text(encoding="utf-8"))
+        self.assertEqual(summary["pass_count"], 0)
+
+    def test_regrade_of_cached_rows_leaves_source_run_untouched(self) -> None:
+        stub = ("--backend", "stub", "--stub-exec", str(self.base / "bin" / "codex"))
+        self._main(*stub, run_id="source")
+        self._main(*stub, run_id="reuse")
+        source_dir = self.artifacts / "source" / "work" / "uv-fake-test-only" / "smoke-negative"
+        before = {p.name: p.read_bytes() for p in source_dir.iterdir() if p.is_file()}
+        select = run_skill_evals._select_cases
+
+        def unmet(*a, **kw):
+            return [dataclasses.replace(c, require_files=["missing.txt"]) for c in select(*a, **kw)]
+
+        with mock.patch.object(run_skill_evals, "_select_cases", unmet), mock.patch("sys.stderr"):
+            run_skill_evals.main(["regrade", "--run-id", "reuse"])
+        self.assertEqual({p.name: p.read_bytes() for p in source_dir.iterdir() if p.is_file()}, before)
+
+        summary = json.loads((self.artifacts / "reuse" / "summary.json").read_text(encoding="utf-8"))
+        self.assertEqual(summary["pass_count"], 0)
+        self.assertTrue(all(r["cached"] and r["notes"].startswith("cached") for r in summary["rows"]))
+        reuse_dir = self.artifacts / "reuse" / "work" / "uv-fake-test-only" / "smoke-negative"
+        self.assertFalse(reuse_dir.is_symlink())
+        grade = json.loads((reuse_dir / "grade.json").read_text(encoding="utf-8"))
+        self.assertIn({"id": "require_files", "pass": False, "notes": "missing.txt"}, grade["case_checks"])
+
+    def test_replay_backend_reproduces_stub_run_offline(self) -> None:
+        stub = str(self.base / "bin" / "codex")
+        self._main("--backend", "stub", "--stub-exec", stub, run_id="recorded")
+        with mock.patch.dict(os.environ, {"PATH": ""}):
+            self._main("--backend", "replay", "--replay-from", "recorded", run_id="replayed")
+
+        recorded = json.loads((self.artifacts / "recorded" / "summary.json").read_text(encoding="utf-8"))
+        replayed = json.loads((self.artifacts / "replayed" / "summary.json").read_text(encoding="utf-8"))
+        self.assertEqual((recorded["backend"], replayed["backend"]), ("stub", "replay"))
+        self.assertEqual([r["pass"] for r in replayed["rows"]], [r["pass"] for r in recorded["rows"]])
+        self.assertEqual(
+            [r["deterministic"]["usage"] for r in replayed["rows"]], [r["deterministic"]["usage"] for r in recorded["rows"]]
+        )
+        self.assertLess(replayed["timings"]["agent_s"], recorded["timings"]["agent_s"])
+        for name in ("trace.jsonl", "final.txt"):
+            self.assertEqual(
+                (self.artifacts / "replayed" / "work" / "uv-fake-test-only" / "smoke-explicit" / name).read_text(),
+                (self.artifacts / "recorded" / "work" / "uv-fake-test-only" / "smoke-explicit" / name).read_text(),
+            )
+
+    def test_unchanged_cases_are_served_from_cache(self) -> None:
+        stub = ("--backend", "stub", "--stub-exec", str(self.base / "bin" / "codex"))
+        self._main(*stub, run_id="first")
+        # A partial attempt left behind in the new run must not be paired with the cached grade.
+        stale = self.artifacts / "second" / "work" / "uv-fake-test-only" / "smoke-explicit"
+        stale.mkdir(parents=True)
+        (stale / "final.txt").write_text("partial\n", encoding="utf-8")
+        self._main(*stub, "--resume", run_id="second")
+        self.assertTrue(stale.is_symlink())
+        self.assertEqual(
+            (stale / "final.txt").read_text(encoding="utf-8"),
+            (self.artifacts / "first" / "work" / "uv-fake-test-only" / "smoke-explicit" / "final.txt").read_text(encoding="utf-8"),
+        )
+        second = json.loads((self.artifacts / "second" / "summary.json").read_text(encoding="utf-8"))
+        self.assertEqual(second["cached"], 3)
+        self.assertEqual(second["timings"]["agent_s"], 0)
+        row = second["rows"][0]
+        self.assertEqual(row["case_dir"], str(self.artifacts / "second" / "work" / "uv-fake-test-only" / "smoke-explicit"))
+        self.assertEqual(row["cached_from"], str(self.artifacts / "first" / "work" / "uv-fake-test-only" / "smoke-explicit"))
+        self.assertTrue((self.artifacts / "second" / "work" / "uv-fake-test-only" / "smoke-explicit" / "trace.jsonl").exists())
+
+        # Judging the cached run detaches its case dirs instead of writing into "first".
+        self._main(*stub, "--judge-only", run_id="second")
+        first_dir = self.artifacts / "first" / "work" / "uv-fake-test-only" / "smoke-explicit"
+        self.assertFalse((first_dir / "judge.normalized.json").exists())
+        second_dir = self.artifacts / "second" / "work" / "uv-fake-test-only" / "smoke-explicit"
+        self.assertFalse(second_dir.is_symlink())
+        self.assertTrue((second_dir / "judge.normalized.json").exists())
+
+        self._main(*stub, "--no-cache", run_id="third")
+        third = json.loads((self.artifacts / "third" / "summary.json").read_text(encoding="utf-8"))
+        self.assertEqual(third["cached"], 0)
+
+        skill_md = self.base / "skills" / "uv-fake" / "SKILL.md"
+        skill_md.write_text(skill_md.read_text(encoding="utf-8") + "More.\n", encoding="utf-8")
+        self._main(*stub, run_id="fourth")
+        fourth = json.loads((self.artifacts / "fourth" / "summary.json").read_text(encoding="utf-8"))
+        self.assertEqual(fourth["cached"], 0)
+
+    def test_workspaces_clone_templates_without_spawning(self) -> None:
+        fixture = self.base / "fixture"
+        (fixture / "data").mkdir(parents=True)
+        (fixture / "data" / "input.txt").write_text("in\n", encoding="utf-8")
+        run_root = self.artifacts / "r1"
+        snapshot = run_root / "skills_snapshot"
+        snapshot.mkdir(parents=True)
+        workspaces = run_skill_evals._Workspaces(run_root, snapshot)
+        read_only = skill_eval_lib.PromptCase(case_id="a", should_trigger=True, prompt="p", sandbox="read-only", fixture=fixture)
+        writable = dataclasses.replace(read_only, case_id="b", sandbox="workspace-write")
+
+        with mock.patch.object(run_skill_evals.subprocess, "run", wraps=run_skill_evals.subprocess.run) as spawned:
+            for case in (read_only, writable, dataclasses.replace(read_only, case_id="c")):
+                workspaces.provision(case, run_root / "work" / case.case_id)
+        self.assertEqual(spawned.call_count, 1)  # git init for the base template only
+
+        template_file = workspaces.template(read_only) / "data" / "input.txt"
+        for case_id in ("a", "b", "c"):
+            case_dir = run_root / "work" / case_id
+            self.assertEqual(os.readlink(case_dir / ".codex" / "skills"), str(snapshot.resolve()))
+            self.assertTrue((case_dir / "human_materials" / ".git").is_dir())
+            self.assertEqual((case_dir / "data" / "input.txt").read_text(encoding="utf-8"), "in\n")
+        # Even read-only cases get private copies, so a stray write cannot reach the template.
+        (run_root / "work" / "a" / "data" / "input.txt").write_text("changed\n", encoding="utf-8")
+        self.assertEqual(template_file.read_text(encoding="utf-8"), "in\n")
+        inode = os.stat(template_file).st_ino
+        for case_id in ("a", "b", "c"):
+            self.assertNotEqual(os.stat(run_root / "work" / case_id / "data" / "input.txt").st_ino, inode)
+
+    def test_streamed_trace_survives_timeout(self) -> None:
+        work_dir = self.base / "case"
+        seen = skill_eval_lib.TraceReducer()
+        run = skill_eval_lib.run_codex_exec(
+            prompt="hang",
+            work_dir=work_dir,
+            sandbox="read-only",
+            timeout_s=1,
+            trace_path=work_dir / "trace.jsonl",
+            stderr_path=work_dir / "stderr.txt",
+            on_event=seen.update,
+        )
+        self.assertEqual(run.exit_code, 124)
+        self.assertEqual(run.stdout, "")
+        self.assertIn("TIMEOUT after 1s", (work_dir / "stderr.txt").read_text(encoding="utf-8"))
+        events = list(run.iter_events())
+        self.assertEqual(events[0]["item"]["command"], "make")
+        self.assertEqual((seen.commands_total, seen.commands_effective), (1, 1))
+        self.assertEqual(seen.as_dict()["command_count_total"], len(skill_eval_lib.extract_commands(events)))
+
+
+    def test_trace_reducer_matches_live_and_archived(self) -> None:
+        events = [
+            {"type": "turn.started"},
+            {"type": "item.started", "item": {"id": "c1", "type": "command_execution", "command": "make"}},
+            {"type": "item.updated", "item": {"id": "c1", "type": "command_execution", "aggregated_output": "..."}},
+            {"type": "item.completed", "item": {"id": "c1", "type": "command_execution", "command": "make"}},
+            {"type": "item.completed", "item": {"id": "c1", "type": "command_execution", "command": "make"}},
+            {"type": "item.completed", "item": {"id": "m1", "type": "agent_message", "text": "mentions turn.completed"}},
+            {"type": "turn.completed", "usage": {"input_tokens": 10, "output_tokens": "2"}},
+        ]
+        trace = self.base / "trace.jsonl"
+        trace.write_text("".join(json.dumps(e) + "\n" for e in events) + "not json\n", encoding="utf-8")
+
+        live = skill_eval_lib.TraceReducer()
+        for now, event in enumerate(events):
+            live.update(event, float(now))
+        with mock.patch.object(skill_eval_lib, "_parse_event_line", wraps=skill_eval_lib._parse_event_line) as parsed:
+            archived = skill_eval_lib.TraceReducer.from_trace(trace)
+        self.assertEqual(parsed.call_count, len(events) - 1)  # the item.updated delta is never decoded
+
+        for reducer in (live, archived):
+            self.assertEqual(reducer.as_dict(), {**live.as_dict(), "events": 7})
+        self.assertEqual((archived.commands, archived.final_message), (["make"], "mentions turn.completed"))
+        self.assertEqual(archived.usage()["total_tokens"], 12)
+        self.assertEqual(skill_eval_lib.extract_token_usage(events), archived.usage())
+        self.assertIsNone(archived.timings())
+        timings = live.timings()
+        self.assertEqual(timings["turn_durations_s"], [6.0])
+        self.assertEqual((timings["tool_calls"], timings["tool_latency_hist"]["<=5s"]), (1, 1))
+
+    def test_callback_error_kills_run_instead_of_waiting(self) -> None:
+        work_dir = self.base / "case"
+
+        def on_event(event: dict) -> object:
+            raise RuntimeError("callback failed")
+
+        started = time.monotonic()
+        with self.assertRaisesRegex(RuntimeError, "callback failed"):
+            skill_eval_lib.run_codex_exec(
+                prompt="hang",
+                work_dir=work_dir,
+                sandbox="read-only",
+                timeout_s=30,
+                trace_path=work_dir / "trace.jsonl",
+                stderr_path=work_dir / "stderr.txt",
+                on_event=on_event,
+            )
+        self.assertLess(time.monotonic() - started, 10)
+
+    def test_budget_violation_kills_run_and_fails_case(self) -> None:
+        work_dir = self.base / "case"
+        case = skill_eval_lib.PromptCase(case_id="c", should_trigger=True, prompt="hang", max_commands=0)
+        counters = skill_eval_lib.TraceReducer()
+
+        def on_event(event: dict) -> object:
+            counters.update(event)
+            return counters.budget_violation(case)
+
+        run = skill_eval_lib.run_codex_exec(
+            prompt=case.prompt,
+            work_dir=work_dir,
+            sandbox="read-only",
+            timeout_s=30,
+            trace_path=work_dir / "trace.jsonl",
+            stderr_path=work_dir / "stderr.txt",
+            on_event=on_event,
+        )
+        self.assertLess(run.duration_s, 10)
+        self.assertEqual(run.stop_reason, "max_commands exceeded: effective=1 > 0")
+        self.assertIn("STOPPED: max_commands exceeded", (work_dir / "stderr.txt").read_text(encoding="utf-8"))
+
+        skill = run_skill_evals.discover_skills()[0]
+        det, checks = run_skill_evals._grade_case(
+            skill=skill, case=case, case_dir=work_dir, run=run, final_path=work_dir / "final.txt"
+        )
+        self.assertFalse(det["pass"])
+        self.assertEqual(det["budget_exceeded"], run.stop_reason)
+        self.assertEqual(det["command_count_effective"], 1)
+        self.assertIn({"id": "budget", "pass": False, "notes": run.stop_reason}, checks)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,168 @@
+import json
+import os
+import sys
+import tempfile
+import textwrap
+import time
+import unittest
+from pathlib import Path
+
+
+# Scripts import each other as top-level modules (they run as `python bootstrap/scripts/x.py`).
+SCRIPTS_DIR = Path(__file__).resolve().parent
+if str(SCRIPTS_DIR) not in sys.path:
+    sys.path.insert(0, str(SCRIPTS_DIR))
+
+
+def _write_skill(root: Path, rel_dir: str, name: str, description: str = "Example skill.") -> Path:
+    skill_dir = root / rel_dir
+    skill_dir.mkdir(parents=True, exist_ok=True)
+    skill_md = skill_dir / "SKILL.md"
+    skill_md.write_text(
+        textwrap.dedent(
+            f"""\
+            ---
+            name: {name}
+            description: {description}
+            ---
+
+            # {name}
+            """
+        ),
+        encoding="utf-8",
+    )
+    return skill_md
+
+
+def _age_tree(root: Path, seconds: float = 60.0) -> None:
+    # Push mtimes out of the racy window so the next load can trust cached stats.
+    past = time.time() - seconds
+    for dirpath, _, filenames in os.walk(root):
+        for fname in filenames:
+            os.utime(Path(dirpath) / fname, (past, past))
+        os.utime(dirpath, (past, past))
+
+
+class SkillCatalogTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.root = Path(self.temp_dir.name).resolve()
+        self.index = self.root / "artifacts" / "skill-catalog.json"
+        _write_skill(self.root, "common/alpha", "uv-alpha")
+        _write_skill(self.root, "knowledge/ML/beta", "uv-beta", "Beta skill.")
+        _write_skill(self.root, "productivity/.hidden/gamma", "uv-gamma")
+
+    def _load(self):
+        import skill_catalog
+
+        return skill_catalog.load_catalog(self.root, index_path=self.index)
+
+    def test_discovers_skills_and_writes_index(self) -> None:
+        catalog = self._load()
+        self.assertEqual([e.path for e in catalog], ["common/alpha", "knowledge/ML/beta"])
+        beta = catalog.by_name("uv-beta")
+        self.assertIsNotNone(beta)
+        self.assertEqual(beta.slug, "uv-beta")
+        self.assertEqual(beta.description, "Beta skill.")
+        self.assertEqual(len(beta.sha256), 64)
+        self.assertEqual(catalog.by_slug("uv-alpha").skill_dir(self.root), self.root / "common" / "alpha")
+        self.assertEqual([e.name for e in catalog.under(self.root / "knowledge")], ["uv-beta"])
+
+        data = json.loads(self.index.read_text(encoding="utf-8"))
+        self.assertEqual(len(data["skills"]), 2)
+
+    def test_refresh_rereads_only_changed_entries(self) -> None:
+        self._load()
+        _age_tree(self.root)
+        first = self._load()
+        alpha_hash = first.by_name("uv-alpha").sha256
+
+        # Poison the cached description: an unchanged stat must be served from the index.
+        data = json.loads(self.index.read_text(encoding="utf-8"))
+        for entry in data["skills"]:
+            entry["description"] = "cached"
+        self.index.write_text(json.dumps(data), encoding="utf-8")
+
+        _write_skill(self.root, "common/alpha", "uv-alpha", "Changed description.")
+        _write_skill(self.root, "human/delta", "uv-delta")
+        catalog = self._load()
+
+        self.assertEqual(catalog.by_name("uv-alpha").description, "Changed description.")
+        self.assertNotEqual(catalog.by_name("uv-alpha").sha256, alpha_hash)
+        self.assertEqual(catalog.by_name("uv-beta").description, "cached")
+        self.assertIsNotNone(catalog.by_name("uv-delta"))
+
+    def test_removed_skill_drops_out(self) -> None:
+        self._load()
+        (self.root / "common" / "alpha" / "SKILL.md").unlink()
+        catalog = self._load()
+        self.assertIsNone(catalog.by_name("uv-alpha"))
+        self.assertEqual(len(catalog), 1)
+
+
+class FrontmatterTests(unittest.TestCase):
+    def _parse(self, text: str):
+        import skill_frontmatter
+
+        return skill_frontmatter.parse_frontmatter(textwrap.dedent(text).splitlines())
+
+    def test_scalar_keys_and_quotes(self) -> None:
+        fm = self._parse(
+            """\
+            ---
+            name: uv-example
+            description: "Quoted: with \\"escapes\\""
+            license: 'It''s MIT'
+            name: ignored-duplicate
+            ---
+            """
+        )
+        self.assertEqual(fm["name"], "uv-example")
+        self.assertEqual(fm["description"], 'Quoted: with "escapes"')
+        self.assertEqual(fm["license"], "It's MIT")
+
+    def test_block_and_multiline_scalars(self) -> None:
+        fm = self._parse(
+            """\
+            ---
+            name: uv-example
+            description: >
+              Folded first line
+              continues here.
+
+              Second paragraph.
+            notes: |
+              line one
+              line two
+            summary: plain value
+              wrapped onto a second line
+            metadata:
+              author: someone
+            tags:
+              - a
+            ---
+            body: not frontmatter
+            """
+        )
+        self.assertEqual(fm["description"], "Folded first line continues here.\nSecond paragraph.")
+        self.assertEqual(fm["notes"], "line one\nline two")
+        self.assertEqual(fm["summary"], "plain value wrapped onto a second line")
+        self.assertEqual(fm["metadata"], "")
+        self.assertEqual(fm["tags"], "")
+        self.assertNotIn("author", fm)
+        self.assertNotIn("body", fm)
+
+    def test_missing_frontmatter(self) -> None:
+        self.assertIsNone(self._parse("# Title\n"))
+
+    def test_reader_stops_at_closing_delimiter(self) -> None:
+        import skill_frontmatter
+
+        lines = iter(["---\n", "name: uv-x\n", "---\n", "rest\n"])
+        self.assertEqual(skill_frontmatter.parse_frontmatter(lines), {"name": "uv-x"})
+        self.assertEqual(next(lines), "rest\n")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,86 @@
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+
+# Scripts import each other as top-level modules (they run as `python bootstrap/scripts/x.py`).
+SCRIPTS_DIR = Path(__file__).resolve().parent
+if str(SCRIPTS_DIR) not in sys.path:
+    sys.path.insert(0, str(SCRIPTS_DIR))
+
+from skill_snapshot_store import SnapshotStore, referenced_objects, write_manifest  # noqa: E402
+
+
+class SnapshotStoreTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.base = Path(self.temp_dir.name)
+        self.skill = self.base / "src" / "uv-a"
+        (self.skill / "scripts").mkdir(parents=True)
+        (self.skill / "SKILL.md").write_text("---\nname: uv-a\n---\n", encoding="utf-8")
+        (self.skill / "scripts" / "run.sh").write_text("#!/bin/sh\n", encoding="utf-8")
+        (self.skill / "scripts" / "run.sh").chmod(0o755)
+        (self.skill / "copy.md").write_text("---\nname: uv-a\n---\n", encoding="utf-8")
+        self._age_sources()
+        self.runs = self.base / "runs"
+        self.store_path = self.runs / ".store"
+
+    def _age_sources(self) -> None:
+        # Stat matches are only trusted for files older than the racy window.
+        old = 1_000_000_000
+        for dirpath, _, filenames in os.walk(self.skill):
+            for fname in filenames:
+                os.utime(Path(dirpath) / fname, (old, old))
+
+    def _snapshot(self, run_id: str):
+        store = SnapshotStore(self.store_path)
+        run_root = self.runs / run_id
+        manifest, stats = store.materialize([("uv-a", self.skill)], run_root / "skills_snapshot")
+        write_manifest(run_root, manifest)
+        return manifest, stats
+
+    def test_snapshots_share_objects_and_rehash_only_changed_files(self) -> None:
+        manifest, stats = self._snapshot("r1")
+        self.assertEqual((stats.files, stats.hashed, stats.stored), (3, 3, 2))
+        self.assertEqual(manifest["uv-a/SKILL.md"], manifest["uv-a/copy.md"])
+        self.assertTrue(manifest["uv-a/scripts/run.sh"].endswith("x"))
+        linked = self.runs / "r1" / "skills_snapshot" / "uv-a" / "scripts" / "run.sh"
+        self.assertTrue(os.access(linked, os.X_OK))
+
+        (self.skill / "copy.md").write_text("changed\n", encoding="utf-8")
+        self._age_sources()
+        manifest2, stats = self._snapshot("r2")
+        self.assertEqual((stats.hashed, stats.stored), (1, 1))
+        self.assertEqual(
+            os.stat(self.runs / "r2" / "skills_snapshot" / "uv-a" / "SKILL.md").st_ino,
+            os.stat(self.runs / "r1" / "skills_snapshot" / "uv-a" / "SKILL.md").st_ino,
+        )
+        self.assertNotEqual(manifest2["uv-a/copy.md"], manifest["uv-a/copy.md"])
+
+    def test_gc_drops_objects_no_run_references(self) -> None:
+        self._snapshot("r1")
+        (self.skill / "copy.md").write_text("changed\n", encoding="utf-8")
+        self._age_sources()
+        self._snapshot("r2")
+
+        store = SnapshotStore(self.store_path)
+        self.assertEqual(store.gc(referenced_objects(self.runs))[0], 0)
+
+        shutil.rmtree(self.runs / "r1")
+        removed, _ = store.gc(referenced_objects(self.runs))
+        self.assertEqual(removed, 0)  # r1's copy.md content equals SKILL.md, still used by r2
+
+        shutil.rmtree(self.runs / "r2")
+        removed, freed = store.gc(referenced_objects(self.runs))
+        self.assertEqual(removed, 3)
+        self.assertGreater(freed, 0)
+        _, stats = self._snapshot("r3")
+        self.assertEqual(stats.stored, 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,282 @@
+import json
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+import zipfile
+from pathlib import Path
+
+
+# Scripts import each other as top-level modules (they run as `python bootstrap/scripts/x.py`).
+SCRIPTS_DIR = Path(__file__).resolve().parent
+if str(SCRIPTS_DIR) not in sys.path:
+    sys.path.insert(0, str(SCRIPTS_DIR))
+
+import pkb_copy_lib  # noqa: E402
+import skill_bundle  # noqa: E402
+import skill_manifest  # noqa: E402
+import update_skills_mirror  # noqa: E402
+
+
+def _stats() -> "update_skills_mirror.SyncStats":
+    return update_skills_mirror._new_stats()
+
+
+class MirrorSyncTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        base = Path(self.temp_dir.name)
+        self.src = base / "canonical" / "example"
+        self.dst = base / "skills" / "uv-example"
+        (self.src / "references").mkdir(parents=True)
+        (self.src / "SKILL.md").write_text("---\nname: uv-example\n---\n", encoding="utf-8")
+        (self.src / "references" / "notes.md").write_text("notes\n", encoding="utf-8")
+        (self.src / "assets").mkdir()
+
+    def test_initial_sync_copies_tree(self) -> None:
+        stats = _stats()
+        update_skills_mirror._sync_skill_dir(self.src, self.dst, stats)
+        self.assertEqual(stats["updated"], 1)
+        self.assertEqual(stats["files_copied"], 2)
+        self.assertEqual((self.dst / "references" / "notes.md").read_text(encoding="utf-8"), "notes\n")
+        self.assertTrue((self.dst / "assets").is_dir())
+
+    def test_unchanged_skill_is_left_alone(self) -> None:
+        update_skills_mirror._sync_skill_dir(self.src, self.dst, _stats())
+        before = os.stat(self.dst / "SKILL.md")
+        stats = _stats()
+        update_skills_mirror._sync_skill_dir(self.src, self.dst, stats)
+        self.assertEqual(stats["unchanged"], 1)
+        self.assertEqual(os.stat(self.dst / "SKILL.md").st_mtime_ns, before.st_mtime_ns)
+
+    def test_changed_and_stale_files(self) -> None:
+        update_skills_mirror._sync_skill_dir(self.src, self.dst, _stats())
+        untouched = os.stat(self.dst / "SKILL.md").st_ino
+        (self.src / "references" / "notes.md").write_text("new notes\n", encoding="utf-8")
+        (self.dst / "stale.txt").write_text("stale\n", encoding="utf-8")
+
+        stats = _stats()
+        update_skills_mirror._sync_skill_dir(self.src, self.dst, stats)
+        self.assertEqual(stats["updated"], 1)
+        self.assertEqual(stats["files_copied"], 1)
+        self.assertEqual((self.dst / "references" / "notes.md").read_text(encoding="utf-8"), "new notes\n")
+        self.assertFalse((self.dst / "stale.txt").exists())
+        self.assertEqual(os.stat(self.dst / "SKILL.md").st_ino, untouched)
+        leftovers = [p.name for p in self.dst.parent.iterdir() if p.name.startswith(".")]
+        self.assertEqual(leftovers, [])
+
+    def test_hardlink_mode_shares_inodes_and_relinks_copies(self) -> None:
+        update_skills_mirror._sync_skill_dir(self.src, self.dst, _stats())
+        self.assertNotEqual(os.stat(self.dst / "SKILL.md").st_ino, os.stat(self.src / "SKILL.md").st_ino)
+
+        stats = _stats()
+        materializer = update_skills_mirror._Materializer("hardlink", stats)
+        update_skills_mirror._sync_skill_dir(self.src, self.dst, stats, materializer)
+        self.assertEqual(stats["files_linked"], 2)
+        self.assertEqual(stats["bytes_shared"], sum(p.stat().st_size for p in self.src.rglob("*") if p.is_file()))
+        self.assertEqual(os.stat(self.dst / "SKILL.md").st_ino, os.stat(self.src / "SKILL.md").st_ino)
+
+        stats = _stats()
+        update_skills_mirror._sync_skill_dir(
+            self.src, self.dst, stats, update_skills_mirror._Materializer("hardlink", stats)
+        )
+        self.assertEqual(stats["unchanged"], 1)
+
+        # Going back to copy mode un-shares the files again.
+        stats = _stats()
+        update_skills_mirror._sync_skill_dir(self.src, self.dst, stats)
+        self.assertEqual(stats["files_copied"], 2)
+        self.assertNotEqual(os.stat(self.dst / "SKILL.md").st_ino, os.stat(self.src / "SKILL.md").st_ino)
+
+    def test_reflink_falls_back_to_copy(self) -> None:
+        stats = _stats()
+        materializer = update_skills_mirror._Materializer("auto", stats)
+        update_skills_mirror._sync_skill_dir(self.src, self.dst, stats, materializer)
+        self.assertEqual(stats["files_copied"] + stats["files_linked"] + stats["files_reflinked"], 2)
+        self.assertEqual((self.dst / "references" / "notes.md").read_text(encoding="utf-8"), "notes\n")
+
+    def test_quick_check_uses_stat_then_hash(self) -> None:
+        update_skills_mirror._sync_skill_dir(self.src, self.dst, _stats())
+        src_md, dst_md = self.src / "SKILL.md", self.dst / "SKILL.md"
+        self.assertTrue(update_skills_mirror._quick_same(src_md, dst_md))
+
+        os.utime(dst_md, ns=(0, 0))
+        self.assertTrue(update_skills_mirror._quick_same(src_md, dst_md))
+        dst_md.write_text("---\nname: uv-exampLE\n---\n", encoding="utf-8")
+        self.assertFalse(update_skills_mirror._quick_same(src_md, dst_md))
+
+
+class ReadmeTreeTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.top = Path(self.temp_dir.name) / "group"
+        for rel, name in [("alpha", "uv-alpha"), ("nested/beta", "uv-beta"), ("nested/.hidden/gamma", "uv-gamma")]:
+            (self.top / rel).mkdir(parents=True)
+            (self.top / rel / "SKILL.md").write_text(
+                f"---\nname: {name}\ndescription: {name} skill\n---\n", encoding="utf-8"
+            )
+        (self.top / "alpha" / "references").mkdir()
+        (self.top / "alpha" / "references" / "README.md").write_text("# refs\n", encoding="utf-8")
+        (self.top / "nested" / "README.md").write_text("# Nested\n\nNested group.\n", encoding="utf-8")
+        (self.top / "vendored" / ".git").mkdir(parents=True)
+        (self.top / "tool.py").write_text("", encoding="utf-8")
+        (self.top / "data.bin").write_text("", encoding="utf-8")
+
+    def test_tree_flags_and_counts(self) -> None:
+        tree = update_skills_mirror._RepoTree(self.top)
+        self.assertEqual(tree.root.skill_count, 3)
+        self.assertEqual(tree.node(self.top / "nested").skill_count, 2)
+        self.assertTrue(tree.node(self.top / "alpha" / "references").under_skill)
+        self.assertFalse(tree.node(self.top / "nested").under_skill)
+        self.assertTrue(tree.node(self.top / "vendored").in_submodule)
+        self.assertFalse(tree.root.in_submodule)
+
+    def test_table_rows(self) -> None:
+        table = update_skills_mirror._readme_table_for_dir(self.top)
+        self.assertEqual(
+            table.splitlines()[2:],
+            [
+                "| `alpha/` | skill | uv-alpha skill |",
+                "| `nested/` | group | Nested group. (2 skill(s)) |",
+                "| `tool.py` | file | Script |",
+                "| `vendored/` | dir |  |",
+            ],
+        )
+
+
+class WatchHelperTests(unittest.TestCase):
+    def test_snapshot_diff_and_owning_skills(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            (root / "a" / ".git").mkdir(parents=True)
+            (root / "a" / "SKILL.md").write_text("x\n", encoding="utf-8")
+            before = update_skills_mirror._snapshot([root])
+            self.assertNotIn(str(root / "a" / ".git"), before)
+
+            (root / "a" / "SKILL.md").write_text("longer\n", encoding="utf-8")
+            (root / "a" / "refs").mkdir()
+            after = update_skills_mirror._snapshot([root])
+            self.assertEqual(
+                update_skills_mirror._changed_paths(before, after),
+                {str(root / "a" / "SKILL.md"), str(root / "a" / "refs")},
+            )
+
+        skills = {"common/outer", "common/outer/inner"}
+        self.assertEqual(
+            update_skills_mirror._owning_skills("common/outer/inner/refs/x.md", skills),
+            ["common/outer/inner", "common/outer"],
+        )
+        self.assertEqual(update_skills_mirror._owning_skills("common/README.md", skills), [])
+
+
+class ManifestDigestTests(unittest.TestCase):
+    def test_digest_and_stale_detection(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            base = Path(tmp)
+            skill = base / "mirror" / "uv-a"
+            (skill / "refs").mkdir(parents=True)
+            (skill / "SKILL.md").write_text("12345678", encoding="utf-8")
+            (skill / "refs" / "blob.bin").write_bytes(b"\0\1")
+            digest = skill_manifest.digest_tree(skill)
+            self.assertEqual(sorted(digest.files), ["SKILL.md", "refs/blob.bin"])
+            self.assertEqual(digest.bytes, 10)
+            self.assertEqual(digest.est_tokens, 2)
+            self.assertEqual(digest.tree_sha256, skill_manifest.tree_sha256(dict(reversed(digest.files.items()))))
+
+            entries = [
+                {"slug": "uv-a", **digest.manifest_fields()},
+                {"slug": "uv-b", "name": "uv-b"},
+            ]
+            install = base / "install"
+            pkb_copy_lib.copy_skill_dir(skill, install / "uv-a")
+            self.assertEqual(skill_manifest.stale_skills(entries, install), ["uv-b"])
+
+            (install / "uv-a" / "SKILL.md").write_text("87654321", encoding="utf-8")
+            self.assertEqual(skill_manifest.stale_skills(entries, install, ["uv-a"]), ["uv-a"])
+
+            # A selected slug the manifest does not know about is never assumed installed.
+            self.assertEqual(skill_manifest.stale_skills(entries[:1], install, ["uv-b", "uv-c"]), ["uv-b", "uv-c"])
+
+
+class BundleTests(unittest.TestCase):
+    def test_pack_and_extract_selected_skills(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            base = Path(tmp)
+            skills_root = base / "skills"
+            manifest = []
+            for slug in ("uv-a", "uv-b"):
+                (skills_root / slug / "scripts").mkdir(parents=True)
+                (skills_root / slug / "SKILL.md").write_text(f"{slug}\n", encoding="utf-8")
+                tool = skills_root / slug / "scripts" / "run.sh"
+                tool.write_text("#!/bin/sh\n", encoding="utf-8")
+                tool.chmod(0o755)
+                digest = skill_manifest.digest_tree(skills_root / slug)
+                manifest.append({"slug": slug, "name": slug, **digest.manifest_fields()})
+            (skills_root / "manifest.json").write_text(json.dumps(manifest), encoding="utf-8")
+
+            bundle_path = base / "bundle.zip"
+            self.assertEqual(skill_bundle.write_bundle(skills_root, bundle_path), 4)
+            first = bundle_path.read_bytes()
+            skill_bundle.write_bundle(skills_root, bundle_path)
+            self.assertEqual(bundle_path.read_bytes(), first)
+
+            install = base / "install"
+            install.mkdir()
+            with skill_bundle.SkillBundle(bundle_path) as bundle:
+                self.assertEqual(bundle.slugs(), ["uv-a", "uv-b"])
+                self.assertEqual(bundle.extract(["uv-b"], install), (["uv-b"], []))
+                self.assertFalse((install / "uv-a").exists())
+                self.assertTrue(os.access(install / "uv-b" / "scripts" / "run.sh", os.X_OK))
+                self.assertEqual(bundle.extract(["uv-a", "uv-b"], install), (["uv-a"], ["uv-b"]))
+            self.assertEqual(skill_manifest.stale_skills(manifest, install), [])
+
+            evil = base / "evil.zip"
+            with zipfile.ZipFile(evil, "w") as zf:
+                zf.writestr("manifest.json", json.dumps([{"slug": "../escape", "files": {}}]))
+            with self.assertRaisesRegex(ValueError, "unsafe skill slug"):
+                skill_bundle.SkillBundle(evil)
+
+
+class CopyEngineTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.base = Path(self.temp_dir.name)
+        self.jobs = []
+        for i in range(6):
+            src = self.base / "src" / f"skill-{i}"
+            (src / "references").mkdir(parents=True)
+            (src / "SKILL.md").write_text(f"skill {i}\n", encoding="utf-8")
+            (src / "references" / "a.md").write_text("a" * i, encoding="utf-8")
+            self.jobs.append(pkb_copy_lib.CopyJob(key=f"skill-{i}", src=src, dst=self.base / "dst" / f"skill-{i}"))
+
+    def test_results_follow_job_order_and_replace_existing(self) -> None:
+        stale = self.jobs[2].dst / "stale.txt"
+        stale.parent.mkdir(parents=True)
+        stale.write_text("stale\n", encoding="utf-8")
+
+        results = pkb_copy_lib.run_copy_jobs(self.jobs, max_workers=4)
+        self.assertEqual([r.key for r in results], [j.key for j in self.jobs])
+        self.assertEqual([r.files for r in results], [2] * 6)
+        self.assertEqual(results[3].bytes, len("skill 3\n") + 3)
+        self.assertFalse(stale.exists())
+        self.assertEqual((self.jobs[5].dst / "references" / "a.md").read_text(encoding="utf-8"), "aaaaa")
+
+    def test_failure_is_raised_after_other_jobs_finish(self) -> None:
+        def copy(job):
+            if job.key == "skill-1":
+                raise OSError("boom")
+            return pkb_copy_lib.copy_skill_dir(job.src, job.dst)
+
+        for workers in (3, 1):
+            with self.assertRaisesRegex(OSError, "boom"):
+                pkb_copy_lib.run_copy_jobs(self.jobs, copy, max_workers=workers)
+            self.assertTrue(all((j.dst / "SKILL.md").is_file() for j in self.jobs if j.key != "skill-1"))
+            shutil.rmtree(self.base / "dst")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -3,12 +3,23 @@
 from __future__ import annotations
 
 import argparse
+import difflib
+import hashlib
 import json
+import os
 import re
 import shutil
 import sys
+import time
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Iterable, Optional, TypedDict
+from typing import Iterator, Optional, TypedDict
+
+from pkb_copy_lib import CopyJob, default_jobs, format_timings, reflink_file, run_copy_jobs
+from skill_bundle import default_bundle_path, write_bundle
+from skill_catalog import CatalogEntry, SkillCatalog, load_catalog
+from skill_frontmatter import read_frontmatter
+from skill_manifest import FileDigest, digest_tree, tree_sha256
 
 
 ROOT = Path(__file__).resolve().parents[2]
@@ -35,47 +46,234 @@ def _rmtree(path: Path) -> None:
         shutil.rmtree(path)
 
 
-def _copytree(src: Path, dst: Path) -> None:
+def _copytree(src: Path, dst: Path, copy_function=shutil.copy2) -> None:
     if dst.exists():
         _rmtree(dst)
     _ensure_dir(dst.parent)
-    shutil.copytree(src, dst, copy_function=shutil.copy2)
+    shutil.copytree(src, dst, copy_function=copy_function)
+
+
+def _file_digest(path: Path) -> str:
+    h = hashlib.sha256()
+    with path.open("rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def _tree_listing(root: Path) -> tuple[dict[str, Path], set[str]]:
+    """Relative files and directories under `root`, following symlinks like `copytree`."""
+    files: dict[str, Path] = {}
+    dirs: set[str] = set()
+    if not root.is_dir():
+        return files, dirs
+    for dirpath, dirnames, filenames in os.walk(root, followlinks=True):
+        base = Path(dirpath)
+        rel_base = base.relative_to(root)
+        for name in dirnames:
+            dirs.add((rel_base / name).as_posix())
+        for name in filenames:
+            files[(rel_base / name).as_posix()] = base / name
+    return files, dirs
+
+
+def _same_content(src: Path, dst: Optional[Path], *, link_policy: str = "any") -> bool:
+    """
+    Whether `dst` already mirrors `src`. `link_policy` is "require" (dst must share
+    src's inode), "forbid" (dst must be an independent file) or "any".
+    """
+    if dst is None:
+        return False
+    try:
+        src_st = src.stat()
+        dst_st = dst.stat()
+    except OSError:
+        return False
+    if src_st.st_size != dst_st.st_size:
+        return False
+    if (src_st.st_mode & 0o777) != (dst_st.st_mode & 0o777):
+        return False
+    if (src_st.st_ino, src_st.st_dev) == (dst_st.st_ino, dst_st.st_dev):
+        return link_policy != "forbid"
+    if link_policy == "require":
+        # Relinking is metadata-only, so skip hashing and let the sync share the inode.
+        return False
+    return _file_digest(src) == _file_digest(dst)
 
 
-def _parse_frontmatter_name(skill_md: Path) -> str:
-    content = skill_md.read_text(encoding="utf-8", errors="replace").splitlines()
-    if not content or content[0].strip() != "---":
-        raise ValueError(f"SKILL.md missing frontmatter: {skill_md}")
-    for line in content[1:100]:
-        if line.strip() == "---":
-            break
-        if line.startswith("name:"):
-            return line.split(":", 1)[1].strip().strip("'\"")
-    raise ValueError(f"SKILL.md missing name: {skill_md}")
+LINK_MODES = ("copy", "hardlink", "reflink", "auto")
 
 
-def _parse_frontmatter_description(skill_md: Path) -> str:
-    content = skill_md.read_text(encoding="utf-8", errors="replace").splitlines()
-    if not content or content[0].strip() != "---":
-        return ""
-    for line in content[1:150]:
-        if line.strip() == "---":
-            break
-        if line.startswith("description:"):
-            return line.split(":", 1)[1].strip().strip("'\"")
-    return ""
+class SyncStats(TypedDict):
+    updated: int
+    unchanged: int
+    removed: int
+    files_copied: int
+    files_linked: int
+    files_reflinked: int
+    bytes_copied: int
+    bytes_shared: int
 
 
-def _parse_frontmatter_license(skill_md: Path) -> str:
-    content = skill_md.read_text(encoding="utf-8", errors="replace").splitlines()
-    if not content or content[0].strip() != "---":
-        return ""
-    for line in content[1:200]:
-        if line.strip() == "---":
-            break
-        if line.startswith("license:"):
-            return line.split(":", 1)[1].strip().strip("'\"")
-    return ""
+def _new_stats() -> SyncStats:
+    return {
+        "updated": 0,
+        "unchanged": 0,
+        "removed": 0,
+        "files_copied": 0,
+        "files_linked": 0,
+        "files_reflinked": 0,
+        "bytes_copied": 0,
+        "bytes_shared": 0,
+    }
+
+
+class _Materializer:
+    """
+    Places one canonical file into the mirror according to `--link-mode`.
+
+    `auto` prefers reflinks (independent copy-on-write files), then hardlinks, then
+    a plain copy. A method that fails once (e.g. EXDEV, EPERM, no FICLONE support)
+    is not retried for the rest of the run; pass the same `failed` set to every
+    per-skill materializer so concurrent workers share that knowledge.
+    """
+
+    def __init__(self, mode: str, stats: SyncStats, failed: Optional[set[str]] = None) -> None:
+        if mode not in LINK_MODES:
+            raise ValueError(f"Unknown link mode: {mode!r}")
+        self.mode = mode
+        self.stats = stats
+        self.failed: set[str] = failed if failed is not None else set()
+        self.methods = {
+            "copy": (),
+            "hardlink": ("hardlink",),
+            "reflink": ("reflink",),
+            "auto": ("reflink", "hardlink"),
+        }[mode]
+
+    @property
+    def link_policy(self) -> str:
+        if self.mode == "hardlink":
+            return "any" if "hardlink" in self.failed else "require"
+        if self.mode == "auto":
+            return "any"
+        # copy/reflink promise independent files; undo hardlinks from an earlier run.
+        return "forbid"
+
+    def place(self, src: Path, dst: Path) -> None:
+        size = src.stat().st_size
+        for method in self.methods:
+            if method in self.failed:
+                continue
+            try:
+                if method == "hardlink":
+                    os.link(src, dst)
+                    self.stats["files_linked"] += 1
+                else:
+                    reflink_file(src, dst)
+                    self.stats["files_reflinked"] += 1
+            except OSError:
+                self.failed.add(method)
+                continue
+            if method == "reflink":
+                # Hardlinked bytes are counted by `_hardlinked_bytes`; reflinks are not
+                # observable afterwards, so count them when they are made.
+                self.stats["bytes_shared"] += size
+            return
+        shutil.copy2(src, dst)
+        self.stats["files_copied"] += 1
+        self.stats["bytes_copied"] += size
+
+    def copy_function(self, src: str, dst: str) -> str:
+        self.place(Path(src), Path(dst))
+        return dst
+
+
+def _swap_in(staging: Path, dst: Path) -> None:
+    # Each skill flips from old to new content with two renames; readers never see
+    # a partially copied skill folder.
+    if dst.exists() or dst.is_symlink():
+        old = dst.with_name(f".{dst.name}.old-{os.getpid()}")
+        _rmtree(old)
+        os.rename(dst, old)
+        os.rename(staging, dst)
+        _rmtree(old)
+    else:
+        os.rename(staging, dst)
+
+
+def _hardlinked_bytes(src_files: dict[str, Path], dst: Path) -> int:
+    total = 0
+    for rel, path in src_files.items():
+        try:
+            src_st = path.stat()
+            dst_st = (dst / rel).stat()
+        except OSError:
+            continue
+        if (src_st.st_ino, src_st.st_dev) == (dst_st.st_ino, dst_st.st_dev):
+            total += src_st.st_size
+    return total
+
+
+def _sync_skill_dir(src: Path, dst: Path, stats: SyncStats, materializer: Optional[_Materializer] = None) -> None:
+    materializer = materializer or _Materializer("copy", stats)
+    src_files, src_dirs = _tree_listing(src)
+    if dst.is_dir() and not dst.is_symlink():
+        dst_files, dst_dirs = _tree_listing(dst)
+    else:
+        dst_files, dst_dirs = {}, set()
+
+    link_policy = materializer.link_policy
+    changed = {
+        rel
+        for rel, path in src_files.items()
+        if not _same_content(path, dst_files.get(rel), link_policy=link_policy)
+    }
+    if dst.is_dir() and not changed and src_files.keys() == dst_files.keys() and src_dirs == dst_dirs:
+        stats["unchanged"] += 1
+        stats["bytes_shared"] += _hardlinked_bytes(src_files, dst)
+        return
+
+    staging = dst.with_name(f".{dst.name}.staging-{os.getpid()}")
+    _rmtree(staging)
+    _ensure_dir(staging)
+    for rel in sorted(src_dirs):
+        _ensure_dir(staging / rel)
+    for rel, path in sorted(src_files.items()):
+        target = staging / rel
+        if rel not in changed:
+            try:
+                # Carry the unchanged mirror file over without rewriting its data.
+                os.link(dst_files[rel], target)
+                continue
+            except OSError:
+                pass
+        materializer.place(path, target)
+    shutil.copystat(src, staging)
+    _swap_in(staging, dst)
+    stats["updated"] += 1
+    stats["bytes_shared"] += _hardlinked_bytes(src_files, dst)
+
+
+def _format_bytes(n: int) -> str:
+    size = float(n)
+    for unit in ("B", "KiB", "MiB", "GiB"):
+        if size < 1024 or unit == "GiB":
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{n} B"
+
+
+def _write_if_changed(path: Path, content: str) -> bool:
+    try:
+        if path.read_text(encoding="utf-8") == content:
+            return False
+    except OSError:
+        pass
+    tmp = path.with_name(f".{path.name}.tmp-{os.getpid()}")
+    tmp.write_text(content, encoding="utf-8")
+    os.replace(tmp, path)
+    return True
 
 
 def _is_distributable_license(license_value: str) -> bool:
@@ -103,77 +301,160 @@ def _skill_slug(name: str) -> str:
     return slug
 
 
-class SkillManifestEntry(TypedDict):
+class _SkillDigestFields(TypedDict, total=False):
+    # Filled in once the mirror folder is synced (see `skill_manifest.digest_tree`).
+    tree_sha256: str
+    files: dict[str, FileDigest]
+    bytes: int
+    est_tokens: int
+
+
+class SkillManifestEntry(_SkillDigestFields):
     name: str
     slug: str
     description: str
     canonical_path: str
 
 
-def _iter_dirs_with_skill_md(root: Path) -> Iterable[Path]:
-    for skill_md in root.rglob("SKILL.md"):
-        if skill_md.name != "SKILL.md":
-            continue
-        parent = skill_md.parent
-        if parent.name.startswith("."):
-            continue
-        yield parent
+def _manifest_entry(entry: CatalogEntry) -> Optional[SkillManifestEntry]:
+    """Validate one canonical skill; returns None when it must not be mirrored."""
+    skill_dir = entry.skill_dir(ROOT)
+    skill_md = skill_dir / "SKILL.md"
+    if not entry.has_frontmatter:
+        raise ValueError(f"SKILL.md missing frontmatter: {skill_md}")
+    if not entry.name:
+        raise ValueError(f"SKILL.md missing name: {skill_md}")
+    name = entry.name
+    license_value = entry.license
+    if not _is_distributable_license(license_value):
+        print(
+            f"Skipping non-distributable skill {name!r} ({license_value}) at {skill_dir}",
+            file=sys.stderr,
+        )
+        return None
+    if not name.startswith("uv-"):
+        raise SystemExit(f"Skill name must start with 'uv-': {name!r} ({skill_md})")
+    return {
+        "name": name,
+        "slug": _skill_slug(name),
+        "description": entry.description,
+        "canonical_path": str(skill_dir.relative_to(ROOT)),
+    }
 
 
 def build_skills_mirror(
     canonical_roots: list[Path],
+    *,
+    full_rebuild: bool = False,
+    link_mode: str = "copy",
+    jobs_count: Optional[int] = None,
+    timings: int = 0,
 ) -> list[SkillManifestEntry]:
+    """
+    Mirror distributable canonical skills into `skills/<slug>/`.
+
+    By default this syncs incrementally: only skills whose content hash differs from
+    the existing mirror are restaged (unchanged files are hardlinked over from the old
+    copy) and swapped in per skill. `full_rebuild` wipes and recopies everything.
+    `link_mode` controls whether new mirror files share data with canonical files.
+    Skills are synced on `jobs_count` worker threads; `timings` prints that many of
+    the slowest per-skill sync times.
+    """
     skills_root = ROOT / "skills"
     _ensure_dir(skills_root)
+    previous = {} if full_rebuild else _load_manifest(skills_root)
 
-    # Clean generated skill folders, keep README.md.
-    for entry in skills_root.iterdir():
-        if entry.name == "README.md":
-            continue
-        _rmtree(entry)
+    if full_rebuild:
+        # Clean generated skill folders, keep README.md.
+        for entry in skills_root.iterdir():
+            if entry.name == "README.md":
+                continue
+            _rmtree(entry)
 
     imported: list[SkillManifestEntry] = []
     seen_slugs: dict[str, Path] = {}
+    jobs: list[CopyJob] = []
+    catalog = load_catalog(ROOT)
 
+    # Validate everything up front so a bad skill aborts before any folder is touched.
     for canonical_root in canonical_roots:
         if not canonical_root.exists():
             continue
-        for skill_dir in sorted(set(_iter_dirs_with_skill_md(canonical_root))):
-            skill_md = skill_dir / "SKILL.md"
-            name = _parse_frontmatter_name(skill_md)
-            description = _parse_frontmatter_description(skill_md)
-            license_value = _parse_frontmatter_license(skill_md)
-            if not _is_distributable_license(license_value):
-                print(
-                    f"Skipping non-distributable skill {name!r} ({license_value}) at {skill_dir}",
-                    file=sys.stderr,
-                )
+        for entry in catalog.under(canonical_root):
+            target = _manifest_entry(entry)
+            if target is None:
                 continue
-            if not name.startswith("uv-"):
-                raise SystemExit(f"Skill name must start with 'uv-': {name!r} ({skill_md})")
-            slug = _skill_slug(name)
+            skill_dir = entry.skill_dir(ROOT)
+            slug = target["slug"]
             if slug in seen_slugs:
                 raise SystemExit(
                     f"slug collision: {slug!r} from {skill_dir} and {seen_slugs[slug]}"
                 )
             seen_slugs[slug] = skill_dir
+            jobs.append(CopyJob(key=slug, src=skill_dir, dst=skills_root / slug))
+            imported.append(target)
+
+    # Skills are independent folders, so sync them concurrently. Each worker keeps its
+    # own stats; they are merged in job order afterwards.
+    failed: set[str] = set()
+    per_skill: dict[str, SyncStats] = {}
+    digests: dict[str, _SkillDigestFields] = {}
+    canonical_paths = {e["slug"]: e["canonical_path"] for e in imported}
+
+    def _sync_one(job: CopyJob) -> tuple[int, int]:
+        skill_stats = per_skill[job.key] = _new_stats()
+        materializer = _Materializer(link_mode, skill_stats, failed)
+        if full_rebuild:
+            _copytree(job.src, job.dst, copy_function=materializer.copy_function)
+            skill_stats["updated"] += 1
+            skill_stats["bytes_shared"] += _hardlinked_bytes(_tree_listing(job.src)[0], job.dst)
+        else:
+            _sync_skill_dir(job.src, job.dst, skill_stats, materializer)
+        prev = previous.get(canonical_paths[job.key])
+        if skill_stats["unchanged"] and prev and prev.get("slug") == job.key and "files" in prev:
+            digests[job.key] = {k: prev[k] for k in _SkillDigestFields.__annotations__ if k in prev}  # type: ignore[literal-required]
+        else:
+            digests[job.key] = digest_tree(job.dst).manifest_fields()  # type: ignore[assignment]
+        files = skill_stats["files_copied"] + skill_stats["files_linked"] + skill_stats["files_reflinked"]
+        return files, skill_stats["bytes_copied"]
+
+    results = run_copy_jobs(jobs, _sync_one, max_workers=jobs_count)
+    for target in imported:
+        target.update(digests[target["slug"]])
+    stats = _new_stats()
+    for job in jobs:
+        for key, value in per_skill[job.key].items():
+            stats[key] += value  # type: ignore[literal-required]
+
+    # Drop mirror folders for skills that were removed, renamed or became
+    # non-distributable, plus leftovers from interrupted syncs.
+    for entry in sorted(skills_root.iterdir()):
+        if entry.name in {"README.md", "manifest.json"} or entry.name in seen_slugs:
+            continue
+        _rmtree(entry)
+        if not entry.name.startswith("."):
+            stats["removed"] += 1
 
-            dst = skills_root / slug
-            _copytree(skill_dir, dst)
-
-            imported.append(
-                {
-                    "name": name,
-                    "slug": slug,
-                    "description": description,
-                    "canonical_path": str(skill_dir.relative_to(ROOT)),
-                }
-            )
-
-    (skills_root / "manifest.json").write_text(
+    _write_if_changed(
+        skills_root / "manifest.json",
         json.dumps(sorted(imported, key=lambda x: x["slug"]), indent=2, sort_keys=True) + "\n",
-        encoding="utf-8",
     )
+    print(
+        f"Mirror: {len(imported)} skills ({stats['updated']} updated, {stats['unchanged']} unchanged, "
+        f"{stats['removed']} removed; {stats['files_copied']} files copied, "
+        f"{stats['files_linked']} hardlinked, {stats['files_reflinked']} reflinked; "
+        f"{_format_bytes(stats['bytes_shared'])} shared with canonical files)",
+        file=sys.stderr,
+    )
+    if link_mode != "copy" and failed:
+        print(
+            f"NOTE: link mode {link_mode!r} fell back to copying ({', '.join(sorted(failed))} unsupported here).",
+            file=sys.stderr,
+        )
+    if timings:
+        print(f"Slowest skill syncs ({jobs_count or default_jobs()} workers):", file=sys.stderr)
+        for line in format_timings(results, top=timings):
+            print(f"  {line}", file=sys.stderr)
     return imported
 
 
@@ -200,10 +481,6 @@ def _first_paragraph(readme: Path) -> str:
     return " ".join(buf)[:220].strip()
 
 
-def _count_skills_under(path: Path) -> int:
-    return sum(1 for _ in path.rglob("SKILL.md"))
-
-
 def _load_config() -> dict:
     if not CONFIG_PATH.is_file():
         return {}
@@ -220,29 +497,89 @@ def _readme_table_roots(cfg: dict) -> list[str]:
     return list(DEFAULT_README_TABLE_ROOTS)
 
 
-def _has_skill_ancestor(dir_path: Path) -> bool:
-    for candidate in [dir_path] + list(dir_path.parents):
-        if candidate == ROOT.parent:
-            break
-        if (candidate / "SKILL.md").is_file():
-            return True
-        if candidate == ROOT:
-            break
-    return False
+@dataclass
+class _TreeNode:
+    path: Path
+    # Child name -> "dir" | "file" | "other" (symlinks resolved, like `Path.is_dir()`).
+    kinds: dict[str, str]
+    dirs: dict[str, "_TreeNode"] = field(default_factory=dict)
+    has_skill: bool = False
+    # SKILL.md files in this subtree, including this directory's own.
+    skill_count: int = 0
+    # This directory or an ancestor (up to the scan root) holds a SKILL.md.
+    under_skill: bool = False
+    # This directory or an ancestor below the scan root has a `.git` marker (submodule).
+    in_submodule: bool = False
 
 
-def _has_git_submodule_ancestor(path: Path) -> bool:
+class _RepoTree:
     """
-    Skip README.md files inside git submodules to avoid mutating vendored content.
-    A submodule typically contains a `.git` file (or directory) at its root.
+    One bottom-up scan of a directory tree with everything README tables need.
+
+    Symlinked directories are listed but not descended into (as with `rglob`), and
+    `.git` entries are only recorded as submodule markers.
     """
-    for candidate in [path] + list(path.parents):
-        if candidate == ROOT:
-            break
-        git_marker = candidate / ".git"
-        if git_marker.exists():
-            return True
-    return False
+
+    def __init__(self, top: Path) -> None:
+        self.top = top
+        self.root = self._visit(top, under_skill=False, in_submodule=False, is_top=True)
+        self._paragraphs: dict[Path, str] = {}
+
+    def _visit(self, path: Path, *, under_skill: bool, in_submodule: bool, is_top: bool) -> _TreeNode:
+        kinds: dict[str, str] = {}
+        subdirs: list[str] = []
+        try:
+            with os.scandir(path) as it:
+                for entry in it:
+                    try:
+                        is_dir = entry.is_dir()
+                        kind = "dir" if is_dir else ("file" if entry.is_file() else "other")
+                    except OSError:
+                        is_dir, kind = False, "other"
+                    kinds[entry.name] = kind
+                    if is_dir and entry.name != ".git" and not entry.is_symlink():
+                        subdirs.append(entry.name)
+        except OSError:
+            pass
+        has_skill = kinds.get("SKILL.md") == "file"
+        node = _TreeNode(
+            path=path,
+            kinds=dict(sorted(kinds.items(), key=lambda kv: (kv[0].lower(), kv[0]))),
+            has_skill=has_skill,
+            under_skill=under_skill or has_skill,
+            in_submodule=in_submodule or (not is_top and ".git" in kinds),
+        )
+        count = int(has_skill)
+        for name in sorted(subdirs):
+            child = self._visit(
+                path / name, under_skill=node.under_skill, in_submodule=node.in_submodule, is_top=False
+            )
+            node.dirs[name] = child
+            count += child.skill_count
+        node.skill_count = count
+        return node
+
+    def node(self, path: Path) -> Optional[_TreeNode]:
+        try:
+            parts = path.relative_to(self.top).parts
+        except ValueError:
+            return None
+        node: Optional[_TreeNode] = self.root
+        for part in parts:
+            node = node.dirs.get(part) if node else None
+        return node
+
+    def iter_nodes(self) -> Iterator[_TreeNode]:
+        stack = [self.root]
+        while stack:
+            node = stack.pop()
+            yield node
+            stack.extend(reversed(list(node.dirs.values())))
+
+    def first_paragraph(self, path: Path) -> str:
+        if path not in self._paragraphs:
+            self._paragraphs[path] = _first_paragraph(path)
+        return self._paragraphs[path]
 
 
 def _is_allowed_readme(readme: Path, allowed_roots: list[str]) -> bool:
@@ -261,10 +598,7 @@ def _is_allowed_readme(readme: Path, allowed_roots: list[str]) -> bool:
     return False
 
 
-def _remove_readme_table(readme_path: Path) -> bool:
-    if not readme_path.is_file():
-        return False
-    original = readme_path.read_text(encoding="utf-8", errors="replace")
+def _without_table(original: str) -> str:
     lines = original.splitlines()
 
     drop_from: Optional[int] = None
@@ -273,19 +607,40 @@ def _remove_readme_table(readme_path: Path) -> bool:
             drop_from = i
             break
     if drop_from is None:
-        return False
+        return original
 
     lines = lines[:drop_from]
     while lines and lines[-1].strip() == "":
         lines.pop()
-    updated = "\n".join(lines + [""])
-    if updated != original:
-        readme_path.write_text(updated, encoding="utf-8")
-        return True
-    return False
+    return "\n".join(lines + [""])
 
 
-def _readme_table_for_dir(dir_path: Path) -> str:
+def _with_table(original: str, table: str) -> str:
+    lines = original.splitlines()
+
+    # Drop any existing table section (we enforce it at the end).
+    drop_from: Optional[int] = None
+    for i, line in enumerate(lines):
+        if line.strip() == "## <TABLE>":
+            drop_from = i
+            break
+    if drop_from is not None:
+        lines = lines[:drop_from]
+
+    while lines and lines[-1].strip() == "":
+        lines.pop()
+
+    new_block = [
+        "## <TABLE>",
+        "<!-- PKBLLM_TABLE_START -->",
+        table,
+        "<!-- PKBLLM_TABLE_END -->",
+        "",
+    ]
+    return "\n".join(lines + [""] + new_block)
+
+
+def _readme_table_for_dir(dir_path: Path, tree: Optional[_RepoTree] = None) -> str:
     rows: list[tuple[str, str, str]] = []
 
     if dir_path == ROOT:
@@ -302,42 +657,56 @@ def _readme_table_for_dir(dir_path: Path) -> str:
         ]
         rows.extend(candidates)
     else:
-        for child in sorted(dir_path.iterdir(), key=lambda p: p.name.lower()):
-            if child.name.startswith("."):
+        if tree is None or tree.node(dir_path) is None:
+            tree = _RepoTree(dir_path)
+        node = tree.node(dir_path)
+        assert node is not None
+        for child_name, kind in node.kinds.items():
+            if child_name.startswith("."):
                 continue
-            if child.name in {"__pycache__"}:
+            if child_name in {"__pycache__"}:
                 continue
 
-            rel = child.name + ("/" if child.is_dir() else "")
-
-            if child.is_dir() and (child / "SKILL.md").is_file():
-                name = _parse_frontmatter_name(child / "SKILL.md")
-                desc = _parse_frontmatter_description(child / "SKILL.md")
-                license_value = _parse_frontmatter_license(child / "SKILL.md")
+            child = dir_path / child_name
+            rel = child_name + ("/" if kind == "dir" else "")
+            child_node = node.dirs.get(child_name)
+            if kind == "dir" and child_node is None:
+                # Symlinked directory: not part of the scan, inspect it directly.
+                child_node = _RepoTree(child).root
+
+            if kind == "dir" and child_node.has_skill:
+                fm = read_frontmatter(child / "SKILL.md")
+                if fm is None:
+                    raise ValueError(f"SKILL.md missing frontmatter: {child / 'SKILL.md'}")
+                name = fm.get("name", "")
+                if not name:
+                    raise ValueError(f"SKILL.md missing name: {child / 'SKILL.md'}")
+                desc = fm.get("description", "")
+                license_value = fm.get("license", "")
                 if not _is_distributable_license(license_value):
                     continue
                 rows.append((rel, "skill", desc or name))
                 continue
 
-            if child.is_dir():
-                skill_count = _count_skills_under(child)
+            if kind == "dir":
+                skill_count = child_node.skill_count
+                has_readme = child_node.kinds.get("README.md") == "file"
+                desc = tree.first_paragraph(child / "README.md") if has_readme else ""
                 if skill_count:
-                    desc = _first_paragraph(child / "README.md") if (child / "README.md").is_file() else ""
                     tail = f"{skill_count} skill(s)"
                     rows.append((rel, "group", f"{desc} ({tail})".strip()))
                 else:
-                    desc = _first_paragraph(child / "README.md") if (child / "README.md").is_file() else ""
                     rows.append((rel, "dir", desc))
                 continue
 
-            if child.is_file() and child.name in {"README.md"}:
+            if kind == "file" and child_name in {"README.md"}:
                 continue
 
-            if child.is_file():
+            if kind == "file":
                 if child.suffix not in {".md", ".py", ".sh", ".json"}:
                     continue
                 if child.suffix == ".md":
-                    desc = _first_paragraph(child)
+                    desc = tree.first_paragraph(child)
                 elif child.suffix in {".py", ".sh"}:
                     desc = "Script"
                 else:
@@ -350,69 +719,349 @@ def _readme_table_for_dir(dir_path: Path) -> str:
     return header + ("\n" + body if body else "")
 
 
-def update_readme_table(readme_path: Path) -> bool:
-    if not readme_path.is_file():
-        return False
+def update_all_readmes(root: Path) -> int:
+    """
+    Refresh every README <TABLE> under `root` from a single scan of the tree.
 
-    # Never touch README.md that belongs to a skill directory.
-    if (readme_path.parent / "SKILL.md").is_file():
-        return False
+    Only READMEs whose rendered content changed are rewritten; returns how many were.
+    """
+    cfg = _load_config()
+    allowed_roots = _readme_table_roots(cfg)
+    tree = _RepoTree(root)
 
-    original = readme_path.read_text(encoding="utf-8", errors="replace")
-    lines = original.splitlines()
+    updated = 0
+    for node in tree.iter_nodes():
+        if _refresh_readme(node, tree, allowed_roots):
+            updated += 1
+    return updated
 
-    # Drop any existing table section (we enforce it at the end).
-    drop_from: Optional[int] = None
-    for i, line in enumerate(lines):
-        if line.strip() == "## <TABLE>":
-            drop_from = i
-            break
-    if drop_from is not None:
-        lines = lines[:drop_from]
 
-    while lines and lines[-1].strip() == "":
-        lines.pop()
+def _expected_readme(node: _TreeNode, tree: _RepoTree, allowed_roots: list[str]) -> Optional[tuple[str, str]]:
+    """(current, expected) text of the README in `node`, or None if it is not managed."""
+    if node.kinds.get("README.md") != "file":
+        return None
+    readme = node.path / "README.md"
+    if node.in_submodule:
+        return None
+    # Skip reference clones.
+    if ".references" in readme.parts:
+        return None
+    # Skip docs entirely.
+    if "docs" in readme.parts:
+        return None
+
+    original = readme.read_text(encoding="utf-8", errors="replace")
+    # Only maintain README tables in configured roots. Also never inject tables
+    # into README.md files inside a skill directory subtree.
+    if not _is_allowed_readme(readme, allowed_roots) or node.under_skill:
+        return original, _without_table(original)
+    return original, _with_table(original, _readme_table_for_dir(node.path, tree))
+
+
+def _refresh_readme(node: _TreeNode, tree: _RepoTree, allowed_roots: list[str]) -> bool:
+    expected = _expected_readme(node, tree, allowed_roots)
+    if expected is None or expected[0] == expected[1]:
+        return False
+    (node.path / "README.md").write_text(expected[1], encoding="utf-8")
+    return True
 
-    table = _readme_table_for_dir(readme_path.parent)
-    new_block = [
-        "## <TABLE>",
-        "<!-- PKBLLM_TABLE_START -->",
-        table,
-        "<!-- PKBLLM_TABLE_END -->",
-        "",
-    ]
-    updated = "\n".join(lines + [""] + new_block)
-    if updated != original:
-        readme_path.write_text(updated, encoding="utf-8")
-        return True
-    return False
 
+# --- watch mode -------------------------------------------------------------------
 
-def update_all_readmes(root: Path) -> int:
-    cfg = _load_config()
-    allowed_roots = _readme_table_roots(cfg)
+Snapshot = dict[str, tuple[int, int]]
 
-    updated = 0
-    for readme in sorted(root.rglob("README.md")):
-        if _has_git_submodule_ancestor(readme.parent):
+
+def _snapshot(roots: list[Path]) -> Snapshot:
+    """Stat every file and directory under `roots` (not following symlinks, skipping `.git`)."""
+    out: Snapshot = {}
+    stack = [str(r) for r in roots if r.is_dir()]
+    while stack:
+        current = stack.pop()
+        try:
+            it = os.scandir(current)
+        except OSError:
             continue
-        # Skip reference clones.
-        if ".references" in readme.parts:
+        with it:
+            for entry in it:
+                if entry.name == ".git":
+                    continue
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                        out[entry.path] = (0, -1)
+                        continue
+                    st = entry.stat(follow_symlinks=False)
+                except OSError:
+                    continue
+                out[entry.path] = (st.st_mtime_ns, st.st_size)
+    return out
+
+
+def _changed_paths(before: Snapshot, after: Snapshot) -> set[str]:
+    changed = before.keys() ^ after.keys()
+    changed.update(p for p, sig in after.items() if p in before and before[p] != sig)
+    return changed
+
+
+def _owning_skills(rel_path: str, skill_paths: set[str]) -> list[str]:
+    # Every skill directory that contains `rel_path` (nested skills are mirrored with
+    # their parent too).
+    parts = rel_path.split("/")
+    return [p for p in ("/".join(parts[:i]) for i in range(len(parts), 0, -1)) if p in skill_paths]
+
+
+def _load_manifest(skills_root: Path) -> dict[str, SkillManifestEntry]:
+    try:
+        data = json.loads((skills_root / "manifest.json").read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    return {e["canonical_path"]: e for e in data if isinstance(e, dict) and "canonical_path" in e}
+
+
+def _apply_changes(
+    changed: set[str],
+    previous: SkillCatalog,
+    *,
+    link_mode: str,
+    allowed_roots: list[str],
+) -> tuple[SkillCatalog, list[str], list[Path]]:
+    """
+    Bring the mirror, manifest and README tables up to date for `changed` paths only.
+
+    Returns the refreshed catalog, the slugs that were resynced or removed, and the
+    files this pass wrote under the watched roots.
+    """
+    skills_root = ROOT / "skills"
+    catalog = load_catalog(ROOT)
+    current = {e.path: e for e in catalog}
+    skill_paths = {e.path for e in previous} | set(current)
+
+    rel_changed = sorted(Path(p).relative_to(ROOT).as_posix() for p in changed)
+    affected = sorted({s for rel in rel_changed for s in _owning_skills(rel, skill_paths)})
+
+    manifest = _load_manifest(skills_root)
+    touched: list[str] = []
+    stats = _new_stats()
+    materializer = _Materializer(link_mode, stats)
+    for path in affected:
+        old = manifest.pop(path, None)
+        target: Optional[SkillManifestEntry] = None
+        entry = current.get(path)
+        if entry is not None:
+            try:
+                target = _manifest_entry(entry)
+            except (ValueError, SystemExit) as e:
+                print(f"[watch] ERROR: {e}", file=sys.stderr)
+        if target is not None:
+            clash = next((m for m in manifest.values() if m["slug"] == target["slug"]), None)
+            if clash is not None:
+                print(
+                    f"[watch] ERROR: slug collision: {target['slug']!r} from {path} and {clash['canonical_path']}",
+                    file=sys.stderr,
+                )
+                target = None
+        if old is not None and (target is None or old["slug"] != target["slug"]):
+            _rmtree(skills_root / old["slug"])
+            touched.append(old["slug"])
+        if target is not None:
+            _sync_skill_dir(ROOT / path, skills_root / target["slug"], stats, materializer)
+            target.update(digest_tree(skills_root / target["slug"]).manifest_fields())  # type: ignore[typeddict-item]
+            manifest[path] = target
+            touched.append(target["slug"])
+    if affected:
+        _write_if_changed(
+            skills_root / "manifest.json",
+            json.dumps(sorted(manifest.values(), key=lambda x: x["slug"]), indent=2, sort_keys=True) + "\n",
+        )
+
+    # README tables of every directory from the change up to its canonical root.
+    dirs: set[Path] = set()
+    for rel in rel_changed:
+        parts = rel.split("/")
+        dirs.update(ROOT.joinpath(*parts[:i]) for i in range(1, len(parts)))
+    written: list[Path] = []
+    trees: dict[str, _RepoTree] = {}
+    for d in sorted(dirs):
+        top = d.relative_to(ROOT).parts[0]
+        if top not in trees:
+            trees[top] = _RepoTree(ROOT / top)
+        node = trees[top].node(d)
+        if node is not None and _refresh_readme(node, trees[top], allowed_roots):
+            written.append(d / "README.md")
+    return catalog, touched, written
+
+
+def watch_mirror(
+    canonical_roots: list[Path],
+    *,
+    interval: float = 0.5,
+    debounce: float = 0.2,
+    link_mode: str = "copy",
+) -> int:
+    """
+    Poll `canonical_roots` and resync only what each burst of edits touched.
+
+    A burst ends once a poll `debounce` seconds after the last change sees no further
+    changes. Runs until interrupted.
+    """
+    roots = [r for r in canonical_roots if r.is_dir()]
+    allowed_roots = _readme_table_roots(_load_config())
+    build_skills_mirror(canonical_roots, link_mode=link_mode)
+    update_all_readmes(ROOT)
+    catalog = load_catalog(ROOT)
+    baseline = _snapshot(roots)
+    print(f"[watch] watching {', '.join(r.name for r in roots)} (Ctrl-C to stop)", file=sys.stderr)
+    try:
+        while True:
+            time.sleep(interval)
+            current = _snapshot(roots)
+            changed = _changed_paths(baseline, current)
+            if not changed:
+                continue
+            while True:
+                time.sleep(debounce)
+                later = _snapshot(roots)
+                more = _changed_paths(current, later)
+                if not more:
+                    break
+                changed |= more
+                current = later
+
+            start = time.perf_counter()
+            catalog, touched, written = _apply_changes(
+                changed, catalog, link_mode=link_mode, allowed_roots=allowed_roots
+            )
+            # Our own README writes must not trigger another pass.
+            for path in written:
+                try:
+                    st = path.stat()
+                except OSError:
+                    continue
+                current[str(path)] = (st.st_mtime_ns, st.st_size)
+            baseline = current
+            print(
+                f"[watch] {len(changed)} change(s): synced {', '.join(touched) or 'no skills'}; "
+                f"{len(written)} README table(s) updated ({(time.perf_counter() - start) * 1000:.1f} ms)",
+                file=sys.stderr,
+            )
+    except KeyboardInterrupt:
+        return 0
+
+# --- check mode -------------------------------------------------------------------
+
+_MAX_DIFF_LINES = 12
+
+
+def _quick_same(src: Path, dst: Path) -> bool:
+    # rsync-style quick check: mirror files share the canonical inode or keep its
+    # mtime (copy2/copystat), so only hash when the stat signature differs.
+    try:
+        s_st = src.stat()
+        d_st = dst.stat()
+    except OSError:
+        return False
+    if s_st.st_size != d_st.st_size:
+        return False
+    if (s_st.st_ino, s_st.st_dev) == (d_st.st_ino, d_st.st_dev) or s_st.st_mtime_ns == d_st.st_mtime_ns:
+        return True
+    return _file_digest(src) == _file_digest(dst)
+
+
+def _check_manifest_entry(target: SkillManifestEntry, recorded: SkillManifestEntry, src_files: dict[str, Path], skill_sha: str) -> list[str]:
+    where = f"skills/manifest.json [{target['slug']}]"
+    problems = [
+        f"{where}: stale {key}"
+        for key in ("name", "slug", "description")
+        if recorded.get(key) != target[key]  # type: ignore[literal-required]
+    ]
+    files = recorded.get("files")
+    if not isinstance(files, dict):
+        return problems + [f"{where}: no file digests"]
+    if files.keys() != src_files.keys():
+        return problems + [f"{where}: file list differs from {target['canonical_path']}"]
+    sizes = {rel: path.stat().st_size for rel, path in src_files.items()}
+    if any(files[rel].get("size") != size for rel, size in sizes.items()):
+        problems.append(f"{where}: stale file sizes")
+    elif files.get("SKILL.md", {}).get("sha256") != skill_sha:
+        problems.append(f"{where}: stale SKILL.md digest")
+    if recorded.get("bytes") != sum(sizes.values()) or recorded.get("tree_sha256") != tree_sha256(files):
+        problems.append(f"{where}: stale totals")
+    return problems
+
+
+def check_mirror(canonical_roots: list[Path]) -> list[str]:
+    """Compare `skills/` and its manifest against the canonical skills without writing."""
+    skills_root = ROOT / "skills"
+    catalog = load_catalog(ROOT)
+    problems: list[str] = []
+    expected: list[tuple[CatalogEntry, SkillManifestEntry]] = []
+    seen_slugs: dict[str, str] = {}
+    for canonical_root in canonical_roots:
+        if not canonical_root.exists():
             continue
-        # Skip docs entirely.
-        if "docs" in readme.parts:
+        for entry in catalog.under(canonical_root):
+            try:
+                target = _manifest_entry(entry)
+            except (ValueError, SystemExit) as e:
+                problems.append(f"{entry.path}: {e}")
+                continue
+            if target is None:
+                continue
+            if target["slug"] in seen_slugs:
+                problems.append(f"{entry.path}: slug collision with {seen_slugs[target['slug']]}")
+                continue
+            seen_slugs[target["slug"]] = entry.path
+            expected.append((entry, target))
+
+    manifest = _load_manifest(skills_root)
+    for entry, target in expected:
+        slug = target["slug"]
+        dst = skills_root / slug
+        if not dst.is_dir():
+            problems.append(f"skills/{slug}/: missing")
             continue
-
-        # Only maintain README tables in configured roots. Also never inject tables
-        # into README.md files inside a skill directory subtree.
-        if not _is_allowed_readme(readme, allowed_roots) or _has_skill_ancestor(readme.parent):
-            if _remove_readme_table(readme):
-                updated += 1
+        src_files, src_dirs = _tree_listing(entry.skill_dir(ROOT))
+        dst_files, dst_dirs = _tree_listing(dst)
+        problems.extend(f"skills/{slug}/{rel}: missing" for rel in sorted(src_files.keys() - dst_files.keys()))
+        problems.extend(f"skills/{slug}/{rel}: unexpected" for rel in sorted(dst_files.keys() - src_files.keys()))
+        problems.extend(f"skills/{slug}/{rel}/: directory differs" for rel in sorted(src_dirs ^ dst_dirs))
+        problems.extend(
+            f"skills/{slug}/{rel}: differs"
+            for rel in sorted(src_files.keys() & dst_files.keys())
+            if not _quick_same(src_files[rel], dst_files[rel])
+        )
+        recorded = manifest.pop(target["canonical_path"], None)
+        if recorded is None:
+            problems.append(f"skills/manifest.json: missing entry for {slug}")
+        else:
+            problems.extend(_check_manifest_entry(target, recorded, src_files, entry.sha256))
+    problems.extend(f"skills/manifest.json: unexpected entry for {m.get('slug')}" for m in manifest.values())
+
+    expected_slugs = {target["slug"] for _, target in expected}
+    for child in sorted(skills_root.iterdir()) if skills_root.is_dir() else []:
+        if child.name not in {"README.md", "manifest.json"} and child.name not in expected_slugs:
+            problems.append(f"skills/{child.name}: unexpected")
+    return problems
+
+
+def check_readmes(root: Path) -> list[str]:
+    """Compact diffs for README tables that `update-readmes` would rewrite."""
+    allowed_roots = _readme_table_roots(_load_config())
+    tree = _RepoTree(root)
+    problems: list[str] = []
+    for node in tree.iter_nodes():
+        expected = _expected_readme(node, tree, allowed_roots)
+        if expected is None or expected[0] == expected[1]:
             continue
-
-        if update_readme_table(readme):
-            updated += 1
-    return updated
+        rel = (node.path / "README.md").relative_to(root).as_posix()
+        diff = [
+            line
+            for line in difflib.unified_diff(expected[0].splitlines(), expected[1].splitlines(), lineterm="", n=0)
+            if not line.startswith(("---", "+++", "@@"))
+        ]
+        more = f"\n    ... {len(diff) - _MAX_DIFF_LINES} more line(s)" if len(diff) > _MAX_DIFF_LINES else ""
+        problems.append(f"{rel}: table out of date\n" + "\n".join(f"    {line}" for line in diff[:_MAX_DIFF_LINES]) + more)
+    return problems
 
 
 def main(argv: Optional[list[str]] = None) -> int:
@@ -423,12 +1072,61 @@ def main(argv: Optional[list[str]] = None) -> int:
         "command",
         nargs="?",
         default="all",
-        choices=["all", "build-mirror", "update-readmes"],
+        choices=["all", "build-mirror", "update-readmes", "watch", "check", "pack"],
         help="What to do.",
     )
     parser.add_argument("--no-mirror", action="store_true", help="Skip regenerating `skills/`.")
     parser.add_argument("--no-readmes", action="store_true", help="Skip updating README tables.")
+    parser.add_argument(
+        "--full-rebuild",
+        action="store_true",
+        help="Wipe and recopy every mirrored skill instead of syncing only changed ones.",
+    )
+    parser.add_argument(
+        "--link-mode",
+        choices=LINK_MODES,
+        default="copy",
+        help=(
+            "How mirror files are materialized: copy (default), hardlink (share inodes with canonical "
+            "files; never edit skills/ in place), reflink (copy-on-write clone), or auto "
+            "(reflink, then hardlink, then copy)."
+        ),
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=default_jobs(),
+        help="Number of skills synced concurrently (default: %(default)s).",
+    )
+    parser.add_argument(
+        "--timings",
+        type=int,
+        nargs="?",
+        const=10,
+        default=0,
+        metavar="N",
+        help="Print the N slowest per-skill sync times (default N: 10).",
+    )
+    parser.add_argument(
+        "--interval",
+        type=float,
+        default=0.5,
+        help="watch: seconds between polls of the canonical roots (default: %(default)s).",
+    )
+    parser.add_argument(
+        "--debounce",
+        type=float,
+        default=0.2,
+        help="watch: quiet period that ends a burst of edits (default: %(default)s).",
+    )
+    parser.add_argument(
+        "--output",
+        default=str(default_bundle_path(ROOT)),
+        help="pack: bundle path (default: %(default)s).",
+    )
     args = parser.parse_args(argv)
+    if args.jobs < 1:
+        parser.error("--jobs must be >= 1")
 
     canonical_roots = [
         ROOT / "common",
@@ -438,8 +1136,48 @@ def main(argv: Optional[list[str]] = None) -> int:
         ROOT / "bootstrap",
     ]
 
+    if args.command == "check":
+        start = time.perf_counter()
+        problems: list[str] = []
+        if not args.no_mirror:
+            problems.extend(check_mirror(canonical_roots))
+        if not args.no_readmes:
+            problems.extend(check_readmes(ROOT))
+        for problem in problems:
+            print(problem)
+        elapsed = (time.perf_counter() - start) * 1000
+        if problems:
+            print(
+                f"check: {len(problems)} problem(s) ({elapsed:.0f} ms); run `python bootstrap/scripts/update_skills_mirror.py all`.",
+                file=sys.stderr,
+            )
+            return 1
+        print(f"check: mirror and README tables are up to date ({elapsed:.0f} ms)", file=sys.stderr)
+        return 0
+
+    if args.command == "pack":
+        if not args.no_mirror:
+            build_skills_mirror(
+                canonical_roots, link_mode=args.link_mode, jobs_count=args.jobs, timings=args.timings
+            )
+        out_path = Path(args.output).expanduser()
+        count = write_bundle(ROOT / "skills", out_path)
+        print(f"Bundle: {count} files, {_format_bytes(out_path.stat().st_size)} -> {out_path}", file=sys.stderr)
+        return 0
+
+    if args.command == "watch":
+        return watch_mirror(
+            canonical_roots, interval=args.interval, debounce=args.debounce, link_mode=args.link_mode
+        )
+
     if args.command in ("all", "build-mirror") and not args.no_mirror:
-        build_skills_mirror(canonical_roots)
+        build_skills_mirror(
+            canonical_roots,
+            full_rebuild=args.full_rebuild,
+            link_mode=args.link_mode,
+            jobs_count=args.jobs,
+            timings=args.timings,
+        )
 
     if args.command in ("all", "update-readmes") and not args.no_readmes:
         update_all_readmes(ROOT)
@@ -6,7 +6,7 @@ import argparse
 from pathlib import Path
 
 from evolution_lib import EVOLUTION_FILENAME, EvolutionError, stitch_skill_md
-from skill_locator import CANONICAL_ROOTS, infer_pkb_path, iter_skill_dirs_under
+from skill_locator import infer_pkb_path, iter_canonical_skill_dirs, iter_skill_dirs_under
 
 
 def _stitch_if_present(skill_dir: Path) -> bool:
@@ -48,14 +48,12 @@ def main() -> int:
     if args.scope in ("pkb", "both"):
         try:
             pkb_path = infer_pkb_path(args.pkb_path)
-            for rel in CANONICAL_ROOTS:
-                root = pkb_path / rel
-                for d in iter_skill_dirs_under(root):
-                    try:
-                        if _stitch_if_present(d):
-                            stitched += 1
-                    except EvolutionError as e:
-                        failures.append(f"pkb: {d}: {e}")
+            for d in iter_canonical_skill_dirs(pkb_path):
+                try:
+                    if _stitch_if_present(d):
+                        stitched += 1
+                except EvolutionError as e:
+                    failures.append(f"pkb: {d}: {e}")
         except EvolutionError as e:
             failures.append(f"pkb: {e}")
 
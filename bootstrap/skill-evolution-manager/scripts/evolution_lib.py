@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import json
 import re
+import sys
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
@@ -50,16 +51,47 @@ def _dedupe_preserve_order(items: Iterable[str]) -> list[str]:
     return out
 
 
+def _read_frontmatter_fallback(skill_md: Path) -> Optional[dict[str, str]]:
+    with skill_md.open("r", encoding="utf-8", errors="replace") as f:
+        if f.readline().strip() != "---":
+            return None
+        out: dict[str, str] = {}
+        for _, line in zip(range(250), f):
+            if line.strip() == "---":
+                break
+            if ":" in line and not line[:1].isspace():
+                key, value = line.split(":", 1)
+                out.setdefault(key.strip(), value.strip().strip("'\""))
+        return out
+
+
+def _shared_frontmatter_reader():
+    # Prefer the repo-wide reader when running from a pkbllm checkout (canonical
+    # `bootstrap/...` or the `skills/` mirror); installed copies use the fallback.
+    scripts_dir = Path(__file__).resolve().parents[3] / "bootstrap" / "scripts"
+    if (scripts_dir / "skill_frontmatter.py").is_file():
+        if str(scripts_dir) not in sys.path:
+            sys.path.append(str(scripts_dir))
+        try:
+            from skill_frontmatter import read_frontmatter
+
+            return read_frontmatter
+        except ImportError:
+            pass
+    return _read_frontmatter_fallback
+
+
+_read_frontmatter = _shared_frontmatter_reader()
+
+
 def parse_frontmatter_name(skill_md: Path) -> str:
-    lines = skill_md.read_text(encoding="utf-8", errors="replace").splitlines()
-    if not lines or lines[0].strip() != "---":
+    fm = _read_frontmatter(skill_md)
+    if fm is None:
         raise EvolutionError(f"SKILL.md missing frontmatter: {skill_md}")
-    for line in lines[1:200]:
-        if line.strip() == "---":
-            break
-        if line.startswith("name:"):
-            return line.split(":", 1)[1].strip().strip("'\"")
-    raise EvolutionError(f"SKILL.md missing frontmatter name: {skill_md}")
+    name = fm.get("name")
+    if not name:
+        raise EvolutionError(f"SKILL.md missing frontmatter name: {skill_md}")
+    return name
 
 
 def load_json_from_arg(json_arg: Optional[str], json_path: Optional[Path]) -> dict[str, Any]:
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Iterable, Optional
@@ -28,7 +29,31 @@ def iter_skill_dirs_under(root: Path) -> Iterable[Path]:
         yield parent
 
 
+def _load_pkb_catalog(pkb_path: Path):
+    """
+    Use the PKB_PATH skill catalog index when this skill runs against a full pkbllm checkout.
+    Installed copies of this skill fall back to walking the canonical roots.
+    """
+    scripts_dir = pkb_path / "bootstrap" / "scripts"
+    if not (scripts_dir / "skill_catalog.py").is_file():
+        return None
+    if str(scripts_dir) not in sys.path:
+        sys.path.insert(0, str(scripts_dir))
+    try:
+        from skill_catalog import load_catalog
+    except ImportError:
+        return None
+    return load_catalog(pkb_path)
+
+
 def locate_canonical_skill(pkb_path: Path, skill_name: str) -> Optional[LocatedSkill]:
+    catalog = _load_pkb_catalog(pkb_path)
+    if catalog is not None:
+        entry = catalog.by_name(skill_name)
+        if entry is None:
+            return None
+        return LocatedSkill(root=pkb_path / entry.path.split("/", 1)[0], skill_dir=entry.skill_dir(pkb_path))
+
     for rel in CANONICAL_ROOTS:
         root = pkb_path / rel
         for d in iter_skill_dirs_under(root):
@@ -41,6 +66,16 @@ def locate_canonical_skill(pkb_path: Path, skill_name: str) -> Optional[LocatedS
     return None
 
 
+def iter_canonical_skill_dirs(pkb_path: Path) -> Iterable[Path]:
+    catalog = _load_pkb_catalog(pkb_path)
+    if catalog is not None:
+        for entry in catalog:
+            yield entry.skill_dir(pkb_path)
+        return
+    for rel in CANONICAL_ROOTS:
+        yield from iter_skill_dirs_under(pkb_path / rel)
+
+
 def _project_local_roots(project_root: Path) -> list[Path]:
     return [
         project_root / ".agent" / "skills",
@@ -0,0 +1,3 @@
+def solve(*args, **kwargs):
+    raise NotImplementedError("Your implementation goes here")
+
@@ -0,0 +1,3 @@
+def solve(*args, **kwargs):
+    raise NotImplementedError("Golden solution (fill this in when authoring the exercise)")
+
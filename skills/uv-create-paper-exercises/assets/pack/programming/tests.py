@@ -0,0 +1,13 @@
+import unittest
+
+class TestExercise(unittest.TestCase):
+    def test_examples(self):
+        # Replace with real examples.
+        import my_solution
+
+        with self.assertRaises(NotImplementedError):
+            my_solution.solve(1)
+
+
+if __name__ == "__main__":
+    unittest.main()